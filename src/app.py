@@ -11,6 +11,10 @@ from src.middleware.logging_middleware import setup_logging
 from src.common.db import DatabaseAPI
 from src.common.s3 import S3API
 from src.common.notify_manager import NotifyManager
+from src.common.membership_cache import MembershipCache
+
+from src.services.chats.repos import ChatsRepository, ChatMembersRepository
+from src.services.users.repos import AccountsRepository, TokensRepository
 
 from src.handlers import register_handlers
 from src.htcp.aio_server import AsyncServer
@@ -31,6 +35,14 @@ class Application:
         self.db: DatabaseAPI = DatabaseAPI()
         self.s3: S3API = S3API()
 
+        # Repositories are stateless, so one instance each is shared app-wide
+        self.chats_repo: ChatsRepository = ChatsRepository(self)
+        self.chat_members_repo: ChatMembersRepository = ChatMembersRepository(self)
+        self.accounts_repo: AccountsRepository = AccountsRepository(self)
+        self.tokens_repo: TokensRepository = TokensRepository(self)
+
+        self.membership: MembershipCache = MembershipCache(self)
+
         self.notify_man: NotifyManager = NotifyManager(self)
 
         self.server: Optional[AsyncServer] = None
@@ -51,12 +63,16 @@ class Application:
 
         await self.s3.safely_connect()
 
+        self.notify_man.start()
+
         self.logger.info("Application startup complete")
 
     async def shutdown(self) -> None:
         """Shutdown routine: disconnect from services."""
         self.logger.info("Shutting down application:")
 
+        await self.notify_man.stop()
+
         if self.db.pool:
             await self.db.disconnect()
 
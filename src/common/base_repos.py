@@ -7,7 +7,16 @@ from typing import TYPE_CHECKING, Optional, Any
 if TYPE_CHECKING:
     from src.app import Application
 
-from src.config import settings
+from src.config import LOGGING_LEVEL
+
+
+def _repository_logger(repository_name: str) -> logging.Logger:
+    """Get repository logger, set up once per repository class"""
+
+    logger = logging.getLogger(f"{repository_name}-repo")
+    logger.setLevel(LOGGING_LEVEL)
+
+    return logger
 
 
 class BaseDBRepository:
@@ -16,21 +25,27 @@ class BaseDBRepository:
     repository_name = "base"
     table_name = None
     schema_name = "msgr_schema"
+    logger = _repository_logger(repository_name)
+    _full_table_name = None
 
-    def __init__(self, app: "Application"):
-        self.logger = logging.getLogger(f"{self.repository_name}-repo")
-        self.logger.setLevel(settings.logging_level)
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.logger = _repository_logger(cls.repository_name)
 
+        if cls.table_name:
+            cls._full_table_name = f"{cls.schema_name}.{cls.table_name}"
+
+    def __init__(self, app: "Application"):
         self.app = app
         self.db = self.app.db
 
     def _get_table_name(self) -> str:
         """Get full table name with schema"""
 
-        if not self.table_name:
+        if not self._full_table_name:
             raise ValueError(f"table_name not set for {self.__class__.__name__}")
 
-        return f"{self.schema_name}.{self.table_name}"
+        return self._full_table_name
 
     async def execute(self, query: str, *args, conn=None) -> str:
         """Execute query without returning data"""
@@ -70,11 +85,13 @@ class BaseS3Repository:
 
     repository_name = "base"
     resources_dir = ""
+    logger = _repository_logger(repository_name)
 
-    def __init__(self, app: "Application"):
-        self.logger = logging.getLogger(f"{self.repository_name}-repo")
-        self.logger.setLevel(settings.logging_level)
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.logger = _repository_logger(cls.repository_name)
 
+    def __init__(self, app: "Application"):
         self.app = app
         self.s3 = self.app.s3
 
@@ -34,7 +34,8 @@ class DatabaseAPI:
             password=settings.psql_password,
             database=settings.psql_db,
             min_size=settings.psql_pool_min_size,
-            max_size=settings.psql_pool_max_size
+            max_size=settings.psql_pool_max_size,
+            statement_cache_size=settings.psql_statement_cache_size
         )
 
     async def safely_connect(self) -> None:
@@ -47,16 +48,11 @@ class DatabaseAPI:
         try:
             await self.connect()
 
-            db_status = await self.ping()
-
-            if db_status:
-                self.logger.info("PostgreSQL connected successfully")
-            else:
-                raise RuntimeError("PostgreSQL ping failed")
-
-            # Check schema version
+            # Schema version check is the first query, so it doubles as the ping
             await self._check_schema_version()
 
+            self.logger.info("PostgreSQL connected successfully")
+
         except asyncpg.InvalidPasswordError:
             self.logger.critical("PostgreSQL authentication failed")
 
@@ -110,8 +106,7 @@ class DatabaseAPI:
         """Check database connectivity."""
 
         try:
-            async with self.pool.acquire() as conn:
-                await conn.fetchval("SELECT 1")
+            await self.pool.fetchval("SELECT 1")
             return True
 
         except Exception:
@@ -142,8 +137,7 @@ class DatabaseAPI:
             Status string (e.g., "INSERT 0 1")
         """
 
-        async with self.pool.acquire() as conn:
-            return await conn.execute(query, *args)
+        return await self.pool.execute(query, *args)
 
     async def fetchrow(self, query: str, *args) -> Optional[asyncpg.Record]:
         """
@@ -157,8 +151,7 @@ class DatabaseAPI:
             Single row as Record or None
         """
 
-        async with self.pool.acquire() as conn:
-            return await conn.fetchrow(query, *args)
+        return await self.pool.fetchrow(query, *args)
 
     async def fetch(self, query: str, *args) -> List[asyncpg.Record]:
         """
@@ -172,8 +165,7 @@ class DatabaseAPI:
             List of Records
         """
 
-        async with self.pool.acquire() as conn:
-            return await conn.fetch(query, *args)
+        return await self.pool.fetch(query, *args)
 
     async def fetchval(self, query: str, *args, column: int = 0) -> Any:
         """
@@ -188,8 +180,7 @@ class DatabaseAPI:
             Single value
         """
 
-        async with self.pool.acquire() as conn:
-            return await conn.fetchval(query, *args, column=column)
+        return await self.pool.fetchval(query, *args, column=column)
 
     async def executemany(self, query: str, args_list: List[tuple]) -> None:
         """
@@ -200,8 +191,7 @@ class DatabaseAPI:
             args_list: List of parameter tuples
         """
 
-        async with self.pool.acquire() as conn:
-            await conn.executemany(query, args_list)
+        await self.pool.executemany(query, args_list)
 
     async def execute_script(self, script: str) -> None:
         """
@@ -0,0 +1,49 @@
+"""In-memory cache of users' chat memberships."""
+
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from src.app import Application
+
+
+class MembershipCache:
+    """Caches each user's chat IDs, loaded with one query on first use."""
+
+    max_users = 10000
+
+    def __init__(self, app: "Application"):
+        """Initialize cache with application."""
+
+        self.app = app
+
+        # user_id -> IDs of chats the user is a member of
+        self._chat_ids: dict[int, frozenset[int]] = {}
+
+        # Bumped on every invalidation, so a load racing with a change isn't stored
+        self._generation = 0
+
+    async def is_member(self, chat_id: int, user_id: int) -> bool:
+        """Check if user is member of chat, querying the database only on a cache miss."""
+
+        chat_ids = self._chat_ids.get(user_id)
+
+        if chat_ids is None:
+            generation = self._generation
+            chat_ids = frozenset(await self.app.chat_members_repo.get_chat_ids_by_user(user_id))
+
+            if generation == self._generation:
+                if len(self._chat_ids) >= self.max_users:
+                    # Evict the oldest loaded user
+                    del self._chat_ids[next(iter(self._chat_ids))]
+
+                self._chat_ids[user_id] = chat_ids
+
+        return chat_id in chat_ids
+
+    def forget(self, user_ids: Iterable[int]) -> None:
+        """Drop cached memberships of users whose chats changed."""
+
+        self._generation += 1
+
+        for user_id in user_ids:
+            self._chat_ids.pop(user_id, None)
@@ -1,17 +1,17 @@
 """NotifyManager for handling subscriptions and event broadcasting."""
 
+import time
 import asyncio
 import logging
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, AsyncGenerator
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Iterable
 
 if TYPE_CHECKING:
     from src.app import Application
 
-from src.services.chats.repos import ChatMembersRepository
-
-from src.config import settings
+from src.config import LOGGING_LEVEL, NOTIFY_QUEUE_MAX
 
 
 @dataclass
@@ -22,54 +22,123 @@ class Event:
     data: dict[str, Any]
 
 
+@dataclass
+class ChatNotification:
+    """Chat event waiting in the outbox to be fanned out to members."""
+
+    chat_id: int
+    event: Event
+    exclude_user_id: int | None = None
+    extra_user_ids: tuple[int, ...] = ()
+
+
 class NotifyManager:
     """Manages user subscriptions and event broadcasting."""
 
+    # Typing events repeated within this window are dropped
+    typing_interval = 1.5
+    typing_tracked_max = 4096
+
+    # Most events handed to a subscriber in one batch
+    notify_batch_max = 32
+
+    # Seconds stop() waits for queued chat events to be fanned out
+    stop_drain_timeout = 5.0
+
     def __init__(self, app: "Application"):
         """Initialize NotifyManager."""
 
         self.app = app
         self.logger = logging.getLogger("notify-manager")
-        self.logger.setLevel(settings.logging_level)
+        self.logger.setLevel(LOGGING_LEVEL)
 
-        # user_id -> {token -> queue}
-        self._subscriptions: dict[int, dict[str, asyncio.Queue[Event]]] = {}
+        # user_id -> {token -> queue}; a None in a queue ends that subscription
+        self._subscriptions: dict[int, dict[str, asyncio.Queue[Event | None]]] = {}
         self._lock = asyncio.Lock()
 
-    async def subscribe(self, token: str) -> AsyncGenerator[Event, None]:
+        # Chat events are fanned out in batches by a background task, off the reply path
+        self._outbox: asyncio.Queue[ChatNotification] = asyncio.Queue()
+        self._outbox_task: asyncio.Task | None = None
+
+        # (chat_id, user_id) -> monotonic time of the last typing event sent
+        self._typing_sent: OrderedDict[tuple[int, int], float] = OrderedDict()
+
+    def start(self) -> None:
+        """Start the background task fanning out chat events."""
+
+        if self._outbox_task is None:
+            self._outbox_task = asyncio.create_task(self._run_outbox())
+
+    async def stop(self) -> None:
+        """Stop the background fan-out task after delivering queued chat events."""
+
+        if self._outbox_task is not None:
+            try:
+                await asyncio.wait_for(self._outbox.join(), timeout=self.stop_drain_timeout)
+            except asyncio.TimeoutError:
+                self.logger.warning(f"Dropping {self._outbox.qsize()} undelivered chat events on shutdown")
+
+            self._outbox_task.cancel()
+
+            try:
+                await self._outbox_task
+            except asyncio.CancelledError:
+                pass
+
+            self._outbox_task = None
+
+    async def subscribe(self, token: str) -> AsyncGenerator[list[Event], None]:
         """
-        Subscribe user by token. Returns async generator yielding events.
+        Subscribe user by token. Returns async generator yielding batches of events.
 
         Used as HTCP subscription handler.
         """
 
-        from src.services.users.repos import TokensRepository
-
-        tokens_repo = TokensRepository(self.app)
-        token_db = await tokens_repo.get_by_token(token)
+        token_db = await self.app.tokens_repo.get_by_token(token)
 
         if not token_db:
             self.logger.warning(f"Subscribe attempt with invalid token")
             return
 
         user_id = token_db.user_id
-        queue: asyncio.Queue[Event] = asyncio.Queue()
+        queue: asyncio.Queue[Event | None] = asyncio.Queue(maxsize=NOTIFY_QUEUE_MAX)
 
         # Register subscription
         async with self._lock:
-            if user_id not in self._subscriptions:
+            came_online = user_id not in self._subscriptions
+            if came_online:
                 self._subscriptions[user_id] = {}
-                # First subscription for this user - notify user_online
-                await self._broadcast_user_online(user_id)
 
             self._subscriptions[user_id][token] = queue
 
+        if came_online:
+            # First subscription for this user - notify user_online, outside
+            # the lock so other subscribes don't wait for its queries
+            await self._broadcast_user_online(user_id)
+
         self.logger.info(f"User {user_id} subscribed with token {token[:8]}...")
 
         try:
             while True:
                 event = await queue.get()
-                yield event
+                if event is None:
+                    break
+
+                # Take whatever else is already queued, without waiting for more
+                events = [event]
+                ended = False
+
+                while not queue.empty() and len(events) < self.notify_batch_max:
+                    event = queue.get_nowait()
+                    if event is None:
+                        ended = True
+                        break
+                    events.append(event)
+
+                yield events
+
+                if ended:
+                    break
 
         except asyncio.CancelledError:
             pass
@@ -80,8 +149,6 @@ class NotifyManager:
     async def _unsubscribe(self, user_id: int, token: str) -> None:
         """Unsubscribe user's token and handle cleanup."""
 
-        from src.services.users.repos import AccountsRepository
-
         went_offline = False
 
         async with self._lock:
@@ -95,8 +162,7 @@ class NotifyManager:
 
         if went_offline:
             # Update last_online_at
-            accounts_repo = AccountsRepository(self.app)
-            await accounts_repo.update_last_online(user_id)
+            await self.app.accounts_repo.update_last_online(user_id)
 
             # Notify user_offline
             await self._broadcast_user_offline(user_id)
@@ -123,79 +189,121 @@ class NotifyManager:
     async def notify_user(self, user_id: int, event: Event) -> None:
         """Send event to all user's devices."""
 
-        async with self._lock:
-            if user_id not in self._subscriptions:
-                return
+        self._dispatch((user_id,), event)
 
-            for queue in self._subscriptions[user_id].values():
-                await queue.put(event)
-
-    async def notify_users(self, user_ids: list[int], event: Event) -> None:
+    async def notify_users(self, user_ids: Iterable[int], event: Event) -> None:
         """Send event to multiple users."""
 
-        for user_id in user_ids:
-            await self.notify_user(user_id, event)
+        self._dispatch(user_ids, event)
+
+    def _dispatch(self, user_ids: Iterable[int], event: Event) -> None:
+        """Queue one event for every subscription of the given users."""
+
+        # Snapshot the target queues in one pass, then deliver without awaiting,
+        # so no subscribe/unsubscribe can interleave; _lock isn't needed here
+        subscriptions = self._subscriptions
+        targets = [
+            (user_id, queue)
+            for user_id in user_ids
+            for queue in subscriptions.get(user_id, {}).values()
+        ]
+
+        for user_id, queue in targets:
+            self._deliver(user_id, queue, event)
+
+    def _deliver(self, user_id: int, queue: asyncio.Queue[Event | None], event: Event) -> None:
+        """Queue event for one subscription, ending it if the client can't keep up."""
+
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Producers are never back-pressured: drop the backlog and end the
+            # subscription so the client re-subscribes and resyncs
+            self.logger.warning(f"Subscription queue of user {user_id} is full, dropping subscription")
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(None)
 
     async def notify_chat(self, chat_id: int, event: Event, exclude_user_id: int | None = None) -> None:
         """Send event to all members of a chat."""
 
-        members_repo = ChatMembersRepository(self.app)
-        member_ids = await members_repo.get_member_user_ids(chat_id)
+        member_ids = await self.app.chat_members_repo.get_member_user_ids(chat_id)
+
+        if exclude_user_id:
+            member_ids = [user_id for user_id in member_ids if user_id != exclude_user_id]
+
+        await self.notify_users(member_ids, event)
+
+    def _enqueue(self, notification: ChatNotification) -> None:
+        """Queue chat event for background fan-out without waiting for it."""
+
+        self._outbox.put_nowait(notification)
+
+    async def _run_outbox(self) -> None:
+        """Fan out queued chat events, taking everything queued so far as one batch."""
 
-        for user_id in member_ids:
-            if exclude_user_id and user_id == exclude_user_id:
-                continue
-            await self.notify_user(user_id, event)
+        while True:
+            batch = [await self._outbox.get()]
+            while not self._outbox.empty():
+                batch.append(self._outbox.get_nowait())
+
+            try:
+                await self._fan_out(batch)
+            except Exception as e:
+                self.logger.error(f"Failed to fan out {len(batch)} chat events: {e}")
+            finally:
+                # Lets stop() wait for the outbox to drain
+                for _ in batch:
+                    self._outbox.task_done()
+
+    async def _fan_out(self, batch: list[ChatNotification]) -> None:
+        """Deliver a batch of chat events, resolving all chats' members in one query."""
+
+        members = await self.app.chat_members_repo.get_member_user_ids_by_chats(
+            list({notification.chat_id for notification in batch})
+        )
+
+        # Deliver in queue order so per-chat event order is kept
+        for notification in batch:
+            member_ids = members.get(notification.chat_id, [])
+
+            if notification.exclude_user_id:
+                member_ids = [user_id for user_id in member_ids if user_id != notification.exclude_user_id]
+
+            self._dispatch(member_ids, notification.event)
+            self._dispatch(notification.extra_user_ids, notification.event)
 
     # Event builders
 
     async def _broadcast_user_online(self, user_id: int) -> None:
         """Broadcast user_online event to relevant users."""
 
-        from src.services.chats.repos import ChatsRepository
-
-        chats_repo = ChatsRepository(self.app)
-        chats = await chats_repo.get_chats_by_user(user_id)
+        chats = await self.app.chats_repo.get_chats_by_user(user_id)
 
         event = Event(type="user_online", data={"user_id": user_id})
 
         # Notify all users who share chats with this user
-        notified: set[int] = set()
-        for chat in chats:
-            from src.services.chats.repos import ChatMembersRepository
-            members_repo = ChatMembersRepository(self.app)
-            member_ids = await members_repo.get_member_user_ids(chat.id)
+        member_ids = await self.app.chat_members_repo.get_member_user_ids_for_chats([chat.id for chat in chats])
+        member_ids.discard(user_id)
 
-            for member_id in member_ids:
-                if member_id != user_id and member_id not in notified:
-                    await self.notify_user(member_id, event)
-                    notified.add(member_id)
+        await self.notify_users(member_ids, event)
 
     async def _broadcast_user_offline(self, user_id: int) -> None:
         """Broadcast user_offline event to relevant users."""
 
-        from src.services.chats.repos import ChatsRepository
-
-        chats_repo = ChatsRepository(self.app)
-        chats = await chats_repo.get_chats_by_user(user_id)
+        chats = await self.app.chats_repo.get_chats_by_user(user_id)
 
         event = Event(type="user_offline", data={"user_id": user_id})
 
         # Notify all users who share chats with this user
-        notified: set[int] = set()
-        for chat in chats:
-            from src.services.chats.repos import ChatMembersRepository
-            members_repo = ChatMembersRepository(self.app)
-            member_ids = await members_repo.get_member_user_ids(chat.id)
+        member_ids = await self.app.chat_members_repo.get_member_user_ids_for_chats([chat.id for chat in chats])
+        member_ids.discard(user_id)
 
-            for member_id in member_ids:
-                if member_id != user_id and member_id not in notified:
-                    await self.notify_user(member_id, event)
-                    notified.add(member_id)
+        await self.notify_users(member_ids, event)
 
     # Public event senders
 
-    async def send_new_message(
+    def send_new_message(
         self,
         chat_id: int,
         sender_user_id: int,
@@ -217,70 +325,80 @@ class NotifyManager:
                 "message_content": message_preview[:61]
             }
         )
-        await self.notify_chat(chat_id, event)
+        self._enqueue(ChatNotification(chat_id, event))
 
-    async def send_message_edited(self, chat_id: int, message_id: int, editor_user_id: int) -> None:
+    def send_message_edited(self, chat_id: int, message_id: int, editor_user_id: int) -> None:
         """Send message_edited event to chat members."""
 
         event = Event(
             type="message_edited",
             data={"chat_id": chat_id, "message_id": message_id, "editor_user_id": editor_user_id}
         )
-        await self.notify_chat(chat_id, event)
+        self._enqueue(ChatNotification(chat_id, event))
 
-    async def send_message_deleted(self, chat_id: int, message_id: int, deleter_user_id: int) -> None:
+    def send_message_deleted(self, chat_id: int, message_id: int, deleter_user_id: int) -> None:
         """Send message_deleted event to chat members."""
 
         event = Event(
             type="message_deleted",
             data={"chat_id": chat_id, "message_id": message_id, "deleter_user_id": deleter_user_id}
         )
-        await self.notify_chat(chat_id, event)
+        self._enqueue(ChatNotification(chat_id, event))
 
-    async def send_chat_created(self, chat_id: int, chat_name: str, creator_user_id: int) -> None:
+    def send_chat_created(self, chat_id: int, chat_name: str, creator_user_id: int) -> None:
         """Send chat_created event to chat members."""
 
         event = Event(
             type="chat_created",
             data={"chat_id": chat_id, "chat_name": chat_name, "creator_user_id": creator_user_id}
         )
-        await self.notify_chat(chat_id, event)
+        self._enqueue(ChatNotification(chat_id, event))
 
-    async def send_member_added(self, chat_id: int, added_user_id: int, adder_user_id: int) -> None:
+    def send_member_added(self, chat_id: int, added_user_id: int, adder_user_id: int) -> None:
         """Send member_added event to chat members."""
 
         event = Event(
             type="member_added",
             data={"chat_id": chat_id, "added_user_id": added_user_id, "adder_user_id": adder_user_id}
         )
-        await self.notify_chat(chat_id, event)
+        self._enqueue(ChatNotification(chat_id, event))
 
-    async def send_member_removed(self, chat_id: int, removed_user_id: int, remover_user_id: int) -> None:
+    def send_member_removed(self, chat_id: int, removed_user_id: int, remover_user_id: int) -> None:
         """Send member_removed event to chat members."""
 
         event = Event(
             type="member_removed",
             data={"chat_id": chat_id, "removed_user_id": removed_user_id, "remover_user_id": remover_user_id}
         )
-        await self.notify_chat(chat_id, event)
+        # Also notify the removed user, who is no longer a member
+        self._enqueue(ChatNotification(chat_id, event, extra_user_ids=(removed_user_id,)))
 
-        # Also notify the removed user
-        await self.notify_user(removed_user_id, event)
+    def send_typing(self, chat_id: int, user_id: int) -> None:
+        """Send typing event to chat members, at most once per typing_interval per user and chat."""
+
+        key = (chat_id, user_id)
+        now = time.monotonic()
+
+        last_sent = self._typing_sent.get(key)
+        if last_sent is not None and now - last_sent < self.typing_interval:
+            return
 
-    async def send_typing(self, chat_id: int, user_id: int) -> None:
-        """Send typing event to chat members."""
+        self._typing_sent[key] = now
+        self._typing_sent.move_to_end(key)
+        if len(self._typing_sent) > self.typing_tracked_max:
+            self._typing_sent.popitem(last=False)
 
         event = Event(
             type="typing",
             data={"chat_id": chat_id, "user_id": user_id}
         )
-        await self.notify_chat(chat_id, event, exclude_user_id=user_id)
+        self._enqueue(ChatNotification(chat_id, event, exclude_user_id=user_id))
 
-    async def send_read_status(self, chat_id: int, message_id: int, reader_user_id: int) -> None:
+    def send_read_status(self, chat_id: int, message_id: int, reader_user_id: int) -> None:
         """Send read_status event to chat members."""
 
         event = Event(
             type="read_status",
             data={"chat_id": chat_id, "message_id": message_id, "reader_user_id": reader_user_id}
         )
-        await self.notify_chat(chat_id, event)
+        self._enqueue(ChatNotification(chat_id, event))
@@ -20,8 +20,9 @@ class Settings(BaseSettings):
     psql_db: str = "-"
     psql_user: str = "-"
     psql_password: str = "-"
-    psql_pool_min_size: int = 1
-    psql_pool_max_size: int = 3
+    psql_pool_min_size: int = 2
+    psql_pool_max_size: int = 10
+    psql_statement_cache_size: int = 1024
 
     # S3 Server settings
     s3_endpoint_url: str = "<endpoint>"
@@ -30,6 +31,9 @@ class Settings(BaseSettings):
     s3_bucket_name: str = "<bkt>"
     s3_verify_ssl: bool = True
 
+    # Notifications
+    notify_queue_max: int = 1024  # per subscription, 0 = unbounded
+
     # Logging
     logging_level: str = "DEBUG"
     logging_on_file: bool = True
@@ -44,3 +48,7 @@ class Settings(BaseSettings):
 
 # Global settings instance
 settings = Settings()
+
+# Values read at runtime (not just at startup), resolved once
+LOGGING_LEVEL = settings.logging_level
+NOTIFY_QUEUE_MAX = settings.notify_queue_max
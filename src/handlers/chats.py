@@ -7,13 +7,14 @@ if TYPE_CHECKING:
 
 from src.middleware import logging_middleware, AuthMiddleware
 from src.services.chats import ChatService
-from src.models.api_models import Result
+from src.models.api_models import Result, NOT_MEMBER_RESULT
 
 
 def register_chats_handlers(app: "Application"):
     """Register chats handlers."""
 
     chat_service = ChatService(app)
+    accounts_repo = app.accounts_repo
     auth = AuthMiddleware(app)
 
     @app.server.transaction(code="create_chat")
@@ -30,7 +31,7 @@ def register_chats_handlers(app: "Application"):
 
         # Notify about chat creation
         if result.success and result.data:
-            await app.notify_man.send_chat_created(
+            app.notify_man.send_chat_created(
                 chat_id=result.data.chat_id,
                 chat_name=result.data.chat_name,
                 creator_user_id=user_id
@@ -44,11 +45,8 @@ def register_chats_handlers(app: "Application"):
     async def get_chat_info_trans(user_id: int, chat_id: int):
         """Get chat info by ID."""
 
-        # Check if user is member
-        if not await chat_service.is_member(chat_id, user_id):
-            return Result(success=False, errors=[("FORBIDDEN", "Not a member of this chat")])
-
-        return await chat_service.get_chat_by_id(chat_id=chat_id)
+        # Membership is checked by the same query that loads the chat
+        return await chat_service.get_chat_for_member(chat_id=chat_id, user_id=user_id)
 
     @app.server.transaction(code="get_my_chats")
     @logging_middleware.log_transaction_debug
@@ -65,19 +63,17 @@ def register_chats_handlers(app: "Application"):
         """Add member to chat by username."""
 
         # Check if user is member
-        if not await chat_service.is_member(chat_id, user_id):
-            return Result(success=False, errors=[("FORBIDDEN", "Not a member of this chat")])
+        if not await chat_service.is_member_cached(chat_id, user_id):
+            return NOT_MEMBER_RESULT
 
         result = await chat_service.add_member(chat_id=chat_id, username=username)
 
         # Notify about member addition
         if result.success:
             # Get added user ID
-            from src.services.users.repos import AccountsRepository
-            accounts_repo = AccountsRepository(app)
             added_user = await accounts_repo.get_by_username(username)
             if added_user:
-                await app.notify_man.send_member_added(
+                app.notify_man.send_member_added(
                     chat_id=chat_id,
                     added_user_id=added_user.id,
                     adder_user_id=user_id
@@ -92,14 +88,14 @@ def register_chats_handlers(app: "Application"):
         """Remove member from chat."""
 
         # Check if user is member
-        if not await chat_service.is_member(chat_id, user_id):
-            return Result(success=False, errors=[("FORBIDDEN", "Not a member of this chat")])
+        if not await chat_service.is_member_cached(chat_id, user_id):
+            return NOT_MEMBER_RESULT
 
         result = await chat_service.remove_member(chat_id=chat_id, user_id=target_user_id)
 
         # Notify about member removal
         if result.success:
-            await app.notify_man.send_member_removed(
+            app.notify_man.send_member_removed(
                 chat_id=chat_id,
                 removed_user_id=target_user_id,
                 remover_user_id=user_id
@@ -114,8 +110,8 @@ def register_chats_handlers(app: "Application"):
         """Rename chat."""
 
         # Check if user is member
-        if not await chat_service.is_member(chat_id, user_id):
-            return Result(success=False, errors=[("FORBIDDEN", "Not a member of this chat")])
+        if not await chat_service.is_member_cached(chat_id, user_id):
+            return NOT_MEMBER_RESULT
 
         return await chat_service.rename_chat(chat_id=chat_id, new_name=new_name)
 
@@ -126,14 +122,14 @@ def register_chats_handlers(app: "Application"):
         """Leave chat."""
 
         # Check if user is member
-        if not await chat_service.is_member(chat_id, user_id):
-            return Result(success=False, errors=[("FORBIDDEN", "Not a member of this chat")])
+        if not await chat_service.is_member_cached(chat_id, user_id):
+            return NOT_MEMBER_RESULT
 
         result = await chat_service.leave_chat(chat_id=chat_id, user_id=user_id)
 
         # Notify about member leaving
         if result.success:
-            await app.notify_man.send_member_removed(
+            app.notify_man.send_member_removed(
                 chat_id=chat_id,
                 removed_user_id=user_id,
                 remover_user_id=user_id
@@ -148,7 +144,7 @@ def register_chats_handlers(app: "Application"):
         """Delete chat."""
 
         # Check if user is member
-        if not await chat_service.is_member(chat_id, user_id):
-            return Result(success=False, errors=[("FORBIDDEN", "Not a member of this chat")])
+        if not await chat_service.is_member_cached(chat_id, user_id):
+            return NOT_MEMBER_RESULT
 
         return await chat_service.delete_chat(chat_id=chat_id)
@@ -10,6 +10,6 @@ def register_debug_handlers(app: "Application"):
     """Register debug handlers."""
 
     @app.server.transaction(code="test_connection")
-    @logging_middleware.log_transaction
+    @logging_middleware.log_transaction_debug
     async def test_connection_trans(simple_data: int) -> int:
         return simple_data
@@ -1,5 +1,7 @@
 """Messages transaction handlers."""
 
+import asyncio
+
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -8,7 +10,7 @@ if TYPE_CHECKING:
 from src.middleware import logging_middleware, AuthMiddleware
 from src.services.messages import MessageService, MessageContentInput
 from src.services.chats import ChatService
-from src.models.api_models import Result
+from src.models.api_models import Result, MsgContentTextChunk, NOT_MEMBER_RESULT
 
 
 def register_messages_handlers(app: "Application"):
@@ -16,6 +18,8 @@ def register_messages_handlers(app: "Application"):
 
     message_service = MessageService(app)
     chat_service = ChatService(app)
+    accounts_repo = app.accounts_repo
+    chats_repo = app.chats_repo
     auth = AuthMiddleware(app)
 
     @app.server.transaction(code="send_message")
@@ -29,18 +33,10 @@ def register_messages_handlers(app: "Application"):
         """Send message to chat."""
 
         # Check if user is member
-        if not await chat_service.is_member(chat_id, user_id):
-            return Result(success=False, errors=[("FORBIDDEN", "Not a member of this chat")])
-
-        # Convert dicts to MessageContentInput
-        content_inputs = [
-            MessageContentInput(
-                type=c.get("type", "text"),
-                resource_name=c.get("resource_name", "db"),
-                content=c.get("content", "")
-            )
-            for c in contents
-        ]
+        if not await chat_service.is_member_cached(chat_id, user_id):
+            return NOT_MEMBER_RESULT
+
+        content_inputs = MessageContentInput.from_dicts(contents)
 
         result = await message_service.send_message(
             chat_id=chat_id,
@@ -50,21 +46,20 @@ def register_messages_handlers(app: "Application"):
 
         # Notify about new message
         if result.success and result.data:
-            from src.services.users.repos import AccountsRepository
-            accounts_repo = AccountsRepository(app)
-            sender = await accounts_repo.get_by_id(user_id)
-
-            chat_result = await chat_service.get_chat_by_id(chat_id)
-            chat_name = chat_result.data.chat_name if chat_result.success else "Unknown"
+            # Independent lookups, only the chat row is needed for its name
+            sender, chat_db = await asyncio.gather(
+                accounts_repo.get_by_id(user_id),
+                chats_repo.get_by_id(chat_id)
+            )
+            chat_name = chat_db.chat_name if chat_db else "Unknown"
 
             # Get message preview (first text content)
-            message_preview = ""
-            for content in result.data.contents:
-                if hasattr(content, "text"):
-                    message_preview = content.text
-                    break
+            message_preview = next(
+                (content.text for content in result.data.contents if isinstance(content, MsgContentTextChunk)),
+                ""
+            )
 
-            await app.notify_man.send_new_message(
+            app.notify_man.send_new_message(
                 chat_id=chat_id,
                 sender_user_id=user_id,
                 sender_username=sender.username if sender else "Unknown",
@@ -86,12 +81,10 @@ def register_messages_handlers(app: "Application"):
     ):
         """Get messages from chat with pagination."""
 
-        # Check if user is member
-        if not await chat_service.is_member(chat_id, user_id):
-            return Result(success=False, errors=[("FORBIDDEN", "Not a member of this chat")])
-
-        return await message_service.get_messages(
+        # Membership is checked by the same query that loads the messages
+        return await message_service.get_messages_for_member(
             chat_id=chat_id,
+            user_id=user_id,
             limit=limit,
             before_id=before_id
         )
@@ -107,8 +100,8 @@ def register_messages_handlers(app: "Application"):
         """Get MD5 hash of last N messages for sync check."""
 
         # Check if user is member
-        if not await chat_service.is_member(chat_id, user_id):
-            return Result(success=False, errors=[("FORBIDDEN", "Not a member of this chat")])
+        if not await chat_service.is_member_cached(chat_id, user_id):
+            return NOT_MEMBER_RESULT
 
         return await message_service.get_messages_hash(
             chat_id=chat_id,
@@ -135,7 +128,7 @@ def register_messages_handlers(app: "Application"):
 
         # Notify about message deletion
         if result.success:
-            await app.notify_man.send_message_deleted(
+            app.notify_man.send_message_deleted(
                 chat_id=chat_id,
                 message_id=message_id,
                 deleter_user_id=user_id
@@ -153,15 +146,7 @@ def register_messages_handlers(app: "Application"):
     ):
         """Edit message (only own messages)."""
 
-        # Convert dicts to MessageContentInput
-        content_inputs = [
-            MessageContentInput(
-                type=c.get("type", "text"),
-                resource_name=c.get("resource_name", "db"),
-                content=c.get("content", "")
-            )
-            for c in new_contents
-        ]
+        content_inputs = MessageContentInput.from_dicts(new_contents)
 
         result = await message_service.edit_message(
             message_id=message_id,
@@ -171,7 +156,7 @@ def register_messages_handlers(app: "Application"):
 
         # Notify about message edit
         if result.success and result.data:
-            await app.notify_man.send_message_edited(
+            app.notify_man.send_message_edited(
                 chat_id=result.data.chat_id,
                 message_id=message_id,
                 editor_user_id=user_id
@@ -185,28 +170,19 @@ def register_messages_handlers(app: "Application"):
     async def mark_read_trans(user_id: int, message_id: int):
         """Mark message as read."""
 
-        # Get message to check chat membership
-        msg_result = await message_service.get_message_by_id(message_id)
-        if not msg_result.success:
-            return msg_result
-
-        chat_id = msg_result.data.chat_id
-
-        # Check if user is member
-        if not await chat_service.is_member(chat_id, user_id):
-            return Result(success=False, errors=[("FORBIDDEN", "Not a member of this chat")])
-
-        result = await message_service.mark_read(message_id=message_id)
+        # Membership is checked by the same query that loads the message
+        result = await message_service.mark_read_for_member(message_id=message_id, user_id=user_id)
+        if not result.success:
+            return result
 
         # Notify about read status
-        if result.success:
-            await app.notify_man.send_read_status(
-                chat_id=chat_id,
-                message_id=message_id,
-                reader_user_id=user_id
-            )
+        app.notify_man.send_read_status(
+            chat_id=result.data,
+            message_id=message_id,
+            reader_user_id=user_id
+        )
 
-        return result
+        return Result(success=True, errors=[], data=None)
 
     @app.server.transaction(code="send_typing")
     @logging_middleware.log_transaction_debug
@@ -215,9 +191,9 @@ def register_messages_handlers(app: "Application"):
         """Send typing indicator to chat."""
 
         # Check if user is member
-        if not await chat_service.is_member(chat_id, user_id):
-            return Result(success=False, errors=[("FORBIDDEN", "Not a member of this chat")])
+        if not await chat_service.is_member_cached(chat_id, user_id):
+            return NOT_MEMBER_RESULT
 
-        await app.notify_man.send_typing(chat_id=chat_id, user_id=user_id)
+        app.notify_man.send_typing(chat_id=chat_id, user_id=user_id)
 
         return Result(success=True, errors=[], data=None)
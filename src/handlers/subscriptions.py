@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from src.app import Application
 
+from src.htcp import SubscriptionBatch
 from src.middleware import logging_middleware
 
 
@@ -16,5 +17,5 @@ def register_subscription_handlers(app: "Application"):
     async def user_subscribe(token: str):
         """Subscribe to user events (new messages, typing, etc.)."""
 
-        async for event in app.notify_man.subscribe(token):
-            yield {"type": event.type, "data": event.data}
+        async for events in app.notify_man.subscribe(token):
+            yield SubscriptionBatch({"type": event.type, "data": event.data} for event in events)
@@ -5,7 +5,7 @@ A library for building TCP-based client-server applications
 with automatic type serialization and RPC support.
 """
 
-from .server import Server
+from .server import Server, SubscriptionBatch
 from .client import Client
 from .aio_server import AsyncServer
 from .aio_client import AsyncClient
@@ -29,6 +29,7 @@ __all__ = [
     # Async
     'AsyncServer',
     'AsyncClient',
+    'SubscriptionBatch',
     # Exceptions
     'HTCPError',
     'ConnectionError',
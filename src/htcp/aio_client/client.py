@@ -3,24 +3,27 @@ HTCP Async Client Module
 Async TCP client for connecting to HTCP servers.
 """
 
+import asyncio
 import logging
 import uuid
-from typing import Any, AsyncIterator, Dict, Optional, Type
+import itertools
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple, Type, Union
 
 from ..common.constants import DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT, DEFAULT_WRITE_TIMEOUT
-from ..common.proto import PacketType
+from ..common.proto import Packet, PacketType
 from ..common.messages import (
-    HandshakeRequest,
     HandshakeResponse,
     TransactionCall,
     TransactionResult,
     ErrorPacket,
-    DisconnectPacket,
     SubscribeRequest,
     UnsubscribeRequest,
     SubscribeData,
     SubscribeEnd,
     SubscribeError,
+    HANDSHAKE_REQUEST_PACKET,
+    DISCONNECT_PACKET,
 )
 from ..common.utils import convert_to_type
 from ..exceptions import ConnectionError as HTCPConnectionError
@@ -28,6 +31,14 @@ from ..exceptions import ConnectionError as HTCPConnectionError
 from .connection import AsyncClientConnection
 
 
+# Packets routed to a subscription's queue, decoded by these message types
+_SUBSCRIPTION_MESSAGES = {
+    PacketType.SUBSCRIBE_DATA: SubscribeData,
+    PacketType.SUBSCRIBE_END: SubscribeEnd,
+    PacketType.SUBSCRIBE_ERROR: SubscribeError,
+}
+
+
 class AsyncSubscriptionIterator:
     """
     Async iterator for receiving subscription data.
@@ -43,14 +54,21 @@ class AsyncSubscriptionIterator:
         client: 'AsyncClient',
         subscription_id: str,
         event_type: str,
-        data_type: Optional[Type] = None
+        data_type: Optional[Type] = None,
+        kwargs: Optional[Dict[str, Any]] = None
     ):
         self._client = client
         self._subscription_id = subscription_id
         self._event_type = event_type
         self._data_type = data_type
+        self._kwargs = kwargs or {}
+        self._initialized = False
         self._active = True
         self._ended = False
+        self._unsubscribed = False
+
+        # Filled by the client's reader task; None means the connection closed
+        self._queue: asyncio.Queue[Union[SubscribeData, SubscribeEnd, SubscribeError, Packet, None]] = asyncio.Queue()
 
     @property
     def subscription_id(self) -> str:
@@ -68,53 +86,67 @@ class AsyncSubscriptionIterator:
         return self
 
     async def __anext__(self) -> Any:
+        if not self._initialized:
+            raise RuntimeError("Subscription not initialized. Use 'async with client.subscribe(...) as sub:'")
+
         if not self._active or self._ended:
             raise StopAsyncIteration
 
-        if not self._client._connection.connected:
-            self._active = False
+        queue = self._queue
+
+        if not queue.empty():
+            # Already received; skip the timeout machinery
+            message = queue.get_nowait()
+        else:
+            read_timeout = self._client._connection.read_timeout
+            try:
+                if read_timeout is not None:
+                    message = await asyncio.wait_for(queue.get(), timeout=read_timeout)
+                else:
+                    message = await queue.get()
+            except asyncio.TimeoutError:
+                self._stop()
+                raise StopAsyncIteration
+
+        if message is None:
+            # Connection closed
+            self._stop()
             raise StopAsyncIteration
 
-        try:
-            packet = await self._client._connection.receive()
-
-            if packet.packet_type == PacketType.SUBSCRIBE_DATA:
-                data_msg = SubscribeData.from_packet(packet)
-                if data_msg.subscription_id == self._subscription_id:
-                    if self._data_type is not None and data_msg.data is not None:
-                        return convert_to_type(data_msg.data, self._data_type)
-                    return data_msg.data
-
-            elif packet.packet_type == PacketType.SUBSCRIBE_END:
-                end_msg = SubscribeEnd.from_packet(packet)
-                if end_msg.subscription_id == self._subscription_id:
-                    self._ended = True
-                    raise StopAsyncIteration
-
-            elif packet.packet_type == PacketType.SUBSCRIBE_ERROR:
-                error_msg = SubscribeError.from_packet(packet)
-                if error_msg.subscription_id == self._subscription_id:
-                    self._ended = True
-                    raise RuntimeError(f"Subscription error: {error_msg.message}")
-
-            elif packet.packet_type == PacketType.ERROR:
-                error = ErrorPacket.from_packet(packet)
-                self._ended = True
-                raise RuntimeError(f"Server error: {error.message}")
-
-            # Unexpected packet type
-            raise RuntimeError(f"Unexpected packet type: {packet.packet_type}")
+        if isinstance(message, SubscribeData):
+            if self._data_type is not None and message.data is not None:
+                return convert_to_type(message.data, self._data_type)
+            return message.data
 
-        except HTCPConnectionError:
-            self._active = False
+        self._ended = True
+        self._client._subscription_queues.pop(self._subscription_id, None)
+
+        if isinstance(message, SubscribeEnd):
             raise StopAsyncIteration
 
+        if isinstance(message, SubscribeError):
+            raise RuntimeError(f"Subscription error: {message.message}")
+
+        error = ErrorPacket.from_packet(message)
+        raise RuntimeError(f"Server error: {error.message}")
+
+    def _stop(self) -> None:
+        """Stop receiving data for this subscription."""
+        self._active = False
+        self._client._subscription_queues.pop(self._subscription_id, None)
+
     async def cancel(self) -> None:
         """Cancel the subscription."""
-        if not self._active or self._ended:
+        # A read timeout stops iteration but leaves the server side running,
+        # so that case still unsubscribes while the connection is up
+        if self._ended or self._unsubscribed:
+            return
+
+        self._stop()
+        self._unsubscribed = True
+        if not self._client._connection.connected:
             return
 
-        self._active = False
         try:
             request = UnsubscribeRequest(subscription_id=self._subscription_id)
             await self._client._connection.send(request.to_packet())
@@ -122,6 +154,23 @@ class AsyncSubscriptionIterator:
             pass
 
     async def __aenter__(self) -> 'AsyncSubscriptionIterator':
+        # Register before sending, so no data can arrive first
+        self._client._subscription_queues[self._subscription_id] = self._queue
+
+        # Send subscribe request
+        request = SubscribeRequest(
+            subscription_id=self._subscription_id,
+            event_type=self._event_type,
+            arguments=self._kwargs
+        )
+        await self._client._connection.send(request.to_packet())
+
+        if self._client.logger.isEnabledFor(logging.DEBUG):
+            self._client.logger.debug("Subscribed to '%s' with args: %s", self._event_type, self._kwargs)
+        else:
+            self._client.logger.info("Subscribed to '%s'", self._event_type)
+
+        self._initialized = True
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -175,7 +224,19 @@ class AsyncClient:
             write_timeout,
         )
         self._server_name = "unknown"
-        self._available_transactions: list[str] = []
+        self._available_transactions: tuple[str, ...] = ()
+
+        # Subscription IDs: one random prefix per client plus a counter,
+        # unique across the server's clients without a uuid4() per subscribe
+        self._subscription_prefix = uuid.uuid4().hex
+        self._subscription_counter = itertools.count(1)
+
+        # One task receives all packets and routes them to the waiting calls
+        # and subscriptions, so both can run concurrently on one connection
+        self._reader_task: Optional[asyncio.Task] = None
+        # The server answers calls in the order they were sent
+        self._pending_calls: Deque[asyncio.Future] = deque()
+        self._subscription_queues: Dict[str, asyncio.Queue] = {}
 
     @property
     def connected(self) -> bool:
@@ -194,6 +255,8 @@ class AsyncClient:
             # Perform handshake
             await self._handshake()
 
+            self._reader_task = asyncio.create_task(self._reader_loop())
+
             self.logger.info(f"Connected to {self.server_host}:{self.server_port}")
 
         except Exception as e:
@@ -207,8 +270,7 @@ class AsyncClient:
 
         try:
             # Send disconnect packet
-            packet = DisconnectPacket().to_packet()
-            await self._connection.send(packet)
+            await self._connection.send(DISCONNECT_PACKET)
         except Exception:
             pass
 
@@ -218,13 +280,81 @@ class AsyncClient:
     async def _cleanup(self) -> None:
         """Clean up connection resources."""
         self._server_name = "unknown"
-        self._available_transactions = []
+        self._available_transactions = ()
+
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+
         await self._connection.disconnect()
+        self._fail_waiters()
+
+    async def _reader_loop(self) -> None:
+        """Receive packets and route them to waiting calls and subscriptions."""
+        try:
+            while True:
+                # Idle gaps are normal here; callers apply the read timeout themselves
+                packet = await self._connection.receive(use_timeout=False)
+                try:
+                    self._dispatch(packet)
+                except Exception as e:
+                    # A malformed packet mustn't stop the only reader
+                    self.logger.error("Dropped undecodable packet of type %s: %s", packet.packet_type, e)
+        except HTCPConnectionError:
+            pass
+        finally:
+            self._fail_waiters()
+
+    def _dispatch(self, packet: Packet) -> None:
+        """Route a received packet to its call or subscription."""
+        packet_type = packet.packet_type
+        message_type = _SUBSCRIPTION_MESSAGES.get(packet_type)
+
+        if message_type is not None:
+            message = message_type.from_packet(packet)
+            queue = self._subscription_queues.get(message.subscription_id)
+            if queue is not None:
+                queue.put_nowait(message)
+
+        elif packet_type == PacketType.TRANSACTION_RESULT:
+            if not self._pending_calls:
+                self.logger.warning("Transaction result without a pending call")
+                return
+            # Results come back in call order; a call that gave up
+            # (timeout, cancellation) still consumes its own result
+            waiter = self._pending_calls.popleft()
+            if not waiter.done():
+                waiter.set_result(packet)
+
+        elif packet_type == PacketType.ERROR:
+            # Calls are always answered with a result, so an error packet
+            # can't be matched to one; it ends every subscription instead
+            error = ErrorPacket.from_packet(packet)
+            self.logger.error("Server error: %s", error.message)
+            for queue in self._subscription_queues.values():
+                queue.put_nowait(packet)
+
+        else:
+            self.logger.warning("Unexpected packet type: %s", packet_type)
+
+    def _fail_waiters(self) -> None:
+        """Fail pending calls and end subscriptions after the connection is gone."""
+        while self._pending_calls:
+            waiter = self._pending_calls.popleft()
+            if not waiter.done():
+                waiter.set_exception(HTCPConnectionError("Connection closed"))
+
+        for queue in self._subscription_queues.values():
+            queue.put_nowait(None)
+        self._subscription_queues.clear()
 
     async def _handshake(self) -> None:
         """Perform handshake with server."""
-        request = HandshakeRequest()
-        await self._connection.send(request.to_packet())
+        await self._connection.send(HANDSHAKE_REQUEST_PACKET)
 
         response_packet = await self._connection.receive()
 
@@ -237,7 +367,7 @@ class AsyncClient:
 
         response = HandshakeResponse.from_packet(response_packet)
         self._server_name = response.server_name
-        self._available_transactions = response.transactions
+        self._available_transactions = tuple(response.transactions)
 
     def server_info(self) -> Dict[str, Any]:
         """
@@ -246,14 +376,15 @@ class AsyncClient:
         Returns:
             Dict with server_name, server_addr (host, port), and connected status
         """
+        connected = self._connection.connected
         return {
             "server_name": self._server_name,
             "server_addr": {
-                "host": self.server_host if self._connection.connected else "unknown",
-                "port": self.server_port if self._connection.connected else 0
+                "host": self.server_host if connected else "unknown",
+                "port": self.server_port if connected else 0
             },
-            "connected": self._connection.connected,
-            "available_transactions": self._available_transactions
+            "connected": connected,
+            "available_transactions": list(self._available_transactions)
         }
 
     async def call(self, transaction: str, result_type: Type = None, **kwargs) -> Any:
@@ -282,18 +413,101 @@ class AsyncClient:
         if not self._connection.connected:
             raise HTCPConnectionError("Not connected to server")
 
+        # Register before sending, so the result can't arrive first
+        waiter = asyncio.get_running_loop().create_future()
+        self._pending_calls.append(waiter)
+
         # Send transaction call
         call = TransactionCall(transaction_code=transaction, arguments=kwargs)
-        await self._connection.send(call.to_packet())
+        try:
+            await self._connection.send(call.to_packet())
+        except Exception:
+            if waiter in self._pending_calls:
+                self._pending_calls.remove(waiter)
+            raise
 
         if self.logger.isEnabledFor(logging.DEBUG):
-            self.logger.debug(f"Called transaction '{transaction}' with args: {kwargs}")
+            self.logger.debug("Called transaction '%s' with args: %s", transaction, kwargs)
         else:
-            self.logger.info(f"Called transaction '{transaction}'")
+            self.logger.info("Called transaction '%s'", transaction)
 
-        # Receive response
-        response_packet = await self._connection.receive()
+        # Wait for the reader task to hand over the response
+        read_timeout = self._connection.read_timeout
+        try:
+            if read_timeout is not None:
+                response_packet = await asyncio.wait_for(waiter, timeout=read_timeout)
+            else:
+                response_packet = await waiter
+        except asyncio.TimeoutError:
+            raise HTCPConnectionError(f"Transaction '{transaction}' timed out") from None
+
+        return self._unpack_result(response_packet, result_type)
+
+    async def call_many(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        result_type: Type = None
+    ) -> List[Any]:
+        """
+        Call several transactions with a single write, then wait for all results.
+
+        The server runs the calls one after another in the given order, so each
+        call sees the effects of the ones before it. If a call fails, the first
+        failure is raised once all results have arrived.
+
+        Args:
+            calls: List of (transaction code, arguments) pairs
+            result_type: Optional expected return type for every result
+
+        Returns:
+            Results in the order of calls
+
+        Example:
+            greetings = await client.call_many([
+                ("greet", {"name": "Alice"}),
+                ("greet", {"name": "Bob"}),
+            ])
+        """
+        if not self._connection.connected:
+            raise HTCPConnectionError("Not connected to server")
+
+        if not calls:
+            return []
+
+        # Register before sending, so no result can arrive first
+        loop = asyncio.get_running_loop()
+        waiters = [loop.create_future() for _ in calls]
+        self._pending_calls.extend(waiters)
+
+        packets = [
+            TransactionCall(transaction_code=transaction, arguments=arguments).to_packet()
+            for transaction, arguments in calls
+        ]
+        try:
+            await self._connection.send_many(packets)
+        except Exception:
+            for waiter in waiters:
+                if waiter in self._pending_calls:
+                    self._pending_calls.remove(waiter)
+            raise
 
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Called %d transactions: %s", len(calls), ", ".join(code for code, _ in calls))
+
+        read_timeout = self._connection.read_timeout
+        try:
+            if read_timeout is not None:
+                response_packets = await asyncio.wait_for(asyncio.gather(*waiters), timeout=read_timeout)
+            else:
+                response_packets = await asyncio.gather(*waiters)
+        except asyncio.TimeoutError:
+            raise HTCPConnectionError(f"{len(calls)} transactions timed out") from None
+
+        return [self._unpack_result(packet, result_type) for packet in response_packets]
+
+    @staticmethod
+    def _unpack_result(response_packet: Packet, result_type: Optional[Type]) -> Any:
+        """Extract a transaction's result from its response packet, raising on failure."""
         if response_packet.packet_type == PacketType.ERROR:
             error = ErrorPacket.from_packet(response_packet)
             raise RuntimeError(f"Server error: {error.message}")
@@ -342,15 +556,10 @@ class AsyncClient:
         if not self._connection.connected:
             raise HTCPConnectionError("Not connected to server")
 
-        subscription_id = str(uuid.uuid4())
-
-        # Send subscribe request synchronously (will be awaited by iterator)
-        # Actually we need to send it now
-        import asyncio
-        loop = asyncio.get_event_loop()
+        subscription_id = f"{self._subscription_prefix}-{next(self._subscription_counter)}"
 
-        # Create and return the iterator - it will send the request
-        return _AsyncSubscriptionIteratorWithInit(
+        # Create and return the iterator - it sends the request on enter
+        return AsyncSubscriptionIterator(
             client=self,
             subscription_id=subscription_id,
             event_type=event_type,
@@ -366,41 +575,3 @@ class AsyncClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Async context manager exit."""
         await self.disconnect()
-
-
-class _AsyncSubscriptionIteratorWithInit(AsyncSubscriptionIterator):
-    """Extended async subscription iterator that sends subscribe request on enter."""
-
-    def __init__(
-        self,
-        client: 'AsyncClient',
-        subscription_id: str,
-        event_type: str,
-        data_type: Optional[Type],
-        kwargs: Dict[str, Any]
-    ):
-        super().__init__(client, subscription_id, event_type, data_type)
-        self._kwargs = kwargs
-        self._initialized = False
-
-    async def __aenter__(self) -> 'AsyncSubscriptionIterator':
-        # Send subscribe request
-        request = SubscribeRequest(
-            subscription_id=self._subscription_id,
-            event_type=self._event_type,
-            arguments=self._kwargs
-        )
-        await self._client._connection.send(request.to_packet())
-
-        if self._client.logger.isEnabledFor(logging.DEBUG):
-            self._client.logger.debug(f"Subscribed to '{self._event_type}' with args: {self._kwargs}")
-        else:
-            self._client.logger.info(f"Subscribed to '{self._event_type}'")
-
-        self._initialized = True
-        return self
-
-    async def __anext__(self) -> Any:
-        if not self._initialized:
-            raise RuntimeError("Subscription not initialized. Use 'async with client.subscribe(...) as sub:'")
-        return await super().__anext__()
@@ -4,11 +4,18 @@ Async connection management for client.
 """
 
 import asyncio
-from typing import Optional
-
-from ..common.constants import DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT, DEFAULT_WRITE_TIMEOUT
+import functools
+from typing import Awaitable, Callable, List, Optional
+
+from ..common.constants import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_WRITE_TIMEOUT,
+    DEFAULT_CLOSE_GRACE,
+)
 from ..common.proto import Packet
-from ..common.aio_transport import recv_packet, send_packet
+from ..common.aio_transport import HTCPProtocol
+from ..common.transport import configure_socket
 from ..exceptions import ConnectionError as HTCPConnectionError
 
 
@@ -16,7 +23,7 @@ class AsyncClientConnection:
     """
     Async client connection wrapper.
 
-    Provides async access to socket operations.
+    Provides async access to socket operations through an HTCPProtocol.
     """
 
     def __init__(
@@ -33,9 +40,13 @@ class AsyncClientConnection:
         self._read_timeout = read_timeout
         self._write_timeout = write_timeout
 
-        self._reader: Optional[asyncio.StreamReader] = None
-        self._writer: Optional[asyncio.StreamWriter] = None
+        self._protocol: Optional[HTCPProtocol] = None
+        # Protocol I/O bound once per connection, used by send() and receive()
+        self._send: Optional[Callable[[Packet], Awaitable[None]]] = None
+        self._send_many: Optional[Callable[[List[Packet]], Awaitable[None]]] = None
+        self._receive: Optional[Callable[[Optional[float]], Awaitable[Packet]]] = None
         self._connected = False
+        # Guards connect/disconnect only; send and receive don't need it
         self._lock = asyncio.Lock()
 
     @property
@@ -46,6 +57,10 @@ class AsyncClientConnection:
     def port(self) -> int:
         return self._port
 
+    @property
+    def read_timeout(self) -> Optional[float]:
+        return self._read_timeout
+
     @property
     def connected(self) -> bool:
         """Check if connection is active."""
@@ -63,14 +78,23 @@ class AsyncClientConnection:
                 return
 
             try:
-                coro = asyncio.open_connection(self._host, self._port)
+                coro = asyncio.get_running_loop().create_connection(
+                    HTCPProtocol, self._host, self._port
+                )
                 if self._connect_timeout is not None:
-                    self._reader, self._writer = await asyncio.wait_for(
+                    transport, self._protocol = await asyncio.wait_for(
                         coro, timeout=self._connect_timeout
                     )
                 else:
-                    self._reader, self._writer = await coro
+                    transport, self._protocol = await coro
 
+                sock = transport.get_extra_info('socket')
+                if sock is not None:
+                    configure_socket(sock)
+
+                self._send = functools.partial(self._protocol.send, timeout=self._write_timeout)
+                self._send_many = functools.partial(self._protocol.send_many, timeout=self._write_timeout)
+                self._receive = self._protocol.receive
                 self._connected = True
 
             except asyncio.TimeoutError:
@@ -100,44 +124,72 @@ class AsyncClientConnection:
         Raises:
             HTCPConnectionError: If not connected or send fails
         """
-        async with self._lock:
-            if not self._connected or self._writer is None:
-                raise HTCPConnectionError("Not connected")
-            try:
-                await send_packet(self._writer, packet, self._write_timeout)
-            except Exception as e:
-                self._connected = False
-                raise HTCPConnectionError(f"Send failed: {e}") from e
+        # Writes go straight into the transport buffer, so concurrent
+        # senders can't interleave partial packets
+        if not self._connected:
+            raise HTCPConnectionError("Not connected")
+        try:
+            await self._send(packet)
+        except Exception as e:
+            self._connected = False
+            raise HTCPConnectionError(f"Send failed: {e}") from e
+
+    async def send_many(self, packets: List[Packet]) -> None:
+        """
+        Send several packets to server with a single write.
+
+        Args:
+            packets: Packets to send, in order
 
-    async def receive(self) -> Packet:
+        Raises:
+            HTCPConnectionError: If not connected or send fails
+        """
+        if not self._connected:
+            raise HTCPConnectionError("Not connected")
+        try:
+            await self._send_many(packets)
+        except Exception as e:
+            self._connected = False
+            raise HTCPConnectionError(f"Send failed: {e}") from e
+
+    async def receive(self, use_timeout: bool = True) -> Packet:
         """
         Receive a packet from server.
 
+        Args:
+            use_timeout: Apply the read timeout; disable for readers that idle between packets
+
         Returns:
             Received Packet
 
         Raises:
             HTCPConnectionError: If not connected or receive fails
         """
-        async with self._lock:
-            if not self._connected or self._reader is None:
-                raise HTCPConnectionError("Not connected")
-            try:
-                return await recv_packet(self._reader, timeout=self._read_timeout)
-            except Exception as e:
-                self._connected = False
-                raise HTCPConnectionError(f"Receive failed: {e}") from e
+        if not self._connected:
+            raise HTCPConnectionError("Not connected")
+        try:
+            return await self._receive(self._read_timeout if use_timeout else None)
+        except Exception as e:
+            self._connected = False
+            raise HTCPConnectionError(f"Receive failed: {e}") from e
 
     async def _cleanup(self) -> None:
         """Clean up connection resources."""
-        if self._writer is not None:
-            try:
-                self._writer.close()
-                await self._writer.wait_closed()
-            except Exception:
-                pass
-            self._writer = None
-        self._reader = None
+        if self._protocol is not None:
+            transport = self._protocol.transport
+            if transport is not None:
+                try:
+                    transport.close()
+                    await asyncio.wait_for(self._protocol.wait_closed(), timeout=DEFAULT_CLOSE_GRACE)
+                except asyncio.TimeoutError:
+                    # Server isn't reading; drop what's still buffered
+                    transport.abort()
+                except Exception:
+                    pass
+            self._protocol = None
+        self._send = None
+        self._send_many = None
+        self._receive = None
 
     async def __aenter__(self) -> 'AsyncClientConnection':
         await self.connect()
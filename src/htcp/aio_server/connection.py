@@ -4,7 +4,12 @@ Async client connection management for server.
 """
 
 import asyncio
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Tuple
+
+from ..common.constants import DEFAULT_CLOSE_GRACE
+from ..common.proto import Packet
+from ..common.transport import configure_socket
+from ..exceptions import ConnectionError as HTCPConnectionError
 
 
 class AsyncServerClientConnection:
@@ -12,8 +17,23 @@ class AsyncServerClientConnection:
     Represents a connected client on the async server side.
 
     Wrapper around async streams with connection state.
+
+    Packets sent during one event loop iteration are coalesced and handed
+    to the transport in a single write.
     """
 
+    __slots__ = (
+        '_reader', '_writer', '_address', '_read_timeout', '_write_timeout',
+        '_connected', '_closed', '_pending', '_flush_handle',
+    )
+
+    # Buffered bytes above which senders wait for the transport to drain
+    write_high_water = 64 * 1024
+
+    # Payloads at least this large are handed to the transport as they are
+    # instead of being copied into the coalescing buffer
+    copy_threshold = 16 * 1024
+
     def __init__(
         self,
         reader: asyncio.StreamReader,
@@ -28,7 +48,18 @@ class AsyncServerClientConnection:
         self._read_timeout = read_timeout
         self._write_timeout = write_timeout
         self._connected = True
-        self._lock = asyncio.Lock()
+        self._closed = False
+
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            configure_socket(sock)
+
+        # drain() then pauses at the same mark send() flushes at
+        writer.transport.set_write_buffer_limits(high=self.write_high_water)
+
+        # Packets waiting for the end of the current loop iteration
+        self._pending = bytearray()
+        self._flush_handle: Optional[asyncio.Handle] = None
 
     @property
     def reader(self) -> asyncio.StreamReader:
@@ -69,15 +100,125 @@ class AsyncServerClientConnection:
         """Set connection state."""
         self._connected = value
 
-    async def close(self) -> None:
-        """Close the connection."""
-        async with self._lock:
+    async def send(self, packet: Packet) -> None:
+        """
+        Queue a packet to be written together with others sent in this loop iteration.
+
+        Waits for the transport to drain only when too much data is buffered.
+
+        Args:
+            packet: Packet to send
+
+        Raises:
+            HTCPConnectionError: If the connection is closed or the write buffer doesn't drain in time
+        """
+        self._check_open()
+        payload = packet.payload
+        if len(payload) < self.copy_threshold:
+            packet.append_to(self._pending)
+        else:
+            self._pending += packet.header()
+            self._flush(payload)
+        await self._schedule_flush()
+
+    async def send_many(self, packets: Iterable[Packet]) -> None:
+        """
+        Queue several packets, checking the write buffer once for all of them.
+
+        Args:
+            packets: Packets to send, in order
+
+        Raises:
+            HTCPConnectionError: If the connection is closed or the write buffer doesn't drain in time
+        """
+        self._check_open()
+        pending = self._pending
+        for packet in packets:
+            packet.append_to(pending)
+        await self._schedule_flush()
+
+    def _check_open(self) -> None:
+        """Raise if the peer is gone; writes are buffered, so they wouldn't fail by themselves."""
+        if self._connected and not self._writer.transport.is_closing():
+            return
+        self._connected = False
+        raise HTCPConnectionError("Connection closed")
+
+    async def _schedule_flush(self) -> None:
+        """Flush at the end of this loop iteration, or now and drain if over the high-water mark."""
+        pending_size = len(self._pending)
+        if pending_size + self._writer.transport.get_write_buffer_size() <= self.write_high_water:
+            if self._flush_handle is None:
+                self._flush_handle = asyncio.get_running_loop().call_soon(self._flush)
+            return
+
+        self._flush()
+        try:
+            if self._write_timeout is not None:
+                await asyncio.wait_for(self._writer.drain(), timeout=self._write_timeout)
+            else:
+                await self._writer.drain()
+        except (BrokenPipeError, ConnectionResetError, OSError) as e:
+            raise HTCPConnectionError(f"Failed to send packet: {e}") from e
+        except asyncio.TimeoutError:
+            raise HTCPConnectionError("Write timeout") from None
+
+    def _flush(self, tail: Optional[bytes] = None) -> None:
+        """
+        Write all queued packets to the transport.
+
+        Args:
+            tail: Payload to write right after the queued bytes without copying it
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if not self._pending:
+            return
+
+        # Swapped instead of cleared; the transport may keep a view of it
+        data, self._pending = self._pending, bytearray()
+        try:
+            if tail is None:
+                self._writer.write(data)
+            else:
+                self._writer.writelines((data, tail))
+        except Exception:
+            self._connected = False
+            return
+
+        # The transport drops writes once the peer is gone
+        if self._writer.transport.is_closing():
             self._connected = False
-            try:
-                self._writer.close()
+
+    async def close(self, grace: Optional[float] = DEFAULT_CLOSE_GRACE) -> None:
+        """
+        Close the connection.
+
+        Args:
+            grace: Seconds to let buffered data flush before the connection
+                is aborted (None = wait indefinitely)
+        """
+        self._connected = False
+
+        # Set before the first await, so concurrent callers close only once
+        if self._closed:
+            return
+        self._closed = True
+
+        try:
+            self._flush()
+            self._writer.close()
+            if grace is not None:
+                await asyncio.wait_for(self._writer.wait_closed(), timeout=grace)
+            else:
                 await self._writer.wait_closed()
-            except Exception:
-                pass
+        except asyncio.TimeoutError:
+            # Peer isn't reading; drop what's still buffered
+            self._writer.transport.abort()
+        except Exception:
+            pass
 
     def __repr__(self) -> str:
         return f"AsyncServerClientConnection({self._address[0]}:{self._address[1]}, connected={self.connected})"
@@ -87,7 +228,9 @@ class AsyncConnectionRegistry:
     """
     Async registry for active client connections.
 
-    Provides atomic operations for connection management.
+    Provides atomic operations for connection management. All methods run
+    on the event loop thread, and none but close_all() awaits, so each
+    call is atomic without a lock.
     """
 
     def __init__(self, max_connections: int = 0):
@@ -98,10 +241,9 @@ class AsyncConnectionRegistry:
             max_connections: Maximum allowed connections (0 = unlimited)
         """
         self._connections: dict[Tuple[str, int], AsyncServerClientConnection] = {}
-        self._lock = asyncio.Lock()
         self._max_connections = max_connections
 
-    async def try_add(
+    def try_add(
         self,
         reader: asyncio.StreamReader,
         writer: asyncio.StreamWriter,
@@ -122,18 +264,17 @@ class AsyncConnectionRegistry:
         Returns:
             AsyncServerClientConnection if added successfully, None if limit reached
         """
-        async with self._lock:
-            # Atomic check and add
-            if self._max_connections > 0 and len(self._connections) >= self._max_connections:
-                return None
-
-            conn = AsyncServerClientConnection(
-                reader, writer, address, read_timeout, write_timeout
-            )
-            self._connections[address] = conn
-            return conn
-
-    async def remove(self, address: Tuple[str, int]) -> Optional[AsyncServerClientConnection]:
+        # No await between the check and the insert, so this is atomic
+        if self._max_connections > 0 and len(self._connections) >= self._max_connections:
+            return None
+
+        conn = AsyncServerClientConnection(
+            reader, writer, address, read_timeout, write_timeout
+        )
+        self._connections[address] = conn
+        return conn
+
+    def remove(self, address: Tuple[str, int]) -> Optional[AsyncServerClientConnection]:
         """
         Remove a connection by address.
 
@@ -143,22 +284,19 @@ class AsyncConnectionRegistry:
         Returns:
             Removed connection or None if not found
         """
-        async with self._lock:
-            return self._connections.pop(address, None)
+        return self._connections.pop(address, None)
 
-    async def get(self, address: Tuple[str, int]) -> Optional[AsyncServerClientConnection]:
+    def get(self, address: Tuple[str, int]) -> Optional[AsyncServerClientConnection]:
         """Get a connection by address."""
-        async with self._lock:
-            return self._connections.get(address)
+        return self._connections.get(address)
 
     async def close_all(self) -> None:
         """Close all connections."""
-        async with self._lock:
-            for conn in self._connections.values():
-                await conn.close()
-            self._connections.clear()
+        connections = list(self._connections.values())
+        self._connections.clear()
+
+        await asyncio.gather(*(conn.close() for conn in connections))
 
-    async def count(self) -> int:
+    def count(self) -> int:
         """Get current connection count."""
-        async with self._lock:
-            return len(self._connections)
+        return len(self._connections)
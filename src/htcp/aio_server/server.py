@@ -4,11 +4,18 @@ Async TCP server with transaction and subscription decorator support.
 """
 
 import asyncio
-import inspect
 import logging
+import os
 import signal
+import socket
+import threading
 
-from typing import Callable, Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, List
+
+try:
+    import uvloop  # Optional, POSIX only
+except ImportError:
+    uvloop = None
 
 from ..common.constants import (
     DEFAULT_LISTEN_BACKLOG,
@@ -29,18 +36,87 @@ from ..common.messages import (
     SubscribeEnd,
     SubscribeError,
 )
-from ..common.aio_transport import recv_packet, send_packet
-from ..common.utils import prepare_arguments
+from ..common.aio_transport import recv_packet
 from ..exceptions import ConnectionError as HTCPConnectionError
 
 from ..server.transaction import Transaction, TransactionRegistry
-from ..server.subscription import Subscription, SubscriptionRegistry
+from ..server.subscription import Subscription, SubscriptionBatch, SubscriptionRegistry
 from .connection import AsyncServerClientConnection, AsyncConnectionRegistry
 
 
+_HAS_REUSEPORT = hasattr(socket, 'SO_REUSEPORT')
+
+
+class _SyncGeneratorPump:
+    """
+    Runs a sync subscription generator on its own thread.
+
+    Items are handed to the event loop through a queue, so a subscription
+    costs one thread instead of one executor job per item. At most
+    `prefetch` items are produced ahead of the consumer.
+    """
+
+    _END = object()
+
+    def __init__(self, generator: Any, loop: asyncio.AbstractEventLoop, prefetch: int):
+        self._generator = generator
+        self._loop = loop
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._slots = threading.Semaphore(prefetch)
+        self._stopped = threading.Event()
+        self._error: Optional[BaseException] = None
+
+    def start(self, name: str) -> None:
+        """Start pulling items from the generator."""
+        threading.Thread(target=self._run, name=name, daemon=True).start()
+
+    def close(self) -> None:
+        """Stop the pump; the generator is closed on its own thread."""
+        self._stopped.set()
+        self._slots.release()
+
+    def _run(self) -> None:
+        try:
+            while True:
+                self._slots.acquire()
+                if self._stopped.is_set():
+                    return
+                try:
+                    data = next(self._generator)
+                except StopIteration:
+                    break
+                self._put(data)
+        except Exception as e:
+            self._error = e
+        finally:
+            self._generator.close()
+        self._put(self._END)
+
+    def _put(self, item: Any) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, item)
+        except RuntimeError:
+            # Event loop already closed
+            self._stopped.set()
+
+    def __aiter__(self) -> "_SyncGeneratorPump":
+        return self
+
+    async def __anext__(self) -> Any:
+        item = await self._queue.get()
+        if item is self._END:
+            if self._error is not None:
+                raise self._error
+            raise StopAsyncIteration
+        self._slots.release()
+        return item
+
+
 class AsyncActiveSubscription:
     """Represents an active async subscription for a client."""
 
+    __slots__ = ('subscription_id', 'event_type', 'client_address', 'task', 'is_cancelled')
+
     def __init__(
         self,
         subscription_id: str,
@@ -52,28 +128,29 @@ class AsyncActiveSubscription:
         self.event_type = event_type
         self.client_address = client_address
         self.task = task
-        self._cancelled = False
+        # Plain attribute; it's checked for every item the subscription sends
+        self.is_cancelled = False
 
     def cancel(self) -> None:
         """Cancel this subscription."""
-        self._cancelled = True
+        self.is_cancelled = True
         if not self.task.done():
             self.task.cancel()
 
-    @property
-    def is_cancelled(self) -> bool:
-        return self._cancelled
-
 
 class AsyncActiveSubscriptionRegistry:
-    """Async registry for active client subscriptions."""
+    """
+    Async registry for active client subscriptions.
+
+    Only used from the event loop thread, and no method awaits, so each
+    call is atomic without a lock.
+    """
 
     def __init__(self):
         self._subscriptions: Dict[str, AsyncActiveSubscription] = {}
         self._by_client: Dict[tuple, set[str]] = {}
-        self._lock = asyncio.Lock()
 
-    async def add(
+    def add(
         self,
         subscription_id: str,
         event_type: str,
@@ -81,46 +158,38 @@ class AsyncActiveSubscriptionRegistry:
         task: asyncio.Task
     ) -> AsyncActiveSubscription:
         """Add an active subscription."""
-        async with self._lock:
-            sub = AsyncActiveSubscription(
-                subscription_id, event_type, client_address, task
-            )
-            self._subscriptions[subscription_id] = sub
-
-            if client_address not in self._by_client:
-                self._by_client[client_address] = set()
-            self._by_client[client_address].add(subscription_id)
-
-            return sub
+        sub = AsyncActiveSubscription(
+            subscription_id, event_type, client_address, task
+        )
+        self._subscriptions[subscription_id] = sub
+        self._by_client.setdefault(client_address, set()).add(subscription_id)
+        return sub
 
-    async def get(self, subscription_id: str) -> Optional[AsyncActiveSubscription]:
+    def get(self, subscription_id: str) -> Optional[AsyncActiveSubscription]:
         """Get an active subscription by ID."""
-        async with self._lock:
-            return self._subscriptions.get(subscription_id)
+        return self._subscriptions.get(subscription_id)
 
-    async def remove(self, subscription_id: str) -> Optional[AsyncActiveSubscription]:
+    def remove(self, subscription_id: str) -> Optional[AsyncActiveSubscription]:
         """Remove and return an active subscription."""
-        async with self._lock:
-            sub = self._subscriptions.pop(subscription_id, None)
-            if sub:
-                client_subs = self._by_client.get(sub.client_address)
-                if client_subs:
-                    client_subs.discard(subscription_id)
-                    if not client_subs:
-                        del self._by_client[sub.client_address]
-            return sub
-
-    async def cancel_for_client(self, client_address: tuple) -> list[AsyncActiveSubscription]:
+        sub = self._subscriptions.pop(subscription_id, None)
+        if sub:
+            client_subs = self._by_client.get(sub.client_address)
+            if client_subs:
+                client_subs.discard(subscription_id)
+                if not client_subs:
+                    del self._by_client[sub.client_address]
+        return sub
+
+    def cancel_for_client(self, client_address: tuple) -> list[AsyncActiveSubscription]:
         """Cancel and remove all subscriptions for a client."""
-        async with self._lock:
-            sub_ids = self._by_client.pop(client_address, set())
-            cancelled = []
-            for sub_id in sub_ids:
-                sub = self._subscriptions.pop(sub_id, None)
-                if sub:
-                    sub.cancel()
-                    cancelled.append(sub)
-            return cancelled
+        sub_ids = self._by_client.pop(client_address, set())
+        cancelled = []
+        for sub_id in sub_ids:
+            sub = self._subscriptions.pop(sub_id, None)
+            if sub:
+                sub.cancel()
+                cancelled.append(sub)
+        return cancelled
 
 
 class AsyncServer:
@@ -143,8 +212,19 @@ class AsyncServer:
                 await asyncio.sleep(1)
 
         await app.up()
+
+    Or, to create the event loop (uvloop when installed) and block:
+        app.run()
+
+    On POSIX, app.run(workers=4) forks four processes with their own event
+    loops and SO_REUSEPORT listeners; the kernel spreads connections
+    between them. Workers share no state, so each one only sees the
+    subscriptions of its own clients.
     """
 
+    # Items a sync subscription generator may produce ahead of sending
+    sync_subscription_prefetch = 32
+
     def __init__(
         self,
         name: str = "htcp-server",
@@ -156,6 +236,7 @@ class AsyncServer:
         read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT,
         write_timeout: Optional[float] = DEFAULT_WRITE_TIMEOUT,
         listen_backlog: int = DEFAULT_LISTEN_BACKLOG,
+        reuse_port: bool = False,
     ):
         self.name = name
         self.host = host
@@ -166,15 +247,29 @@ class AsyncServer:
         self.read_timeout = read_timeout
         self.write_timeout = write_timeout
         self.listen_backlog = listen_backlog
+        # Lets several server processes listen on the same port; the kernel
+        # balances incoming connections between them
+        self.reuse_port = reuse_port
 
         self._transactions = TransactionRegistry()
         self._subscriptions = SubscriptionRegistry()
         self._active_subscriptions = AsyncActiveSubscriptionRegistry()
         self._server: Optional[asyncio.Server] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._running = False
+        self._handshake_packet: Optional[Packet] = None
         self._clients = AsyncConnectionRegistry(max_connections)
         self._shutdown_event = asyncio.Event()
 
+        # Packet handlers, most frequent first
+        self._dispatch = {
+            PacketType.TRANSACTION_CALL: self._handle_transaction,
+            PacketType.HANDSHAKE_REQUEST: self._handle_handshake,
+            PacketType.SUBSCRIBE_REQUEST: self._handle_subscribe,
+            PacketType.UNSUBSCRIBE_REQUEST: self._handle_unsubscribe,
+            PacketType.DISCONNECT: self._handle_disconnect,
+        }
+
     def transaction(self, code: str) -> Callable:
         """
         Decorator to register a transaction handler.
@@ -191,7 +286,7 @@ class AsyncServer:
         """
         def decorator(func: Callable) -> Callable:
             self._transactions.register(code, func)
-            self.logger.debug(f"Registered transaction '{code}'")
+            self.logger.debug("Registered transaction '%s'", code)
             return func
 
         return decorator
@@ -216,7 +311,7 @@ class AsyncServer:
         """
         def decorator(func: Callable) -> Callable:
             self._subscriptions.register(event_type, func)
-            self.logger.debug(f"Registered subscription '{event_type}'")
+            self.logger.debug("Registered subscription '%s'", event_type)
             return func
 
         return decorator
@@ -227,28 +322,38 @@ class AsyncServer:
             self.logger.warning("Server is already running")
             return
 
+        # Registrations are fixed once serving starts, so the handshake
+        # response is serialized once instead of per connection
+        transactions = self._transactions.list_codes() if self.expose_transactions else []
+        self._handshake_packet = HandshakeResponse(
+            server_name=self.name,
+            transactions=transactions
+        ).to_packet()
+
         self._server = await asyncio.start_server(
             self._handle_client,
             self.host,
             self.port,
             backlog=self.listen_backlog,
+            reuse_port=self.reuse_port,
         )
+        # Looked up once; sync handlers and generators use it on every call
+        self._loop = asyncio.get_running_loop()
 
         self._running = True
         self._shutdown_event.clear()
 
         if self.logger.isEnabledFor(logging.INFO):
             self.logger.info(
-                f"Registered {len(self._transactions)} transactions, "
-                f"{len(self._subscriptions)} subscriptions"
+                "Registered %d transactions, %d subscriptions",
+                len(self._transactions), len(self._subscriptions)
             )
-        self.logger.info(f"Async server '{self.name}' started on {self.host}:{self.port}")
+        self.logger.info("Async server '%s' started on %s:%s", self.name, self.host, self.port)
 
         # Setup signal handlers
-        loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
             try:
-                loop.add_signal_handler(sig, self._signal_handler)
+                self._loop.add_signal_handler(sig, self._signal_handler)
             except NotImplementedError:
                 # Windows doesn't support add_signal_handler
                 pass
@@ -261,6 +366,62 @@ class AsyncServer:
         finally:
             await self.down()
 
+    def run(self, use_uvloop: bool = True, workers: int = 1) -> None:
+        """
+        Run the server in a new event loop until it stops.
+
+        Args:
+            use_uvloop: Use the libuv-based uvloop event loop when it is installed
+            workers: Number of worker processes sharing the port (POSIX only)
+        """
+        if workers > 1:
+            if hasattr(os, 'fork') and _HAS_REUSEPORT:
+                self._run_workers(workers, use_uvloop)
+                return
+            self.logger.warning("Worker processes need fork() and SO_REUSEPORT; running a single worker")
+
+        if use_uvloop and uvloop is not None:
+            uvloop.run(self.up())
+        else:
+            asyncio.run(self.up())
+
+    def _run_workers(self, workers: int, use_uvloop: bool) -> None:
+        """Fork worker processes, each listening on the port, and wait for them to exit."""
+        self.reuse_port = True
+
+        pids = []
+        for _ in range(workers):
+            pid = os.fork()
+            if pid == 0:
+                exit_code = 0
+                try:
+                    self.run(use_uvloop=use_uvloop)
+                except BaseException:
+                    self.logger.exception("Worker %d failed", os.getpid())
+                    exit_code = 1
+                finally:
+                    os._exit(exit_code)
+            pids.append(pid)
+
+        self.logger.info("Async server '%s' started %d workers", self.name, workers)
+
+        def forward_signal(signum, frame):
+            for worker_pid in pids:
+                try:
+                    os.kill(worker_pid, signum)
+                except ProcessLookupError:
+                    pass
+
+        previous_handlers = {
+            sig: signal.signal(sig, forward_signal) for sig in (signal.SIGINT, signal.SIGTERM)
+        }
+        try:
+            for pid in pids:
+                os.waitpid(pid, 0)
+        finally:
+            for sig, handler in previous_handlers.items():
+                signal.signal(sig, handler)
+
     def _signal_handler(self) -> None:
         """Handle shutdown signals."""
         self.logger.info("Shutdown signal received")
@@ -283,7 +444,7 @@ class AsyncServer:
             await self._server.wait_closed()
             self._server = None
 
-        self.logger.info(f"Async server '{self.name}' stopped")
+        self.logger.info("Async server '%s' stopped", self.name)
 
     async def _handle_client(
         self,
@@ -292,10 +453,17 @@ class AsyncServer:
     ) -> None:
         """Handle a new client connection."""
         peername = writer.get_extra_info('peername')
-        address = (peername[0], peername[1]) if peername else ('unknown', 0)
+        if not peername:
+            address = ('unknown', 0)
+        elif len(peername) == 2:
+            # IPv4 peername is already (host, port); reuse it as the registry key
+            address = peername
+        else:
+            # IPv6 adds flowinfo and scope id
+            address = peername[:2]
 
         # Atomic check-and-add to prevent race condition
-        client = await self._clients.try_add(
+        client = self._clients.try_add(
             reader,
             writer,
             address,
@@ -305,13 +473,14 @@ class AsyncServer:
 
         if client is None:
             self.logger.warning(
-                f"Connection from {address} rejected: max connections ({self.max_connections}) reached"
+                "Connection from %s rejected: max connections (%d) reached",
+                address, self.max_connections
             )
             writer.close()
             await writer.wait_closed()
             return
 
-        self.logger.info(f"New connection from {address[0]}:{address[1]}")
+        self.logger.info("New connection from %s:%s", address[0], address[1])
 
         try:
             while self._running and client.connected:
@@ -321,20 +490,20 @@ class AsyncServer:
                 except HTCPConnectionError:
                     break
                 except asyncio.TimeoutError:
-                    self.logger.warning(f"Client {address} timed out")
+                    self.logger.warning("Client %s timed out", address)
                     break
                 except Exception as e:
-                    self.logger.error(f"Error processing packet from {address}: {e}")
+                    self.logger.error("Error processing packet from %s: %s", address, e)
                     await self._send_error(client, ErrorCode.PROTOCOL_ERROR, str(e))
                     break
 
         finally:
             # Cancel all active subscriptions for this client
-            await self._active_subscriptions.cancel_for_client(address)
+            self._active_subscriptions.cancel_for_client(address)
 
-            await self._clients.remove(address)
+            self._clients.remove(address)
             await client.close()
-            self.logger.info(f"Client {address[0]}:{address[1]} disconnected")
+            self.logger.info("Client %s:%s disconnected", address[0], address[1])
 
     async def _process_packet(
         self,
@@ -342,21 +511,9 @@ class AsyncServer:
         packet: Packet
     ) -> None:
         """Process incoming packet from client."""
-        if packet.packet_type == PacketType.HANDSHAKE_REQUEST:
-            await self._handle_handshake(client, packet)
-
-        elif packet.packet_type == PacketType.TRANSACTION_CALL:
-            await self._handle_transaction(client, packet)
-
-        elif packet.packet_type == PacketType.SUBSCRIBE_REQUEST:
-            await self._handle_subscribe(client, packet)
-
-        elif packet.packet_type == PacketType.UNSUBSCRIBE_REQUEST:
-            await self._handle_unsubscribe(client, packet)
-
-        elif packet.packet_type == PacketType.DISCONNECT:
-            client.connected = False
-
+        handler = self._dispatch.get(packet.packet_type)
+        if handler is not None:
+            await handler(client, packet)
         else:
             await self._send_error(
                 client,
@@ -364,6 +521,14 @@ class AsyncServer:
                 f"Unknown packet type: {packet.packet_type}"
             )
 
+    async def _handle_disconnect(
+        self,
+        client: AsyncServerClientConnection,
+        packet: Packet
+    ) -> None:
+        """Handle disconnect request."""
+        client.connected = False
+
     async def _handle_handshake(
         self,
         client: AsyncServerClientConnection,
@@ -372,16 +537,10 @@ class AsyncServer:
         """Handle handshake request."""
         try:
             HandshakeRequest.from_packet(packet)
-
-            transactions = self._transactions.list_codes() if self.expose_transactions else []
-            response = HandshakeResponse(
-                server_name=self.name,
-                transactions=transactions
-            )
-            await self._send_packet(client, response.to_packet())
+            await self._send_packet(client, self._handshake_packet)
 
         except Exception as e:
-            self.logger.error(f"Handshake error: {e}")
+            self.logger.error("Handshake error: %s", e)
             await self._send_error(client, ErrorCode.PROTOCOL_ERROR, str(e))
 
     async def _handle_transaction(
@@ -394,14 +553,16 @@ class AsyncServer:
             call = TransactionCall.from_packet(packet)
             transaction_code = call.transaction_code
 
-            self.logger.info(
-                f"Transaction call '{transaction_code}' from {client.address[0]}:{client.address[1]}"
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "Transaction call '%s' from %s:%s",
+                    transaction_code, client.address[0], client.address[1]
+                )
 
             # Find transaction
             trans = self._transactions.get(transaction_code)
             if not trans:
-                self.logger.info(f"Unknown transaction: {transaction_code}")
+                self.logger.info("Unknown transaction: %s", transaction_code)
                 await self._send_result(client, TransactionResult(
                     success=False,
                     error_code=ErrorCode.UNKNOWN_TRANSACTION,
@@ -411,9 +572,9 @@ class AsyncServer:
 
             # Prepare arguments with type conversion
             try:
-                prepared_args = prepare_arguments(trans.func, call.arguments)
+                prepared_args = trans.convert(call.arguments)
             except Exception as e:
-                self.logger.error(f"Argument preparation error: {e}")
+                self.logger.error("Argument preparation error: %s", e)
                 await self._send_result(client, TransactionResult(
                     success=False,
                     error_code=ErrorCode.INVALID_ARGUMENTS,
@@ -424,16 +585,16 @@ class AsyncServer:
             # Execute transaction
             try:
                 # Support both sync and async handlers
-                if asyncio.iscoroutinefunction(trans.func):
+                if trans.is_async:
                     result = await trans.func(**prepared_args)
                 else:
                     # Run sync function in executor to avoid blocking
-                    loop = asyncio.get_running_loop()
-                    result = await loop.run_in_executor(
+                    result = await self._loop.run_in_executor(
                         None, lambda: trans.func(**prepared_args)
                     )
 
-                self.logger.debug(f"Transaction '{transaction_code}' completed successfully")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Transaction '%s' completed successfully", transaction_code)
                 await self._send_result(client, TransactionResult(
                     success=True,
                     result=result,
@@ -441,7 +602,7 @@ class AsyncServer:
                 ))
 
             except Exception as e:
-                self.logger.error(f"Transaction execution error: {e}")
+                self.logger.error("Transaction execution error: %s", e)
                 await self._send_result(client, TransactionResult(
                     success=False,
                     error_code=ErrorCode.EXECUTION_ERROR,
@@ -449,8 +610,13 @@ class AsyncServer:
                 ))
 
         except Exception as e:
-            self.logger.error(f"Transaction handling error: {e}")
-            await self._send_error(client, ErrorCode.INTERNAL_ERROR, str(e))
+            self.logger.error("Transaction handling error: %s", e)
+            # Answered as a result, so the client can match it to its call
+            await self._send_result(client, TransactionResult(
+                success=False,
+                error_code=ErrorCode.INTERNAL_ERROR,
+                error_message=str(e)
+            ))
 
     async def _handle_subscribe(
         self,
@@ -464,14 +630,14 @@ class AsyncServer:
             event_type = request.event_type
 
             self.logger.info(
-                f"Subscribe request '{event_type}' (id={subscription_id}) "
-                f"from {client.address[0]}:{client.address[1]}"
+                "Subscribe request '%s' (id=%s) from %s:%s",
+                event_type, subscription_id, client.address[0], client.address[1]
             )
 
             # Find subscription handler
             sub = self._subscriptions.get(event_type)
             if not sub:
-                self.logger.info(f"Unknown subscription: {event_type}")
+                self.logger.info("Unknown subscription: %s", event_type)
                 await self._send_subscribe_error(
                     client, subscription_id,
                     ErrorCode.UNKNOWN_TRANSACTION,
@@ -481,9 +647,9 @@ class AsyncServer:
 
             # Prepare arguments
             try:
-                prepared_args = prepare_arguments(sub.func, request.arguments)
+                prepared_args = sub.convert(request.arguments)
             except Exception as e:
-                self.logger.error(f"Subscription argument preparation error: {e}")
+                self.logger.error("Subscription argument preparation error: %s", e)
                 await self._send_subscribe_error(
                     client, subscription_id,
                     ErrorCode.INVALID_ARGUMENTS,
@@ -498,7 +664,7 @@ class AsyncServer:
                 )
 
                 # Register active subscription
-                await self._active_subscriptions.add(
+                self._active_subscriptions.add(
                     subscription_id=subscription_id,
                     event_type=event_type,
                     client_address=client.address,
@@ -509,7 +675,7 @@ class AsyncServer:
                 client.read_timeout = None
 
             except Exception as e:
-                self.logger.error(f"Subscription start error: {e}")
+                self.logger.error("Subscription start error: %s", e)
                 await self._send_subscribe_error(
                     client, subscription_id,
                     ErrorCode.EXECUTION_ERROR,
@@ -517,7 +683,7 @@ class AsyncServer:
                 )
 
         except Exception as e:
-            self.logger.error(f"Subscribe handling error: {e}")
+            self.logger.error("Subscribe handling error: %s", e)
             await self._send_error(client, ErrorCode.INTERNAL_ERROR, str(e))
 
     async def _run_subscription(
@@ -530,7 +696,7 @@ class AsyncServer:
         """Run subscription generator and send data to client."""
         try:
             # Get the active subscription to check cancellation
-            active_sub = await self._active_subscriptions.get(subscription_id)
+            active_sub = self._active_subscriptions.get(subscription_id)
 
             if sub.is_async:
                 # Async generator
@@ -538,23 +704,22 @@ class AsyncServer:
                     if (active_sub and active_sub.is_cancelled) or not client.connected or not self._running:
                         break
 
-                    msg = SubscribeData(subscription_id=subscription_id, data=data)
-                    await self._send_packet(client, msg.to_packet())
+                    await self._send_subscription_data(client, subscription_id, data)
             else:
-                # Sync generator - run in executor
-                loop = asyncio.get_running_loop()
-                generator = sub.func(**prepared_args)
+                # Sync generator - pumped by a dedicated thread
+                pump = _SyncGeneratorPump(
+                    sub.func(**prepared_args), self._loop, self.sync_subscription_prefetch
+                )
+                pump.start(name=f"htcp-subscription-{subscription_id}")
 
-                while True:
-                    if (active_sub and active_sub.is_cancelled) or not client.connected or not self._running:
-                        break
+                try:
+                    async for data in pump:
+                        if (active_sub and active_sub.is_cancelled) or not client.connected or not self._running:
+                            break
 
-                    try:
-                        data = await loop.run_in_executor(None, next, generator)
-                        msg = SubscribeData(subscription_id=subscription_id, data=data)
-                        await self._send_packet(client, msg.to_packet())
-                    except StopIteration:
-                        break
+                        await self._send_subscription_data(client, subscription_id, data)
+                finally:
+                    pump.close()
 
             # Send end of subscription
             if client.connected and self._running:
@@ -565,7 +730,7 @@ class AsyncServer:
             # Subscription was cancelled
             pass
         except Exception as e:
-            self.logger.error(f"Subscription '{subscription_id}' error: {e}")
+            self.logger.error("Subscription '%s' error: %s", subscription_id, e)
             if client.connected:
                 await self._send_subscribe_error(
                     client, subscription_id,
@@ -573,8 +738,8 @@ class AsyncServer:
                     str(e)
                 )
         finally:
-            await self._active_subscriptions.remove(subscription_id)
-            self.logger.debug(f"Subscription '{subscription_id}' ended")
+            self._active_subscriptions.remove(subscription_id)
+            self.logger.debug("Subscription '%s' ended", subscription_id)
 
     async def _handle_unsubscribe(
         self,
@@ -587,17 +752,17 @@ class AsyncServer:
             subscription_id = request.subscription_id
 
             self.logger.info(
-                f"Unsubscribe request (id={subscription_id}) "
-                f"from {client.address[0]}:{client.address[1]}"
+                "Unsubscribe request (id=%s) from %s:%s",
+                subscription_id, client.address[0], client.address[1]
             )
 
-            active_sub = await self._active_subscriptions.remove(subscription_id)
+            active_sub = self._active_subscriptions.remove(subscription_id)
             if active_sub:
                 active_sub.cancel()
-                self.logger.debug(f"Cancelled subscription '{subscription_id}'")
+                self.logger.debug("Cancelled subscription '%s'", subscription_id)
 
         except Exception as e:
-            self.logger.error(f"Unsubscribe handling error: {e}")
+            self.logger.error("Unsubscribe handling error: %s", e)
 
     async def _send_packet(
         self,
@@ -606,11 +771,40 @@ class AsyncServer:
     ) -> None:
         """Send packet to client."""
         try:
-            await send_packet(client.writer, packet, client.write_timeout)
+            await client.send(packet)
         except Exception as e:
-            self.logger.error(f"Error sending packet: {e}")
+            self.logger.error("Error sending packet: %s", e)
             client.connected = False
 
+    async def _send_packets(
+        self,
+        client: AsyncServerClientConnection,
+        packets: List[Packet]
+    ) -> None:
+        """Send several packets to client with a single write-buffer check."""
+        try:
+            await client.send_many(packets)
+        except Exception as e:
+            self.logger.error("Error sending packet: %s", e)
+            client.connected = False
+
+    async def _send_subscription_data(
+        self,
+        client: AsyncServerClientConnection,
+        subscription_id: str,
+        data: Any
+    ) -> None:
+        """Send one yielded subscription item, or every item of a SubscriptionBatch."""
+        if not isinstance(data, SubscriptionBatch):
+            msg = SubscribeData(subscription_id=subscription_id, data=data)
+            await self._send_packet(client, msg.to_packet())
+            return
+
+        await self._send_packets(client, [
+            SubscribeData(subscription_id=subscription_id, data=item).to_packet()
+            for item in data
+        ])
+
     async def _send_result(
         self,
         client: AsyncServerClientConnection,
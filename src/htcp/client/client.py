@@ -5,22 +5,23 @@ TCP client for connecting to HTCP servers.
 
 import logging
 import uuid
+import itertools
 from typing import Any, Dict, Iterator, Optional, Type
 
 from ..common.constants import DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT, DEFAULT_WRITE_TIMEOUT
 from ..common.proto import Packet, PacketType
 from ..common.messages import (
-    HandshakeRequest,
     HandshakeResponse,
     TransactionCall,
     TransactionResult,
     ErrorPacket,
-    DisconnectPacket,
     SubscribeRequest,
     UnsubscribeRequest,
     SubscribeData,
     SubscribeEnd,
     SubscribeError,
+    HANDSHAKE_REQUEST_PACKET,
+    DISCONNECT_PACKET,
 )
 from ..common.utils import convert_to_type
 from ..exceptions import ConnectionError as HTCPConnectionError
@@ -171,7 +172,12 @@ class Client:
             write_timeout,
         )
         self._server_name = "unknown"
-        self._available_transactions: list[str] = []
+        self._available_transactions: tuple[str, ...] = ()
+
+        # Subscription IDs: one random prefix per client plus a counter,
+        # unique across the server's clients without a uuid4() per subscribe
+        self._subscription_prefix = uuid.uuid4().hex
+        self._subscription_counter = itertools.count(1)
 
     @property
     def connected(self) -> bool:
@@ -203,8 +209,7 @@ class Client:
 
         try:
             # Send disconnect packet
-            packet = DisconnectPacket().to_packet()
-            self._connection.send(packet)
+            self._connection.send(DISCONNECT_PACKET)
         except Exception:
             pass
 
@@ -214,13 +219,12 @@ class Client:
     def _cleanup(self) -> None:
         """Clean up connection resources."""
         self._server_name = "unknown"
-        self._available_transactions = []
+        self._available_transactions = ()
         self._connection.disconnect()
 
     def _handshake(self) -> None:
         """Perform handshake with server."""
-        request = HandshakeRequest()
-        self._connection.send(request.to_packet())
+        self._connection.send(HANDSHAKE_REQUEST_PACKET)
 
         response_packet = self._connection.receive()
 
@@ -233,7 +237,7 @@ class Client:
 
         response = HandshakeResponse.from_packet(response_packet)
         self._server_name = response.server_name
-        self._available_transactions = response.transactions
+        self._available_transactions = tuple(response.transactions)
 
     def server_info(self) -> Dict[str, Any]:
         """
@@ -242,14 +246,15 @@ class Client:
         Returns:
             Dict with server_name, server_addr (host, port), and connected status
         """
+        connected = self._connection.connected
         return {
             "server_name": self._server_name,
             "server_addr": {
-                "host": self.server_host if self._connection.connected else "unknown",
-                "port": self.server_port if self._connection.connected else 0
+                "host": self.server_host if connected else "unknown",
+                "port": self.server_port if connected else 0
             },
-            "connected": self._connection.connected,
-            "available_transactions": self._available_transactions
+            "connected": connected,
+            "available_transactions": list(self._available_transactions)
         }
 
     def call(self, transaction: str, result_type: Type = None, **kwargs) -> Any:
@@ -285,9 +290,9 @@ class Client:
         self._connection.send(call.to_packet())
 
         if self.logger.isEnabledFor(logging.DEBUG):
-            self.logger.debug(f"Called transaction '{transaction}' with args: {kwargs}")
+            self.logger.debug("Called transaction '%s' with args: %s", transaction, kwargs)
         else:
-            self.logger.info(f"Called transaction '{transaction}'")
+            self.logger.info("Called transaction '%s'", transaction)
 
         # Receive response
         response_packet = self._connection.receive()
@@ -340,7 +345,7 @@ class Client:
         if not self._connection.connected:
             raise HTCPConnectionError("Not connected to server")
 
-        subscription_id = str(uuid.uuid4())
+        subscription_id = f"{self._subscription_prefix}-{next(self._subscription_counter)}"
 
         # Send subscribe request
         request = SubscribeRequest(
@@ -351,9 +356,9 @@ class Client:
         self._connection.send(request.to_packet())
 
         if self.logger.isEnabledFor(logging.DEBUG):
-            self.logger.debug(f"Subscribed to '{event_type}' with args: {kwargs}")
+            self.logger.debug("Subscribed to '%s' with args: %s", event_type, kwargs)
         else:
-            self.logger.info(f"Subscribed to '{event_type}'")
+            self.logger.info("Subscribed to '%s'", event_type)
 
         return SubscriptionIterator(
             client=self,
@@ -5,11 +5,18 @@ Thread-safe connection management for client.
 
 import socket
 import threading
+
+from collections import deque
 from typing import Optional
 
-from ..common.constants import DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT, DEFAULT_WRITE_TIMEOUT
+from ..common.constants import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_WRITE_TIMEOUT,
+    RECV_CHUNK_SIZE,
+)
 from ..common.proto import Packet
-from ..common.transport import recv_packet, send_packet
+from ..common.transport import send_packet, parse_packets, configure_socket
 from ..exceptions import ConnectionError as HTCPConnectionError
 
 
@@ -39,6 +46,12 @@ class ClientConnection:
         self._connected = False
         self._lock = threading.RLock()
 
+        # Greedy read state: one recv may deliver several frames
+        self._recv_buffer = bytearray()
+        self._recv_chunk = bytearray(RECV_CHUNK_SIZE)
+        self._recv_view = memoryview(self._recv_chunk)
+        self._ready: deque[Packet] = deque()
+
     @property
     def host(self) -> str:
         return self._host
@@ -72,6 +85,7 @@ class ClientConnection:
                     self._socket.settimeout(self._connect_timeout)
 
                 self._socket.connect((self._host, self._port))
+                configure_socket(self._socket)
 
                 # Set read/write timeout after connection
                 timeout = max(
@@ -128,13 +142,32 @@ class ClientConnection:
             if not self._connected or self._socket is None:
                 raise HTCPConnectionError("Not connected")
             try:
-                return recv_packet(self._socket)
+                return self._read_packet()
             except Exception as e:
                 self._connected = False
                 raise HTCPConnectionError(f"Receive failed: {e}") from e
 
+    def _read_packet(self) -> Packet:
+        """
+        Return the next packet, reading as much as is available per recv.
+
+        Frames that arrive together are parsed at once and served from
+        the ready queue without further syscalls.
+        """
+        while not self._ready:
+            received = self._socket.recv_into(self._recv_view)
+            if not received:
+                raise HTCPConnectionError("Connection closed by peer")
+
+            self._recv_buffer += self._recv_view[:received]
+            self._ready.extend(parse_packets(self._recv_buffer))
+
+        return self._ready.popleft()
+
     def _cleanup_socket(self) -> None:
         """Clean up socket resources."""
+        self._recv_buffer.clear()
+        self._ready.clear()
         if self._socket is not None:
             try:
                 self._socket.close()
@@ -5,9 +5,12 @@ from .constants import (
     PROTOCOL_VERSION,
     HEADER_SIZE,
     MAX_PAYLOAD_SIZE,
+    RECV_CHUNK_SIZE,
+    SOCKET_BUFFER_SIZE,
     DEFAULT_CONNECT_TIMEOUT,
     DEFAULT_READ_TIMEOUT,
     DEFAULT_WRITE_TIMEOUT,
+    DEFAULT_CLOSE_GRACE,
     DEFAULT_LISTEN_BACKLOG,
     DEFAULT_MAX_CONNECTIONS,
 )
@@ -26,14 +29,29 @@ from .messages import (
     SubscribeEnd,
     SubscribeError,
 )
-from .transport import recv_exact, recv_packet, send_packet
-from .utils import get_function_signature, get_return_type, convert_to_type
+from .transport import (
+    recv_exact,
+    recv_packet,
+    send_packet,
+    send_packets,
+    parse_packets,
+    configure_socket,
+)
+from .utils import (
+    get_function_signature,
+    get_return_type,
+    convert_to_type,
+    convert_arguments,
+    build_arg_plan,
+    build_converter,
+    ArgPlan,
+)
 
 __all__ = [
     # Constants
     'MAGIC_BYTES', 'PROTOCOL_VERSION', 'HEADER_SIZE', 'MAX_PAYLOAD_SIZE',
-    'DEFAULT_CONNECT_TIMEOUT', 'DEFAULT_READ_TIMEOUT', 'DEFAULT_WRITE_TIMEOUT',
-    'DEFAULT_LISTEN_BACKLOG', 'DEFAULT_MAX_CONNECTIONS',
+    'RECV_CHUNK_SIZE', 'SOCKET_BUFFER_SIZE', 'DEFAULT_CONNECT_TIMEOUT', 'DEFAULT_READ_TIMEOUT', 'DEFAULT_WRITE_TIMEOUT',
+    'DEFAULT_CLOSE_GRACE', 'DEFAULT_LISTEN_BACKLOG', 'DEFAULT_MAX_CONNECTIONS',
     # Serialization
     'serialize', 'deserialize', 'TypeTag',
     # Protocol
@@ -44,7 +62,9 @@ __all__ = [
     'SubscribeRequest', 'UnsubscribeRequest', 'SubscribeData',
     'SubscribeEnd', 'SubscribeError',
     # Transport
-    'recv_exact', 'recv_packet', 'send_packet',
+    'recv_exact', 'recv_packet', 'send_packet', 'send_packets', 'parse_packets',
+    'configure_socket',
     # Utils
-    'get_function_signature', 'get_return_type', 'convert_to_type',
+    'get_function_signature', 'get_return_type', 'convert_to_type', 'convert_arguments',
+    'build_arg_plan', 'build_converter', 'ArgPlan',
 ]
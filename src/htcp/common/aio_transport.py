@@ -4,16 +4,13 @@ Asynchronous I/O operations for HTCP protocol.
 """
 
 import asyncio
-import struct
-from typing import Optional
+from collections import deque
+from typing import Deque, List, Optional
 
-from .constants import MAGIC_BYTES, PROTOCOL_VERSION, HEADER_SIZE, MAX_PAYLOAD_SIZE
-from ..exceptions import (
-    ConnectionError as HTCPConnectionError,
-    ProtocolError,
-    MaxPayloadExceededError,
-    UnknownPacketTypeError,
-)
+from .constants import HEADER_SIZE, MAX_PAYLOAD_SIZE
+from .proto import Packet
+from .transport import unpack_header, parse_packets
+from ..exceptions import ConnectionError as HTCPConnectionError
 
 
 async def recv_exact(
@@ -72,34 +69,9 @@ async def recv_packet(
         MaxPayloadExceededError: If payload exceeds max size
         UnknownPacketTypeError: If packet type is unknown
     """
-    from .proto import Packet, PacketType
-
     # Read header
     header = await recv_exact(reader, HEADER_SIZE, timeout)
-
-    # Validate magic bytes
-    magic = header[:4]
-    if magic != MAGIC_BYTES:
-        raise ProtocolError(f"Invalid magic bytes: {magic!r}")
-
-    # Validate version
-    version = header[4]
-    if version != PROTOCOL_VERSION:
-        raise ProtocolError(f"Unsupported protocol version: {version}")
-
-    # Parse packet type with validation
-    packet_type_byte = header[5]
-    try:
-        packet_type = PacketType(packet_type_byte)
-    except ValueError:
-        raise UnknownPacketTypeError(packet_type_byte)
-
-    # Parse payload length
-    payload_length = struct.unpack('>I', header[6:10])[0]
-
-    # Validate payload size
-    if payload_length > max_payload_size:
-        raise MaxPayloadExceededError(payload_length, max_payload_size)
+    packet_type, payload_length = unpack_header(header, max_payload_size)
 
     # Read payload
     payload = b''
@@ -126,7 +98,12 @@ async def send_packet(
         HTCPConnectionError: If connection is closed
     """
     try:
-        writer.write(packet.to_bytes())
+        # Hand header and payload over separately; the transport can send
+        # them without joining into a new buffer first
+        if packet.payload:
+            writer.writelines((packet.header(), packet.payload))
+        else:
+            writer.write(packet.header())
         if timeout is not None:
             await asyncio.wait_for(writer.drain(), timeout=timeout)
         else:
@@ -135,3 +112,182 @@ async def send_packet(
         raise HTCPConnectionError(f"Failed to send packet: {e}") from e
     except asyncio.TimeoutError:
         raise HTCPConnectionError("Write timeout") from None
+
+
+class HTCPProtocol(asyncio.Protocol):
+    """
+    Packet-level asyncio protocol for a single HTCP connection.
+
+    Incoming bytes are split into packets directly in data_received() and
+    handed to receivers in arrival order, without the per-read task and
+    future layers of StreamReader. Writes go straight into the transport
+    buffer; only a full buffer (paused writing) makes a sender wait.
+    """
+
+    def __init__(self, max_payload_size: int = MAX_PAYLOAD_SIZE):
+        self._max_payload_size = max_payload_size
+        self._transport: Optional[asyncio.Transport] = None
+        self._buffer = bytearray()
+        self._packets: Deque[Packet] = deque()  # Parsed, not yet received
+        self._waiters: Deque[asyncio.Future] = deque()  # Receivers waiting for a packet
+        self._closed_reason: Optional[str] = None
+        self._paused = False
+        self._drain_waiters: Deque[asyncio.Future] = deque()
+        self._closed = asyncio.get_running_loop().create_future()
+
+    @property
+    def transport(self) -> Optional[asyncio.Transport]:
+        return self._transport
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = transport
+
+    def data_received(self, data: bytes) -> None:
+        self._buffer += data
+        try:
+            packets = parse_packets(self._buffer, self._max_payload_size)
+        except Exception as e:
+            self._fail(f"Invalid packet: {e}")
+            self._transport.close()
+            return
+
+        for packet in packets:
+            self._deliver(packet)
+
+    def eof_received(self) -> Optional[bool]:
+        # Let the transport close itself; connection_lost() fails the waiters
+        return None
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self._fail("Connection closed" if exc is None else f"Connection lost: {exc}")
+        self._transport = None
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+    def pause_writing(self) -> None:
+        self._paused = True
+
+    def resume_writing(self) -> None:
+        self._paused = False
+        while self._drain_waiters:
+            waiter = self._drain_waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _deliver(self, packet: Packet) -> None:
+        """Hand a packet to the oldest waiting receiver, or queue it."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            # Skip receivers that timed out or were cancelled
+            if not waiter.done():
+                waiter.set_result(packet)
+                return
+        self._packets.append(packet)
+
+    def _fail(self, reason: str) -> None:
+        """Mark the connection closed and fail all waiting receivers and senders."""
+        if self._closed_reason is None:
+            self._closed_reason = reason
+        for waiters in (self._waiters, self._drain_waiters):
+            while waiters:
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    waiter.set_exception(HTCPConnectionError(self._closed_reason))
+
+    async def wait_closed(self) -> None:
+        """Wait until the connection is closed."""
+        await asyncio.shield(self._closed)
+
+    async def receive(self, timeout: Optional[float] = None) -> Packet:
+        """
+        Receive the next packet.
+
+        Packets already received are returned even after the connection closed.
+
+        Args:
+            timeout: Optional timeout in seconds
+
+        Returns:
+            Received Packet object
+
+        Raises:
+            HTCPConnectionError: If connection is closed, data is malformed or read times out
+        """
+        if self._packets:
+            return self._packets.popleft()
+        if self._closed_reason is not None:
+            raise HTCPConnectionError(self._closed_reason)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            if timeout is not None:
+                return await asyncio.wait_for(waiter, timeout=timeout)
+            return await waiter
+        except asyncio.TimeoutError:
+            raise HTCPConnectionError("Read timeout") from None
+
+    async def send(self, packet: Packet, timeout: Optional[float] = None) -> None:
+        """
+        Send a packet.
+
+        Args:
+            packet: Packet to send
+            timeout: Optional timeout in seconds for a full write buffer to drain
+
+        Raises:
+            HTCPConnectionError: If connection is closed or write times out
+        """
+        transport = self._writable_transport()
+
+        if packet.payload:
+            transport.writelines((packet.header(), packet.payload))
+        else:
+            transport.write(packet.header())
+
+        if self._paused:
+            await self._wait_drained(timeout)
+
+    async def send_many(self, packets: List[Packet], timeout: Optional[float] = None) -> None:
+        """
+        Send several packets with a single transport write.
+
+        Args:
+            packets: Packets to send, in order
+            timeout: Optional timeout in seconds for a full write buffer to drain
+
+        Raises:
+            HTCPConnectionError: If connection is closed or write times out
+        """
+        transport = self._writable_transport()
+
+        parts = []
+        for packet in packets:
+            parts.append(packet.header())
+            if packet.payload:
+                parts.append(packet.payload)
+        transport.writelines(parts)
+
+        if self._paused:
+            await self._wait_drained(timeout)
+
+    def _writable_transport(self) -> asyncio.Transport:
+        """Get the transport, failing if the connection is closed."""
+        if self._closed_reason is not None:
+            raise HTCPConnectionError(self._closed_reason)
+        transport = self._transport
+        if transport is None or transport.is_closing():
+            raise HTCPConnectionError("Not connected")
+        return transport
+
+    async def _wait_drained(self, timeout: Optional[float]) -> None:
+        """Wait until the transport resumes writing."""
+        waiter = asyncio.get_running_loop().create_future()
+        self._drain_waiters.append(waiter)
+        try:
+            if timeout is not None:
+                await asyncio.wait_for(waiter, timeout=timeout)
+            else:
+                await waiter
+        except asyncio.TimeoutError:
+            raise HTCPConnectionError("Write timeout") from None
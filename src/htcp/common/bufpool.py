@@ -0,0 +1,61 @@
+"""
+HTCP Buffer Pool Module
+Free-list of reusable receive buffers.
+"""
+
+import threading
+
+from collections import deque
+
+from .constants import RECV_CHUNK_SIZE
+
+
+class BufferPool:
+    """
+    Thread-safe free-list of fixed-size bytearray buffers.
+
+    Connections acquire a buffer when they open and release it when they
+    close, so steady connection churn reuses memory instead of allocating
+    a fresh buffer per client.
+    """
+
+    def __init__(self, buffer_size: int, max_free: int = 64):
+        """
+        Initialize buffer pool.
+
+        Args:
+            buffer_size: Size of every buffer in bytes
+            max_free: Maximum number of idle buffers kept for reuse
+        """
+        self._buffer_size = buffer_size
+        self._max_free = max_free
+        self._free: deque[bytearray] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def buffer_size(self) -> int:
+        """Get size of pooled buffers."""
+        return self._buffer_size
+
+    def acquire(self) -> bytearray:
+        """Take a buffer from the pool, allocating one if none is free."""
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+        return bytearray(self._buffer_size)
+
+    def release(self, buffer: bytearray) -> None:
+        """Return a buffer to the pool."""
+        if len(buffer) != self._buffer_size:
+            return
+        with self._lock:
+            if len(self._free) < self._max_free:
+                self._free.append(buffer)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._free)
+
+
+# Shared pool for per-connection socket receive buffers
+recv_buffer_pool = BufferPool(RECV_CHUNK_SIZE)
@@ -13,10 +13,15 @@ HEADER_SIZE = 12  # MAGIC(4) + VERSION(1) + TYPE(1) + LENGTH(4) + RESERVED(2)
 # Payload limits
 MAX_PAYLOAD_SIZE = 16 * 1024 * 1024  # 16 MB default max payload
 
+# Socket I/O
+RECV_CHUNK_SIZE = 64 * 1024  # Max bytes read per socket readiness event
+SOCKET_BUFFER_SIZE = 256 * 1024  # Kernel SO_SNDBUF / SO_RCVBUF size
+
 # Timeouts (in seconds)
 DEFAULT_CONNECT_TIMEOUT = 30.0
 DEFAULT_READ_TIMEOUT = 60.0
 DEFAULT_WRITE_TIMEOUT = 60.0
+DEFAULT_CLOSE_GRACE = 0.5  # Wait for buffered data to flush on close before aborting
 
 # Server configuration
 DEFAULT_LISTEN_BACKLOG = 128
@@ -5,15 +5,20 @@ High-level message types for HTCP protocol.
 
 from typing import Any, Dict
 
-from .proto import Packet, PacketType, ErrorCode
+from .proto import Packet, PacketType, ErrorCode, to_error_code
 from .serialization import serialize, deserialize
 
 
+# Control packets without payload are the same every time, so they're built once
+HANDSHAKE_REQUEST_PACKET = Packet(PacketType.HANDSHAKE_REQUEST, b'')
+DISCONNECT_PACKET = Packet(PacketType.DISCONNECT, b'')
+
+
 class HandshakeRequest:
     """Handshake request from client to server."""
 
     def to_packet(self) -> Packet:
-        return Packet(PacketType.HANDSHAKE_REQUEST, b'')
+        return HANDSHAKE_REQUEST_PACKET
 
     @classmethod
     def from_packet(cls, packet: Packet) -> 'HandshakeRequest':
@@ -91,7 +96,7 @@ class TransactionResult:
         return Packet(PacketType.TRANSACTION_RESULT, payload)
 
     @classmethod
-    def from_packet(cls, packet: Packet, result_type=None) -> 'TransactionResult':
+    def from_packet(cls, packet: Packet) -> 'TransactionResult':
         data, _ = deserialize(packet.payload)
 
         result = data.get("result")
@@ -99,7 +104,7 @@ class TransactionResult:
         return cls(
             success=data.get("success", False),
             result=result,
-            error_code=ErrorCode(data.get("error_code", 0)),
+            error_code=to_error_code(data.get("error_code", 0)),
             error_message=data.get("error_message", "")
         )
 
@@ -122,7 +127,7 @@ class ErrorPacket:
     def from_packet(cls, packet: Packet) -> 'ErrorPacket':
         data, _ = deserialize(packet.payload)
         return cls(
-            error_code=ErrorCode(data.get("error_code", 0)),
+            error_code=to_error_code(data.get("error_code", 0)),
             message=data.get("message", "")
         )
 
@@ -131,7 +136,7 @@ class DisconnectPacket:
     """Disconnect notification packet."""
 
     def to_packet(self) -> Packet:
-        return Packet(PacketType.DISCONNECT, b'')
+        return DISCONNECT_PACKET
 
     @classmethod
     def from_packet(cls, packet: Packet) -> 'DisconnectPacket':
@@ -244,6 +249,6 @@ class SubscribeError:
         data, _ = deserialize(packet.payload)
         return cls(
             subscription_id=data.get("subscription_id", ""),
-            error_code=ErrorCode(data.get("error_code", 0)),
+            error_code=to_error_code(data.get("error_code", 0)),
             message=data.get("message", "")
         )
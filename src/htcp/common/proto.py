@@ -3,6 +3,7 @@ HTCP Protocol Module
 Defines the binary protocol format for client-server communication.
 """
 
+import socket
 import struct
 import warnings
 
@@ -13,6 +14,18 @@ from .serialization import serialize, deserialize
 from .constants import MAGIC_BYTES, PROTOCOL_VERSION, HEADER_SIZE, MAX_PAYLOAD_SIZE
 
 
+# MAGIC(4) + VERSION(1) + TYPE(1) + LENGTH(4) + RESERVED(2)
+HEADER_STRUCT = struct.Struct('>4sBBIH')
+_HEADER_PLACEHOLDER = bytes(HEADER_STRUCT.size)  # Reserves header space in append_to()
+
+# Same layout with MAGIC+VERSION read as one field, so a valid header
+# is checked with a single compare against HEADER_PREFIX
+HEADER_CHECK_STRUCT = struct.Struct('>5sBIH')
+HEADER_PREFIX = MAGIC_BYTES + bytes([PROTOCOL_VERSION])
+
+_HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
+
+
 class PacketType(IntEnum):
     """Types of packets in HTCP protocol."""
     # Client -> Server
@@ -31,6 +44,7 @@ class PacketType(IntEnum):
     SUBSCRIBE_ERROR = 0x16
 
 
+
 class ErrorCode(IntEnum):
     """Error codes for protocol errors."""
     SUCCESS = 0
@@ -41,6 +55,32 @@ class ErrorCode(IntEnum):
     INTERNAL_ERROR = 5
 
 
+def _build_lookup(enum_cls) -> tuple:
+    """Build a 256-slot wire value -> member table (None for unknown values)."""
+    table = [None] * 256
+    for member in enum_cls:
+        table[member.value] = member
+    return tuple(table)
+
+
+# Indexing these is much cheaper than calling the IntEnum constructor
+PACKET_TYPES = _build_lookup(PacketType)
+ERROR_CODES = _build_lookup(ErrorCode)
+
+
+def to_error_code(value: int) -> ErrorCode:
+    """
+    Resolve a wire error code to its ErrorCode member.
+
+    Raises:
+        ValueError: If value is not a known error code
+    """
+    member = ERROR_CODES[value] if 0 <= value < 256 else None
+    if member is None:
+        raise ValueError(f"{value} is not a valid ErrorCode")
+    return member
+
+
 class Packet:
     """
     HTCP Protocol Packet.
@@ -52,20 +92,64 @@ class Packet:
     +--------+--------+------+--------+----------+---------+
     """
 
-    def __init__(self, packet_type: PacketType, payload: bytes = b''):
+    __slots__ = ('packet_type', 'payload')
+
+    def __init__(self, packet_type: PacketType, payload: bytes | memoryview = b''):
         self.packet_type = packet_type
         self.payload = payload
 
+    def header(self) -> bytes:
+        """Serialize packet header to bytes."""
+        return HEADER_STRUCT.pack(
+            MAGIC_BYTES,
+            PROTOCOL_VERSION,
+            self.packet_type,
+            len(self.payload),
+            0  # Reserved bytes
+        )
+
     def to_bytes(self) -> bytes:
         """Serialize packet to bytes."""
-        header = (
-            MAGIC_BYTES +
-            struct.pack('>B', PROTOCOL_VERSION) +
-            struct.pack('>B', self.packet_type) +
-            struct.pack('>I', len(self.payload)) +
-            b'\x00\x00'  # Reserved bytes
+        return self.header() + self.payload
+
+    def append_to(self, buffer: bytearray) -> None:
+        """
+        Append the serialized packet to a bytearray.
+
+        The header is packed in place, without building a separate header object.
+        """
+        offset = len(buffer)
+        buffer += _HEADER_PLACEHOLDER
+        HEADER_STRUCT.pack_into(
+            buffer,
+            offset,
+            MAGIC_BYTES,
+            PROTOCOL_VERSION,
+            self.packet_type,
+            len(self.payload),
+            0  # Reserved bytes
         )
-        return header + self.payload
+        if self.payload:
+            buffer += self.payload
+
+    def write_to(self, sock) -> None:
+        """
+        Send packet over a blocking socket without joining header and payload.
+
+        Uses scatter-gather sendmsg() where available so large payloads
+        are not copied into a new buffer before sending.
+        """
+        header = self.header()
+        if not self.payload or not _HAS_SENDMSG:
+            sock.sendall(header + self.payload)
+            return
+
+        sent = sock.sendmsg([header, self.payload])
+        if sent < HEADER_SIZE:
+            sock.sendall(header[sent:])
+            sent = HEADER_SIZE
+        if sent - HEADER_SIZE < len(self.payload):
+            sock.sendall(memoryview(self.payload)[sent - HEADER_SIZE:])
 
     @classmethod
     def from_bytes(cls, data: bytes) -> 'Packet':
@@ -73,21 +157,25 @@ class Packet:
         if len(data) < HEADER_SIZE:
             raise ValueError(f"Data too short for packet header: {len(data)} < {HEADER_SIZE}")
 
-        magic = data[:4]
-        if magic != MAGIC_BYTES:
-            raise ValueError(f"Invalid magic bytes: {magic}")
+        prefix, packet_type_byte, payload_length, _ = HEADER_CHECK_STRUCT.unpack_from(data)
 
-        version = data[4]
-        if version != PROTOCOL_VERSION:
-            raise ValueError(f"Unsupported protocol version: {version}")
+        if prefix != HEADER_PREFIX:
+            if prefix[:4] != MAGIC_BYTES:
+                raise ValueError(f"Invalid magic bytes: {prefix[:4]}")
+            raise ValueError(f"Unsupported protocol version: {prefix[4]}")
 
-        packet_type = PacketType(data[5])
-        payload_length = struct.unpack('>I', data[6:10])[0]
+        packet_type = PACKET_TYPES[packet_type_byte]
+        if packet_type is None:
+            raise ValueError(f"{packet_type_byte} is not a valid PacketType")
 
         if len(data) < HEADER_SIZE + payload_length:
             raise ValueError(f"Incomplete packet: expected {HEADER_SIZE + payload_length}, got {len(data)}")
 
-        payload = data[HEADER_SIZE:HEADER_SIZE + payload_length]
+        # Immutable input can be shared instead of copied
+        if isinstance(data, bytes):
+            payload = memoryview(data)[HEADER_SIZE:HEADER_SIZE + payload_length]
+        else:
+            payload = bytes(data[HEADER_SIZE:HEADER_SIZE + payload_length])
         return cls(packet_type, payload)
 
     @classmethod
@@ -182,24 +270,15 @@ class TransactionResult:
         return Packet(PacketType.TRANSACTION_RESULT, payload)
 
     @classmethod
-    def from_packet(cls, packet: Packet, result_type=None) -> 'TransactionResult':
+    def from_packet(cls, packet: Packet) -> 'TransactionResult':
         data, _ = deserialize(packet.payload)
 
         result = data.get("result")
 
-        # If we have an expected result type and result is dict-like from dataclass
-        if result_type is not None and result is not None:
-            from .serialization import deserialize as deser
-            import dataclasses
-            if dataclasses.is_dataclass(result_type) and isinstance(result, dict):
-                # Result was serialized as dataclass but came back as dict
-                # This happens when the result was serialized without type info
-                pass
-
         return cls(
             success=data.get("success", False),
             result=result,
-            error_code=ErrorCode(data.get("error_code", 0)),
+            error_code=to_error_code(data.get("error_code", 0)),
             error_message=data.get("error_message", "")
         )
 
@@ -222,6 +301,6 @@ class ErrorPacket:
     def from_packet(cls, packet: Packet) -> 'ErrorPacket':
         data, _ = deserialize(packet.payload)
         return cls(
-            error_code=ErrorCode(data.get("error_code", 0)),
+            error_code=to_error_code(data.get("error_code", 0)),
             message=data.get("message", "")
         )
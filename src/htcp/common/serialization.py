@@ -3,7 +3,9 @@ HTCP Serialization Module
 Supports automatic serialization/deserialization of all Python types.
 """
 
+import types
 import struct
+import functools
 import dataclasses
 
 from datetime import datetime, date, time, timedelta
@@ -68,27 +70,84 @@ class TypeTag:
     PYDANTIC_MODEL = 0x18
 
 
+# Precompiled codecs for fixed-size fields
+_INT64 = struct.Struct('>q')
+_DOUBLE = struct.Struct('>d')
+_COMPLEX = struct.Struct('>dd')
+_LENGTH = struct.Struct('>I')
+
+# Single-byte tag prefixes, built once instead of per value
+_NONE = bytes([TypeTag.NONE])
+_TRUE = bytes([TypeTag.BOOL_TRUE])
+_FALSE = bytes([TypeTag.BOOL_FALSE])
+_INT_TAG = bytes([TypeTag.INT])
+_INT_NEGATIVE_TAG = bytes([TypeTag.INT_NEGATIVE])
+_FLOAT_TAG = bytes([TypeTag.FLOAT])
+_STR_TAG = bytes([TypeTag.STR])
+_BYTES_TAG = bytes([TypeTag.BYTES])
+
+
+@functools.lru_cache(maxsize=None)
+def get_dataclass_fields(cls: Type) -> tuple[tuple[str, Type], ...]:
+    """
+    Get (field_name, resolved_type) pairs of a dataclass, cached per class.
+    Fields whose hints can't be resolved get Any.
+    """
+    try:
+        hints = get_type_hints(cls)
+    except Exception:
+        hints = {}
+    return tuple((field.name, hints.get(field.name, Any)) for field in dataclasses.fields(cls))
+
+
+@functools.lru_cache(maxsize=None)
+def _dataclass_field_types(cls: Type) -> dict[str, Type]:
+    """Get {field_name: resolved_type} of a dataclass, cached per class."""
+    return dict(get_dataclass_fields(cls))
+
+
+@functools.lru_cache(maxsize=None)
+def _dataclass_layout(cls: Type) -> tuple[bytes, tuple[tuple[str, bytes], ...]]:
+    """
+    Get the encoded header and per-field name prefixes of a dataclass.
+    These only depend on the class, so they are built once.
+    """
+    name_bytes = f"{cls.__module__}.{cls.__qualname__}".encode('utf-8')
+    fields = get_dataclass_fields(cls)
+
+    header = bytearray([TypeTag.DATACLASS])
+    header.extend(_pack_length(len(name_bytes)))
+    header.extend(name_bytes)
+    header.extend(_pack_length(len(fields)))
+
+    prefixes = []
+    for field_name, _ in fields:
+        encoded = field_name.encode('utf-8')
+        prefixes.append((field_name, _pack_length(len(encoded)) + encoded))
+
+    return bytes(header), tuple(prefixes)
+
+
 def serialize(obj: Any) -> bytes:
     """Serialize any Python object to bytes."""
     if obj is None:
-        return bytes([TypeTag.NONE])
+        return _NONE
 
     if isinstance(obj, bool):
-        return bytes([TypeTag.BOOL_TRUE if obj else TypeTag.BOOL_FALSE])
+        return _TRUE if obj else _FALSE
 
     if isinstance(obj, int):
         return _serialize_int(obj)
 
     if isinstance(obj, float):
-        data = struct.pack('>d', obj)
-        return bytes([TypeTag.FLOAT]) + data
+        return _FLOAT_TAG + _DOUBLE.pack(obj)
 
     if isinstance(obj, str):
         encoded = obj.encode('utf-8')
-        return bytes([TypeTag.STR]) + _pack_length(len(encoded)) + encoded
+        return _STR_TAG + _LENGTH.pack(len(encoded)) + encoded
 
     if isinstance(obj, bytes):
-        return bytes([TypeTag.BYTES]) + _pack_length(len(obj)) + obj
+        return _BYTES_TAG + _LENGTH.pack(len(obj)) + obj
 
     if isinstance(obj, list):
         return _serialize_sequence(obj, TypeTag.LIST)
@@ -138,14 +197,19 @@ def serialize(obj: Any) -> bytes:
     raise TypeError(f"Cannot serialize type: {type(obj)}")
 
 
-def deserialize(data: bytes, expected_type: Type = None) -> tuple[Any, int]:
+def deserialize(data: bytes | memoryview, expected_type: Type = None) -> tuple[Any, int]:
     """
     Deserialize bytes to Python object.
+    Accepts any bytes-like object; nested values are read through a
+    memoryview so walking containers does not copy the remaining data.
     Returns (object, bytes_consumed).
     """
     if not data:
         raise ValueError("Empty data")
 
+    if not isinstance(data, memoryview):
+        data = memoryview(data)
+
     tag = data[0]
     offset = 1
 
@@ -159,11 +223,11 @@ def deserialize(data: bytes, expected_type: Type = None) -> tuple[Any, int]:
         return False, offset
 
     if tag == TypeTag.INT:
-        value = struct.unpack('>q', data[offset:offset + 8])[0]
+        value = _INT64.unpack_from(data, offset)[0]
         return value, offset + 8
 
     if tag == TypeTag.INT_NEGATIVE:
-        value = struct.unpack('>q', data[offset:offset + 8])[0]
+        value = _INT64.unpack_from(data, offset)[0]
         return value, offset + 8
 
     if tag == TypeTag.INT_BIG:
@@ -179,19 +243,19 @@ def deserialize(data: bytes, expected_type: Type = None) -> tuple[Any, int]:
         return value, offset + length
 
     if tag == TypeTag.FLOAT:
-        value = struct.unpack('>d', data[offset:offset + 8])[0]
+        value = _DOUBLE.unpack_from(data, offset)[0]
         return value, offset + 8
 
     if tag == TypeTag.STR:
         length, len_size = _unpack_length(data[offset:])
         offset += len_size
-        value = data[offset:offset + length].decode('utf-8')
+        value = str(data[offset:offset + length], 'utf-8')
         return value, offset + length
 
     if tag == TypeTag.BYTES:
         length, len_size = _unpack_length(data[offset:])
         offset += len_size
-        value = data[offset:offset + length]
+        value = bytes(data[offset:offset + length])
         return value, offset + length
 
     if tag == TypeTag.LIST:
@@ -237,7 +301,7 @@ def deserialize(data: bytes, expected_type: Type = None) -> tuple[Any, int]:
         return _deserialize_complex(data, offset)
 
     if tag == TypeTag.UUID:
-        return UUID(bytes=data[offset:offset + 16]), offset + 16
+        return UUID(bytes=bytes(data[offset:offset + 16])), offset + 16
 
     if tag == TypeTag.ENUM:
         return _deserialize_enum(data, offset, expected_type)
@@ -247,12 +311,12 @@ def deserialize(data: bytes, expected_type: Type = None) -> tuple[Any, int]:
 
 def _pack_length(length: int) -> bytes:
     """Pack length as 4-byte big-endian."""
-    return struct.pack('>I', length)
+    return _LENGTH.pack(length)
 
 
 def _unpack_length(data: bytes) -> tuple[int, int]:
     """Unpack length, returns (length, bytes_consumed)."""
-    return struct.unpack('>I', data[:4])[0], 4
+    return _LENGTH.unpack_from(data)[0], 4
 
 
 def _serialize_int(obj: int) -> bytes:
@@ -260,9 +324,9 @@ def _serialize_int(obj: int) -> bytes:
     """
     if -9223372036854775808 <= obj <= 9223372036854775807:
         if obj >= 0:
-            return bytes([TypeTag.INT]) + struct.pack('>q', obj)
+            return _INT_TAG + _INT64.pack(obj)
         else:
-            return bytes([TypeTag.INT_NEGATIVE]) + struct.pack('>q', obj)
+            return _INT_NEGATIVE_TAG + _INT64.pack(obj)
     else:
         abs_val = abs(obj)
         byte_length = (abs_val.bit_length() + 7) // 8
@@ -343,21 +407,12 @@ def _deserialize_dict(data: bytes, offset: int, expected_type: Type = None) -> t
 
 def _serialize_dataclass(obj) -> bytes:
     """Serialize dataclass instance."""
-    cls = type(obj)
-    class_name = f"{cls.__module__}.{cls.__qualname__}"
-    name_bytes = class_name.encode('utf-8')
+    header, prefixes = _dataclass_layout(type(obj))
 
-    fields = dataclasses.fields(obj)
-    result = bytearray([TypeTag.DATACLASS])
-    result.extend(_pack_length(len(name_bytes)))
-    result.extend(name_bytes)
-    result.extend(_pack_length(len(fields)))
-
-    for field in fields:
-        field_name = field.name.encode('utf-8')
-        result.extend(_pack_length(len(field_name)))
-        result.extend(field_name)
-        result.extend(serialize(getattr(obj, field.name)))
+    result = bytearray(header)
+    for field_name, prefix in prefixes:
+        result.extend(prefix)
+        result.extend(serialize(getattr(obj, field_name)))
 
     return bytes(result)
 
@@ -366,7 +421,7 @@ def _deserialize_dataclass(data: bytes, offset: int, expected_type: Type = None)
     """Deserialize dataclass instance."""
     name_len, len_size = _unpack_length(data[offset:])
     offset += len_size
-    class_name = data[offset:offset + name_len].decode('utf-8')
+    class_name = str(data[offset:offset + name_len], 'utf-8')
     offset += name_len
 
     field_count, len_size = _unpack_length(data[offset:])
@@ -376,15 +431,12 @@ def _deserialize_dataclass(data: bytes, offset: int, expected_type: Type = None)
     field_types = {}
 
     if expected_type and dataclasses.is_dataclass(expected_type):
-        try:
-            field_types = get_type_hints(expected_type)
-        except Exception:
-            pass
+        field_types = _dataclass_field_types(expected_type)
 
     for _ in range(field_count):
         fname_len, len_size = _unpack_length(data[offset:])
         offset += len_size
-        field_name = data[offset:offset + fname_len].decode('utf-8')
+        field_name = str(data[offset:offset + fname_len], 'utf-8')
         offset += fname_len
 
         field_type = field_types.get(field_name)
@@ -428,7 +480,7 @@ def _deserialize_pydantic(data: bytes, offset: int, expected_type: Type = None)
 
     name_len, len_size = _unpack_length(data[offset:])
     offset += len_size
-    class_name = data[offset:offset + name_len].decode('utf-8')
+    class_name = str(data[offset:offset + name_len], 'utf-8')
     offset += name_len
 
     field_count, len_size = _unpack_length(data[offset:])
@@ -446,7 +498,7 @@ def _deserialize_pydantic(data: bytes, offset: int, expected_type: Type = None)
     for _ in range(field_count):
         fname_len, len_size = _unpack_length(data[offset:])
         offset += len_size
-        field_name = data[offset:offset + fname_len].decode('utf-8')
+        field_name = str(data[offset:offset + fname_len], 'utf-8')
         offset += fname_len
 
         field_type = field_types.get(field_name)
@@ -471,7 +523,7 @@ def _deserialize_datetime(data: bytes, offset: int) -> tuple[datetime, int]:
     """Deserialize datetime from ISO format string."""
     length, len_size = _unpack_length(data[offset:])
     offset += len_size
-    iso = data[offset:offset + length].decode('utf-8')
+    iso = str(data[offset:offset + length], 'utf-8')
     return datetime.fromisoformat(iso), offset + length
 
 
@@ -485,7 +537,7 @@ def _deserialize_date(data: bytes, offset: int) -> tuple[date, int]:
     """Deserialize date from ISO format string."""
     length, len_size = _unpack_length(data[offset:])
     offset += len_size
-    iso = data[offset:offset + length].decode('utf-8')
+    iso = str(data[offset:offset + length], 'utf-8')
     return date.fromisoformat(iso), offset + length
 
 
@@ -499,19 +551,19 @@ def _deserialize_time(data: bytes, offset: int) -> tuple[time, int]:
     """Deserialize time from ISO format string."""
     length, len_size = _unpack_length(data[offset:])
     offset += len_size
-    iso = data[offset:offset + length].decode('utf-8')
+    iso = str(data[offset:offset + length], 'utf-8')
     return time.fromisoformat(iso), offset + length
 
 
 def _serialize_timedelta(obj: timedelta) -> bytes:
     """Serialize timedelta as total seconds."""
-    data = struct.pack('>d', obj.total_seconds())
+    data = _DOUBLE.pack(obj.total_seconds())
     return bytes([TypeTag.TIMEDELTA]) + data
 
 
 def _deserialize_timedelta(data: bytes, offset: int) -> tuple[timedelta, int]:
     """Deserialize timedelta from total seconds."""
-    seconds = struct.unpack('>d', data[offset:offset + 8])[0]
+    seconds = _DOUBLE.unpack_from(data, offset)[0]
     return timedelta(seconds=seconds), offset + 8
 
 
@@ -525,19 +577,19 @@ def _deserialize_decimal(data: bytes, offset: int) -> tuple[Decimal, int]:
     """Deserialize Decimal from string."""
     length, len_size = _unpack_length(data[offset:])
     offset += len_size
-    s = data[offset:offset + length].decode('utf-8')
+    s = str(data[offset:offset + length], 'utf-8')
     return Decimal(s), offset + length
 
 
 def _serialize_complex(obj: complex) -> bytes:
     """Serialize complex number."""
-    data = struct.pack('>dd', obj.real, obj.imag)
+    data = _COMPLEX.pack(obj.real, obj.imag)
     return bytes([TypeTag.COMPLEX]) + data
 
 
 def _deserialize_complex(data: bytes, offset: int) -> tuple[complex, int]:
     """Deserialize complex number."""
-    real, imag = struct.unpack('>dd', data[offset:offset + 16])
+    real, imag = _COMPLEX.unpack_from(data, offset)
     return complex(real, imag), offset + 16
 
 
@@ -559,12 +611,12 @@ def _deserialize_enum(data: bytes, offset: int, expected_type: Type = None) -> t
     """Deserialize Enum member."""
     cname_len, len_size = _unpack_length(data[offset:])
     offset += len_size
-    class_name = data[offset:offset + cname_len].decode('utf-8')
+    class_name = str(data[offset:offset + cname_len], 'utf-8')
     offset += cname_len
 
     mname_len, len_size = _unpack_length(data[offset:])
     offset += len_size
-    member_name = data[offset:offset + mname_len].decode('utf-8')
+    member_name = str(data[offset:offset + mname_len], 'utf-8')
     offset += mname_len
 
     if expected_type and issubclass(expected_type, Enum):
@@ -574,12 +626,18 @@ def _deserialize_enum(data: bytes, offset: int, expected_type: Type = None) -> t
     return {"__enum__": class_name, "__member__": member_name}, offset
 
 
+_NONE_TYPE = type(None)
+_UNION_ORIGINS = (Union, types.UnionType)
+
+
 def get_inner_type(annotation: Type) -> Type:
-    """Extract inner type from Optional, Union, etc."""
-    origin = get_origin(annotation)
-    if origin is Union:
+    """Extract inner type from Optional[X] and X | None."""
+    if get_origin(annotation) in _UNION_ORIGINS:
+        # Union flattens and dedups, so Optional[X] is always a 2-tuple
         args = get_args(annotation)
-        non_none = [a for a in args if a is not type(None)]
-        if len(non_none) == 1:
-            return non_none[0]
+        if len(args) == 2:
+            if args[1] is _NONE_TYPE:
+                return args[0]
+            if args[0] is _NONE_TYPE:
+                return args[1]
     return annotation
@@ -3,12 +3,13 @@ HTCP Transport Module
 Synchronous socket I/O operations for HTCP protocol.
 """
 
+import os
 import socket
-import struct
 import warnings
 from typing import Optional
 
-from .constants import MAGIC_BYTES, PROTOCOL_VERSION, HEADER_SIZE, MAX_PAYLOAD_SIZE
+from .constants import MAGIC_BYTES, HEADER_SIZE, MAX_PAYLOAD_SIZE, SOCKET_BUFFER_SIZE
+from .proto import Packet, PACKET_TYPES, HEADER_CHECK_STRUCT, HEADER_PREFIX
 from ..exceptions import (
     ConnectionError as HTCPConnectionError,
     ProtocolError,
@@ -17,12 +18,50 @@ from ..exceptions import (
 )
 
 
+def _get_iov_max() -> int:
+    """Most buffers a single sendmsg() call accepts."""
+    try:
+        iov_max = os.sysconf('SC_IOV_MAX')
+    except (AttributeError, ValueError, OSError):
+        iov_max = -1
+    return iov_max if iov_max > 0 else 1024
+
+
+_IOV_MAX = _get_iov_max()
+
+
+def configure_socket(sock: socket.socket, buffer_size: int = SOCKET_BUFFER_SIZE) -> None:
+    """
+    Tune a connected TCP socket for small request/response packets.
+
+    Disables Nagle's algorithm (and delayed ACKs where supported) so small
+    packets are not held back waiting for the peer, and enlarges kernel
+    send/receive buffers.
+
+    Args:
+        sock: Connected TCP socket
+        buffer_size: SO_SNDBUF / SO_RCVBUF size in bytes (0 = keep OS default)
+    """
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if hasattr(socket, 'TCP_QUICKACK'):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        if buffer_size > 0:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, buffer_size)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, buffer_size)
+    except OSError:
+        # Not a TCP socket or option unsupported; tuning is best-effort
+        pass
+
+
 def recv_exact(sock: socket.socket, size: int) -> bytes:
     """
     Receive exact number of bytes from socket.
 
-    Uses bytearray and memoryview for O(n) performance instead of O(n^2)
-    from repeated bytes concatenation.
+    Small reads usually complete with one recv() call, which returns the
+    final bytes object directly. Otherwise the remainder is received into
+    a preallocated bytearray via memoryview for O(n) performance instead
+    of O(n^2) from repeated bytes concatenation.
 
     Args:
         sock: Socket to read from
@@ -34,12 +73,19 @@ def recv_exact(sock: socket.socket, size: int) -> bytes:
     Raises:
         HTCPConnectionError: If connection is closed before receiving all bytes
     """
+    data = sock.recv(size)
+    received = len(data)
+    if received == size:
+        return data
+    if received == 0:
+        raise HTCPConnectionError(f"Connection closed while reading (got 0/{size} bytes)")
+
     buffer = bytearray(size)
     view = memoryview(buffer)
-    received = 0
+    view[:received] = data
 
     while received < size:
-        chunk_size = sock.recv_into(view[received:], size - received)
+        chunk_size = sock.recv_into(view[received:])
         if chunk_size == 0:
             raise HTCPConnectionError(
                 f"Connection closed while reading (got {received}/{size} bytes)"
@@ -49,52 +95,69 @@ def recv_exact(sock: socket.socket, size: int) -> bytes:
     return bytes(buffer)
 
 
-def recv_packet(sock: socket.socket, max_payload_size: int = MAX_PAYLOAD_SIZE) -> 'Packet':
+def unpack_header(
+    buffer: bytes,
+    max_payload_size: int = MAX_PAYLOAD_SIZE,
+    offset: int = 0
+) -> tuple['PacketType', int]:
     """
-    Receive a complete packet from socket.
+    Validate a packet header and extract its type and payload length.
 
     Args:
-        sock: Socket to read from
+        buffer: Bytes holding a full header at the given offset
         max_payload_size: Maximum allowed payload size
+        offset: Position of the header in the buffer
 
     Returns:
-        Received Packet object
+        Tuple of (packet_type, payload_length)
 
     Raises:
-        HTCPConnectionError: If connection is closed
         ProtocolError: If packet is malformed
         MaxPayloadExceededError: If payload exceeds max size
         UnknownPacketTypeError: If packet type is unknown
     """
-    from .proto import Packet, PacketType
-
-    # Read header
-    header = recv_exact(sock, HEADER_SIZE)
-
-    # Validate magic bytes
-    magic = header[:4]
-    if magic != MAGIC_BYTES:
-        raise ProtocolError(f"Invalid magic bytes: {magic!r}")
+    # Parse the whole header in one call
+    prefix, packet_type_byte, payload_length, _ = HEADER_CHECK_STRUCT.unpack_from(buffer, offset)
 
-    # Validate version
-    version = header[4]
-    if version != PROTOCOL_VERSION:
-        raise ProtocolError(f"Unsupported protocol version: {version}")
+    # Validate magic bytes and version together, split only to report
+    if prefix != HEADER_PREFIX:
+        if prefix[:4] != MAGIC_BYTES:
+            raise ProtocolError(f"Invalid magic bytes: {prefix[:4]!r}")
+        raise ProtocolError(f"Unsupported protocol version: {prefix[4]}")
 
     # Parse packet type with validation
-    packet_type_byte = header[5]
-    try:
-        packet_type = PacketType(packet_type_byte)
-    except ValueError:
+    packet_type = PACKET_TYPES[packet_type_byte]
+    if packet_type is None:
         raise UnknownPacketTypeError(packet_type_byte)
 
-    # Parse payload length
-    payload_length = struct.unpack('>I', header[6:10])[0]
-
     # Validate payload size
     if payload_length > max_payload_size:
         raise MaxPayloadExceededError(payload_length, max_payload_size)
 
+    return packet_type, payload_length
+
+
+def recv_packet(sock: socket.socket, max_payload_size: int = MAX_PAYLOAD_SIZE) -> 'Packet':
+    """
+    Receive a complete packet from socket.
+
+    Args:
+        sock: Socket to read from
+        max_payload_size: Maximum allowed payload size
+
+    Returns:
+        Received Packet object
+
+    Raises:
+        HTCPConnectionError: If connection is closed
+        ProtocolError: If packet is malformed
+        MaxPayloadExceededError: If payload exceeds max size
+        UnknownPacketTypeError: If packet type is unknown
+    """
+    # Read header
+    header = recv_exact(sock, HEADER_SIZE)
+    packet_type, payload_length = unpack_header(header, max_payload_size)
+
     # Read payload
     payload = b''
     if payload_length > 0:
@@ -103,6 +166,51 @@ def recv_packet(sock: socket.socket, max_payload_size: int = MAX_PAYLOAD_SIZE) -
     return Packet(packet_type, payload)
 
 
+def parse_packets(buffer: bytearray, max_payload_size: int = MAX_PAYLOAD_SIZE) -> list['Packet']:
+    """
+    Extract all complete packets from the front of a receive buffer.
+
+    Used by non-blocking readers that accumulate socket data between
+    readiness events. Consumed bytes are removed from the buffer in one
+    step; an incomplete trailing packet stays buffered.
+
+    Args:
+        buffer: Accumulated received bytes
+        max_payload_size: Maximum allowed payload size
+
+    Returns:
+        Parsed packets in arrival order (possibly empty)
+
+    Raises:
+        ProtocolError: If packet is malformed
+        MaxPayloadExceededError: If payload exceeds max size
+        UnknownPacketTypeError: If packet type is unknown
+    """
+    packets = []
+    offset = 0
+    size = len(buffer)
+
+    try:
+        # Payloads are copied out through the view once, not sliced and then copied
+        with memoryview(buffer) as view:
+            while size - offset >= HEADER_SIZE:
+                packet_type, payload_length = unpack_header(buffer, max_payload_size, offset)
+
+                start = offset + HEADER_SIZE
+                end = start + payload_length
+                if end > size:
+                    break
+
+                packets.append(Packet(packet_type, bytes(view[start:end])))
+                offset = end
+    finally:
+        # The view is released here, so the buffer can be resized
+        if offset:
+            del buffer[:offset]
+
+    return packets
+
+
 def send_packet(sock: socket.socket, packet: 'Packet') -> None:
     """
     Send a packet over socket.
@@ -115,11 +223,52 @@ def send_packet(sock: socket.socket, packet: 'Packet') -> None:
         HTCPConnectionError: If connection is closed
     """
     try:
-        sock.sendall(packet.to_bytes())
+        packet.write_to(sock)
     except (BrokenPipeError, OSError) as e:
         raise HTCPConnectionError(f"Failed to send packet: {e}") from e
 
 
+def send_packets(sock: socket.socket, packets: list['Packet']) -> None:
+    """
+    Send several packets over socket with as few syscalls as possible.
+
+    Headers and payloads are handed to sendmsg() as one scatter-gather
+    list, so a batch of replies costs a single send in the common case.
+
+    Args:
+        sock: Socket to send to
+        packets: Packets to send, in order
+
+    Raises:
+        HTCPConnectionError: If connection is closed
+    """
+    buffers = []
+    for packet in packets:
+        buffers.append(packet.header())
+        if packet.payload:
+            buffers.append(packet.payload)
+
+    try:
+        if not hasattr(sock, 'sendmsg'):
+            sock.sendall(b''.join(buffers))
+            return
+
+        while buffers:
+            # Longer lists fail with EMSGSIZE, so large batches go in chunks
+            sent = sock.sendmsg(buffers[:_IOV_MAX])
+
+            # Drop fully sent buffers, trim a partially sent one
+            index = 0
+            while index < len(buffers) and sent >= len(buffers[index]):
+                sent -= len(buffers[index])
+                index += 1
+            del buffers[:index]
+            if sent:
+                buffers[0] = memoryview(buffers[0])[sent:]
+    except (BrokenPipeError, OSError) as e:
+        raise HTCPConnectionError(f"Failed to send packets: {e}") from e
+
+
 # Deprecated function for backwards compatibility
 def _recv_exact(sock: socket.socket, size: int) -> bytes:
     """
@@ -130,17 +279,18 @@ def _recv_exact(sock: socket.socket, size: int) -> bytes:
         DeprecationWarning,
         stacklevel=2
     )
-    try:
-        return recv_exact(sock, size)
-    except HTCPConnectionError:
-        # Return partial data for backwards compatibility
-        buffer = bytearray()
-        while len(buffer) < size:
-            try:
-                chunk = sock.recv(size - len(buffer))
-                if not chunk:
-                    return bytes(buffer)
-                buffer.extend(chunk)
-            except Exception:
-                return bytes(buffer)
-        return bytes(buffer)
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+
+    # Return partial data for backwards compatibility
+    while received < size:
+        try:
+            chunk_size = sock.recv_into(view[received:])
+        except Exception:
+            break
+        if chunk_size == 0:
+            break
+        received += chunk_size
+
+    return bytes(view[:received])
@@ -3,44 +3,75 @@ HTCP Utilities Module
 Helper functions for the HTCP protocol.
 """
 
+import sys
 import inspect
+import functools
 import dataclasses
 
-from typing import Any, Callable, Dict, Type, get_type_hints, get_origin, get_args, Union, Tuple
-from .serialization import serialize, deserialize
+from enum import Enum
+from typing import Any, Callable, Dict, FrozenSet, NamedTuple, Type, get_type_hints, get_origin, get_args, Tuple
+from .serialization import serialize, deserialize, get_dataclass_fields, get_inner_type
 
 
-def get_function_signature(func: Callable) -> Dict[str, Type]:
+@functools.lru_cache(maxsize=None)
+def _cached_type_hints(obj: Any) -> Dict[str, Type]:
     """
-    Extract parameter types from function signature.
-    Returns a dict of {param_name: param_type}.
+    Resolve type hints once per function or class.
+    Annotations are static, so the result is shared; callers must not mutate it.
+    Returns an empty dict if the hints can't be resolved.
     """
     try:
-        hints = get_type_hints(func)
+        return get_type_hints(obj)
     except Exception:
-        hints = {}
+        return {}
+
+
+_cached_signature = functools.lru_cache(maxsize=None)(inspect.signature)
 
-    sig = inspect.signature(func)
+
+# Parameter kinds a caller can pass by name
+_KEYWORD_KINDS = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_function_signature(func: Callable) -> Dict[str, Type]:
+    """Extract parameter types once per function; callers must not mutate the result."""
+    hints = _cached_type_hints(func)
     result = {}
 
-    for param_name, param in sig.parameters.items():
-        if param_name == 'self':
+    # Bound methods already have self dropped by inspect.signature
+    for param in _cached_signature(func).parameters.values():
+        if param.kind not in _KEYWORD_KINDS or param.name == 'self':
             continue
-        if param_name in hints:
-            result[param_name] = hints[param_name]
-        else:
-            result[param_name] = Any
+        result[param.name] = hints.get(param.name, Any)
 
     return result
 
 
+def get_function_signature(func: Callable) -> Dict[str, Type]:
+    """
+    Extract parameter types from function signature.
+    Only parameters that can be passed by name are included.
+    Returns a dict of {param_name: param_type}.
+    """
+    return dict(_cached_function_signature(func))
+
+
 def get_return_type(func: Callable) -> Type:
     """Get return type annotation from function."""
-    try:
-        hints = get_type_hints(func)
-        return hints.get('return', Any)
-    except Exception:
-        return Any
+    return _cached_type_hints(func).get('return', Any)
+
+
+def has_var_keyword(func: Callable) -> bool:
+    """
+    Check if function accepts arbitrary keyword arguments (**kwargs).
+    Decorator wrappers are checked themselves, not the function they wrap,
+    since they may take arguments the wrapped handler doesn't (e.g. token).
+    """
+    return any(
+        param.kind is inspect.Parameter.VAR_KEYWORD
+        for param in inspect.signature(func, follow_wrapped=False).parameters.values()
+    )
 
 
 def prepare_arguments(func: Callable, raw_args: Dict[str, Any]) -> Dict[str, Any]:
@@ -48,17 +79,336 @@ def prepare_arguments(func: Callable, raw_args: Dict[str, Any]) -> Dict[str, Any
     Prepare arguments for function call.
     Converts raw deserialized values to expected types using type hints.
     """
-    param_types = get_function_signature(func)
-    prepared = {}
+    return convert_arguments(_cached_arg_plan(func), raw_args)
+
+
+class ArgPlan(NamedTuple):
+    """Prebuilt argument conversion for one handler."""
+    names: FrozenSet[str]  # Accepted parameter names
+    converters: Tuple[Tuple[str, Callable[[Any], Any]], ...]
+    accepts_extra: bool  # Handler takes **kwargs, unknown names pass through
+    convert: Callable[[Dict[str, Any]], Dict[str, Any]]  # Generated from the fields above
+
+
+def build_arg_plan(param_types: Dict[str, Type], accepts_extra: bool = False) -> ArgPlan:
+    """
+    Build per-parameter converters once, for use with convert_arguments().
 
-    for name, value in raw_args.items():
-        expected_type = param_types.get(name)
-        if expected_type is not None:
-            prepared[name] = convert_to_type(value, expected_type)
+    Args:
+        param_types: Dict of {param_name: param_type}
+        accepts_extra: Pass arguments not in param_types through instead of rejecting them
+
+    Returns:
+        ArgPlan for the parameters
+    """
+    converters = tuple(
+        (sys.intern(name), build_converter(param_type))
+        for name, param_type in param_types.items()
+    )
+    names = frozenset(name for name, _ in converters)
+    convert = _make_arguments_converter(param_types, converters, names, accepts_extra)
+    return ArgPlan(names, converters, accepts_extra, convert)
+
+
+def _make_arguments_converter(
+    param_types: Dict[str, Type],
+    converters: Tuple[Tuple[str, Callable[[Any], Any]], ...],
+    names: FrozenSet[str],
+    accepts_extra: bool
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Generate a function converting one handler's raw arguments.
+    Primitive parameters that arrive with the exact type are assigned inline,
+    and unknown names are only looked for when there are more raw arguments
+    than converted ones.
+    """
+    def convert_extra(raw_args, args):
+        extra = raw_args.keys() - names
+        if not accepts_extra:
+            raise TypeError(f"Unexpected arguments: {', '.join(sorted(map(str, extra)))}")
+        for name in extra:
+            args[name] = raw_args[name]
+
+    namespace = {'convert_extra': convert_extra}
+    lines = ["def convert(raw_args):", "    args = {}"]
+    for index, (name, convert) in enumerate(converters):
+        namespace[f'_c{index}'] = convert
+        lines.append(f"    if {name!r} in raw_args:")
+        lines.append(f"        value = raw_args[{name!r}]")
+
+        param_type = param_types[name]
+        if isinstance(param_type, type) and param_type in _IDENTITY_TYPES:
+            namespace[f'_t{index}'] = param_type
+            lines.append(f"        args[{name!r}] = value if type(value) is _t{index} else _c{index}(value)")
         else:
-            prepared[name] = value
+            lines.append(f"        args[{name!r}] = _c{index}(value)")
+
+    lines.append("    if len(args) != len(raw_args):")
+    lines.append("        convert_extra(raw_args, args)")
+    lines.append("    return args")
+
+    exec("\n".join(lines) + "\n", namespace)
+    return namespace['convert']
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_arg_plan(func: Callable) -> ArgPlan:
+    """Build the argument plan once per function."""
+    return build_arg_plan(_cached_function_signature(func), has_var_keyword(func))
+
+
+def convert_arguments(arg_plan: ArgPlan, raw_args: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert raw deserialized arguments with a prebuilt argument plan.
+    Missing arguments are left out, so the handler's defaults apply.
+
+    Raises:
+        TypeError: If raw_args has names the handler doesn't accept
+    """
+    return arg_plan.convert(raw_args)
+
+
+# Types whose values arrive from deserialize() already in final form
+_IDENTITY_TYPES = frozenset({int, str, bytes, bool, float, type(None)})
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _supports_isinstance(expected_type: Type) -> bool:
+    """Check if expected_type can be used as isinstance() target."""
+    try:
+        isinstance(None, expected_type)
+        return True
+    except TypeError:
+        return False
+
+
+class _TypeDesc(NamedTuple):
+    """Everything convert_to_type needs to know about an annotation."""
+    target: Any  # Annotation with Optional[X] unwrapped to X
+    origin: Any
+    args: tuple
+    check_type: Any  # isinstance() target for the already-converted check, or None
+    enum_type: Any  # Enum class, or None
+    is_dataclass: bool  # Dataclass class
+    is_dataclass_instance: bool  # Dataclass instance used as annotation
+
+
+def _build_type_desc(expected_type: Type) -> _TypeDesc:
+    # Handle Optional[X] and X | None; other unions are left as is
+    expected_type = get_inner_type(expected_type)
+    origin = get_origin(expected_type)
+
+    is_dataclass = dataclasses.is_dataclass(expected_type)
+    is_class = isinstance(expected_type, type)
+
+    return _TypeDesc(
+        target=expected_type,
+        origin=origin,
+        args=get_args(expected_type),
+        check_type=expected_type if not origin and _supports_isinstance(expected_type) else None,
+        enum_type=expected_type if is_class and issubclass(expected_type, Enum) else None,
+        is_dataclass=is_dataclass and is_class,
+        is_dataclass_instance=is_dataclass and not is_class,
+    )
+
+
+_cached_type_desc = functools.lru_cache(maxsize=4096)(_build_type_desc)
+
+
+def _type_desc(expected_type: Type) -> _TypeDesc:
+    """Resolve an annotation once; unhashable annotations are resolved uncached."""
+    try:
+        return _cached_type_desc(expected_type)
+    except TypeError:
+        return _build_type_desc(expected_type)
+
+
+def build_converter(expected_type: Type) -> Callable[[Any], Any]:
+    """
+    Build a converter equivalent to convert_to_type(value, expected_type).
+    All type introspection happens here, once, instead of on every value.
+    """
+    if expected_type is Any:
+        return _identity
+
+    desc = _type_desc(expected_type)
+    expected_type, origin, args = desc.target, desc.origin, desc.args
+
+    if expected_type is Any:
+        return _identity
+
+    # Dataclass instances used as annotations are too rare to specialize
+    if desc.is_dataclass_instance:
+        return lambda value: _convert_generic(value, expected_type)
+
+    if desc.is_dataclass:
+        convert_value = _dataclass_converter(expected_type)
+
+    elif origin is list:
+        element = build_converter(args[0] if args else Any)
+
+        def convert_value(value):
+            if isinstance(value, (list, tuple)):
+                return [element(v) for v in value]
+            return value
+
+    elif origin is tuple:
+        convert_value = _tuple_converter(args)
+
+    elif origin is dict:
+        key = build_converter(args[0] if len(args) > 0 else Any)
+        val = build_converter(args[1] if len(args) > 1 else Any)
+
+        def convert_value(value):
+            if isinstance(value, dict):
+                return {key(k): val(v) for k, v in value.items()}
+            return value
+
+    elif origin in (set, frozenset):
+        element = build_converter(args[0] if args else Any)
+        container = origin
+
+        def convert_value(value):
+            if isinstance(value, (list, tuple, set, frozenset)):
+                return container(element(v) for v in value)
+            return value
+
+    else:
+        convert_value = _identity
+
+    checked = _with_common_checks(desc, convert_value)
+
+    if expected_type in _IDENTITY_TYPES:
+        primitive = expected_type
+
+        def convert_primitive(value):
+            if type(value) is primitive:
+                return value
+            return checked(value)
+
+        return convert_primitive
+
+    return checked
+
+
+def _with_common_checks(desc: _TypeDesc, convert_value: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Wrap a type-specific conversion with the checks convert_to_type runs for every type."""
+    check_type = desc.check_type
+    enum_type = desc.enum_type
+
+    def convert(value):
+        if value is None:
+            return None
+
+        # If value is already the correct type, return it
+        if check_type is not None and isinstance(value, check_type):
+            return value
+
+        # Handle Enum from dict representation
+        if isinstance(value, dict) and "__enum__" in value and "__member__" in value:
+            if enum_type is not None:
+                return enum_type[value["__member__"]]
+            return value
+
+        return convert_value(value)
+
+    return convert
+
+
+def _dataclass_converter(cls: Type) -> Callable[[Any], Any]:
+    """Build a dict -> dataclass converter."""
+    def convert_value(value):
+        if not isinstance(value, dict):
+            return value
+        # Looked up on use so self-referencing dataclasses don't recurse forever
+        return _dataclass_builder(cls)(value)
 
-    return prepared
+    return convert_value
+
+
+_dataclass_builders: Dict[Type, Callable[[dict], Any]] = {}
+
+
+def _dataclass_builder(cls: Type) -> Callable[[dict], Any]:
+    """Get the generated dict -> dataclass constructor for cls."""
+    builder = _dataclass_builders.get(cls)
+    if builder is None:
+        builder = _dataclass_builders[cls] = _make_dataclass_builder(cls)
+    return builder
+
+
+def _make_dataclass_builder(cls: Type) -> Callable[[dict], Any]:
+    """
+    Generate a constructor that converts each field and passes it by keyword.
+    When a field is missing from the dict, the generic path is used so the
+    dataclass default still applies.
+    """
+    field_plan = tuple(
+        (field_name, build_converter(field_type))
+        for field_name, field_type in get_dataclass_fields(cls)
+    )
+
+    def build_partial(value):
+        return cls(**{
+            name: convert(value[name])
+            for name, convert in field_plan
+            if name in value
+        })
+
+    if not field_plan:
+        return build_partial
+
+    namespace = {'cls': cls, 'build_partial': build_partial}
+    checks = []
+    arguments = []
+    for index, (name, convert) in enumerate(field_plan):
+        namespace[f'_c{index}'] = convert
+        checks.append(f"{name!r} in d")
+        arguments.append(f"{name}=_c{index}(d[{name!r}])")
+
+    source = (
+        f"def build(d):\n"
+        f"    if {' and '.join(checks)}:\n"
+        f"        return cls({', '.join(arguments)})\n"
+        f"    return build_partial(d)\n"
+    )
+    exec(source, namespace)
+    return namespace['build']
+
+
+def _tuple_converter(args: Tuple[Type, ...]) -> Callable[[Any], Any]:
+    """Build a converter for Tuple[X, ...] and Tuple[X, Y, Z]."""
+    if not args:
+        def convert_value(value):
+            if isinstance(value, (list, tuple)):
+                return tuple(value)
+            return value
+
+    elif len(args) == 2 and args[1] is ...:
+        element = build_converter(args[0])
+
+        def convert_value(value):
+            if isinstance(value, (list, tuple)):
+                return tuple(element(v) for v in value)
+            return value
+
+    else:
+        elements = tuple(build_converter(arg) for arg in args)
+        count = len(elements)
+
+        def convert_value(value):
+            if isinstance(value, (list, tuple)):
+                converted = tuple(convert(v) for convert, v in zip(elements, value))
+                if len(value) > count:
+                    # Elements beyond the annotation are passed as is
+                    converted += tuple(value[count:])
+                return converted
+            return value
+
+    return convert_value
 
 
 def convert_to_type(value: Any, expected_type: Type) -> Any:
@@ -66,77 +416,73 @@ def convert_to_type(value: Any, expected_type: Type) -> Any:
     Convert a value to the expected type.
     Handles dataclasses, Optional, Union, and generic types.
     """
+    # Fast path: nothing to convert, skip all typing introspection
+    if expected_type is Any:
+        return value
+
+    try:
+        if expected_type in _IDENTITY_TYPES and type(value) is expected_type:
+            return value
+        convert = _cached_converter(expected_type)
+    except TypeError:
+        # Unhashable annotation, can't be cached
+        return _convert_generic(value, expected_type)
+
+    return convert(value)
+
+
+# Compiled converters reused across convert_to_type() calls
+_cached_converter = functools.lru_cache(maxsize=4096)(build_converter)
+
+
+def _convert_generic(value: Any, expected_type: Type) -> Any:
+    """Convert a value by interpreting expected_type on every call."""
     if value is None:
         return None
 
-    # Handle Optional[X] and Union types
-    origin = get_origin(expected_type)
-    if origin is Union:
-        args = get_args(expected_type)
-        non_none = [a for a in args if a is not type(None)]
-        if len(non_none) == 1:
-            expected_type = non_none[0]
-            origin = get_origin(expected_type)
+    desc = _type_desc(expected_type)
+    expected_type, origin, args = desc.target, desc.origin, desc.args
 
     # If value is already the correct type, return it
-    try:
-        if not origin and isinstance(value, expected_type):
-            return value
-    except TypeError:
-        pass  # expected_type might not be a valid type for isinstance
+    if desc.check_type is not None and isinstance(value, desc.check_type):
+        return value
 
     # Handle Enum from dict representation
-    from enum import Enum
     if isinstance(value, dict) and "__enum__" in value and "__member__" in value:
-        if expected_type and isinstance(expected_type, type) and issubclass(expected_type, Enum):
-            return expected_type[value["__member__"]]
+        if desc.enum_type is not None:
+            return desc.enum_type[value["__member__"]]
         return value
 
     # Handle dataclasses
-    if dataclasses.is_dataclass(expected_type) and not isinstance(expected_type, type):
+    if desc.is_dataclass_instance:
         return value
 
-    if dataclasses.is_dataclass(expected_type) and isinstance(value, dict):
+    if desc.is_dataclass and isinstance(value, dict):
         # Convert dict to dataclass
-        field_types = {}
-        try:
-            field_types = get_type_hints(expected_type)
-        except Exception:
-            pass
-
-        converted_fields = {}
-        for field in dataclasses.fields(expected_type):
-            if field.name in value:
-                field_type = field_types.get(field.name, Any)
-                converted_fields[field.name] = convert_to_type(value[field.name], field_type)
-
-        return expected_type(**converted_fields)
+        return _dataclass_builder(expected_type)(value)
 
     # Handle list
     if origin is list:
-        args = get_args(expected_type)
         element_type = args[0] if args else Any
         if isinstance(value, (list, tuple)):
             return [convert_to_type(v, element_type) for v in value]
 
     # Handle tuple
     if origin is tuple:
-        args = get_args(expected_type)
         if isinstance(value, (list, tuple)):
             if args:
                 # Handle Tuple[X, Y, Z] or Tuple[X, ...]
                 if len(args) == 2 and args[1] is ...:
                     return tuple(convert_to_type(v, args[0]) for v in value)
                 else:
-                    return tuple(
-                        convert_to_type(v, args[i] if i < len(args) else Any)
-                        for i, v in enumerate(value)
-                    )
+                    converted = tuple(convert_to_type(v, t) for v, t in zip(value, args))
+                    if len(value) > len(args):
+                        converted += tuple(value[len(args):])
+                    return converted
             return tuple(value)
 
     # Handle dict
     if origin is dict:
-        args = get_args(expected_type)
         if isinstance(value, dict):
             key_type = args[0] if len(args) > 0 else Any
             val_type = args[1] if len(args) > 1 else Any
@@ -147,14 +493,12 @@ def convert_to_type(value: Any, expected_type: Type) -> Any:
 
     # Handle set
     if origin is set:
-        args = get_args(expected_type)
         element_type = args[0] if args else Any
         if isinstance(value, (list, tuple, set, frozenset)):
             return set(convert_to_type(v, element_type) for v in value)
 
     # Handle frozenset
     if origin is frozenset:
-        args = get_args(expected_type)
         element_type = args[0] if args else Any
         if isinstance(value, (list, tuple, set, frozenset)):
             return frozenset(convert_to_type(v, element_type) for v in value)
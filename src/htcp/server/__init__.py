@@ -3,7 +3,9 @@
 from .server import Server
 from .transaction import Transaction, TransactionRegistry
 from .connection import ServerClientConnection, ConnectionRegistry
-from .subscription import Subscription, SubscriptionRegistry, ActiveSubscription, ActiveSubscriptionRegistry
+from .subscription import (
+    Subscription, SubscriptionBatch, SubscriptionRegistry, ActiveSubscription, ActiveSubscriptionRegistry
+)
 
 __all__ = [
     'Server',
@@ -12,6 +14,7 @@ __all__ = [
     'ServerClientConnection',
     'ConnectionRegistry',
     'Subscription',
+    'SubscriptionBatch',
     'SubscriptionRegistry',
     'ActiveSubscription',
     'ActiveSubscriptionRegistry',
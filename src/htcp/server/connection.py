@@ -5,14 +5,26 @@ Client connection management for server.
 
 import socket
 import threading
+import time
+
+from collections import deque
 from typing import Optional, Tuple
 
+from ..common.bufpool import recv_buffer_pool
+from ..common.proto import Packet
+from ..common.transport import send_packet, send_packets
+
 
 class ServerClientConnection:
     """
     Represents a connected client on the server side.
 
     Thread-safe wrapper around a client socket with connection state.
+
+    Reads are driven by the server event loop: each readiness event does a
+    single recv_into() and appends to `recv_buffer`, from which every
+    complete packet is parsed and queued. Packets are then processed
+    in order by at most one worker thread at a time.
     """
 
     def __init__(
@@ -24,18 +36,21 @@ class ServerClientConnection:
     ):
         self._socket = sock
         self._address = address
+        self._read_timeout = read_timeout
         self._connected = True
         self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
 
-        # Set socket timeouts
-        if read_timeout is not None or write_timeout is not None:
-            # Use the larger timeout for the socket
-            timeout = max(
-                read_timeout or 0,
-                write_timeout or 0
-            )
-            if timeout > 0:
-                self._socket.settimeout(timeout)
+        self.recv_buffer = bytearray()
+        self._recv_chunk: Optional[bytearray] = recv_buffer_pool.acquire()
+        self._recv_view = memoryview(self._recv_chunk)
+        self._pending: deque[Packet] = deque()
+        self._draining = False
+        self._last_activity = time.monotonic()
+
+        # Reads only happen on readiness, so the socket timeout bounds writes
+        if write_timeout is not None and write_timeout > 0:
+            self._socket.settimeout(write_timeout)
 
     @property
     def socket(self) -> socket.socket:
@@ -47,6 +62,16 @@ class ServerClientConnection:
         """Get client address (host, port)."""
         return self._address
 
+    @property
+    def read_timeout(self) -> Optional[float]:
+        """Get idle read timeout."""
+        return self._read_timeout
+
+    @property
+    def idle_time(self) -> float:
+        """Seconds since data was last received from the client."""
+        return time.monotonic() - self._last_activity
+
     @property
     def connected(self) -> bool:
         """Check if client is still connected."""
@@ -59,15 +84,86 @@ class ServerClientConnection:
         with self._lock:
             self._connected = value
 
+    def recv_available(self) -> int:
+        """
+        Read whatever the socket has ready (one syscall) into `recv_buffer`.
+
+        Returns:
+            Number of bytes read, 0 on EOF
+        """
+        if self._recv_chunk is None:
+            return 0
+        size = self._socket.recv_into(self._recv_view)
+        if size:
+            self.recv_buffer += self._recv_view[:size]
+            self._last_activity = time.monotonic()
+        return size
+
+    def enqueue(self, packet: Packet) -> bool:
+        """
+        Queue a received packet for processing.
+
+        Returns:
+            True if the caller must schedule a drain of the queue
+        """
+        with self._lock:
+            self._pending.append(packet)
+            if self._draining:
+                return False
+            self._draining = True
+            return True
+
+    def has_pending(self) -> bool:
+        """Check if received packets are waiting to be processed."""
+        with self._lock:
+            return bool(self._pending)
+
+    def next_packet(self) -> Optional[Packet]:
+        """Pop the next queued packet, ending the drain when empty."""
+        with self._lock:
+            if self._pending:
+                return self._pending.popleft()
+            self._draining = False
+            return None
+
+    def send(self, packet: Packet) -> None:
+        """Send a packet, serializing writers from different threads."""
+        with self._send_lock:
+            send_packet(self._socket, packet)
+
+    def send_many(self, packets: list[Packet]) -> None:
+        """Send a batch of packets in order with a single gathered write."""
+        with self._send_lock:
+            send_packets(self._socket, packets)
+
+    def shutdown(self) -> None:
+        """Shut down the socket so the event loop observes EOF and cleans up."""
+        self.connected = False
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
     def close(self) -> None:
         """Close the connection."""
         with self._lock:
             self._connected = False
+            self._pending.clear()
             try:
                 self._socket.close()
             except Exception:
                 pass
 
+            # Hand the receive buffer back for the next connection
+            if self._recv_chunk is not None:
+                chunk, self._recv_chunk = self._recv_chunk, None
+                try:
+                    self._recv_view.release()
+                except BufferError:
+                    # Still in use by an in-flight read; let GC reclaim it
+                    return
+                recv_buffer_pool.release(chunk)
+
     def __repr__(self) -> str:
         return f"ServerClientConnection({self._address[0]}:{self._address[1]}, connected={self.connected})"
 
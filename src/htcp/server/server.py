@@ -3,10 +3,14 @@ HTCP Server Module
 TCP server with transaction and subscription decorator support.
 """
 
+import os
 import socket
+import selectors
 import threading
 import logging
+import time
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Optional
 
 from ..common.constants import (
@@ -14,6 +18,7 @@ from ..common.constants import (
     DEFAULT_MAX_CONNECTIONS,
     DEFAULT_READ_TIMEOUT,
     DEFAULT_WRITE_TIMEOUT,
+    RECV_CHUNK_SIZE,
 )
 from ..common.proto import Packet, PacketType, ErrorCode
 from ..common.messages import (
@@ -28,19 +33,77 @@ from ..common.messages import (
     SubscribeEnd,
     SubscribeError,
 )
-from ..common.transport import recv_packet, send_packet
-from ..common.utils import prepare_arguments
-from ..exceptions import ConnectionError as HTCPConnectionError
+from ..common.transport import parse_packets, configure_socket
 
 from .transaction import TransactionRegistry
 from .connection import ServerClientConnection, ConnectionRegistry
-from .subscription import SubscriptionRegistry, ActiveSubscriptionRegistry
+from .subscription import SubscriptionBatch, SubscriptionRegistry, ActiveSubscriptionRegistry
+
+
+# How often idle clients are checked against the read timeout (seconds)
+IDLE_CHECK_INTERVAL = 1.0
+
+# Max replies gathered into one write while draining a client's packets
+SEND_BATCH_SIZE = 64
+
+_HAS_REUSEPORT = hasattr(socket, 'SO_REUSEPORT')
+
+
+class _EventLoop:
+    """Listening socket, selector and wakeup pipe owned by one loop thread."""
+
+    def __init__(self, listen_sock: socket.socket):
+        self.socket = listen_sock
+
+        # Self-pipe lets down() interrupt a blocking select()
+        self.wakeup_reader, self.wakeup_writer = socket.socketpair()
+        self.wakeup_reader.setblocking(False)
+
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.socket, selectors.EVENT_READ)
+        self.selector.register(self.wakeup_reader, selectors.EVENT_READ)
+
+        self.thread: Optional[threading.Thread] = None
+
+    def wakeup(self) -> None:
+        """Interrupt the loop's select() call."""
+        try:
+            self.wakeup_writer.send(b'\x00')
+        except (AttributeError, OSError):
+            pass
+
+    def drain_wakeup(self) -> None:
+        """Discard wakeup bytes."""
+        try:
+            while self.wakeup_reader.recv(RECV_CHUNK_SIZE):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+
+    def close_listener(self) -> None:
+        """Close the listening socket."""
+        try:
+            self.socket.close()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        """Release the selector and wakeup pipe."""
+        self.selector.close()
+        self.wakeup_reader.close()
+        self.wakeup_writer.close()
+        self.wakeup_writer = None
 
 
 class Server:
     """
     HTCP Server.
 
+    Sockets are multiplexed by event loop threads that share one listening
+    socket (or, with reuse_port, each bind their own SO_REUSEPORT listener);
+    handlers run on a bounded worker pool so a slow transaction doesn't
+    stall other clients.
+
     Example usage:
         app = Server(name="my-server", host="0.0.0.0", port=2353)
 
@@ -71,6 +134,9 @@ class Server:
         read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT,
         write_timeout: Optional[float] = DEFAULT_WRITE_TIMEOUT,
         listen_backlog: int = DEFAULT_LISTEN_BACKLOG,
+        max_workers: Optional[int] = None,
+        event_loops: Optional[int] = None,
+        reuse_port: bool = False,
     ):
         self.name = name
         self.host = host
@@ -81,15 +147,33 @@ class Server:
         self.read_timeout = read_timeout
         self.write_timeout = write_timeout
         self.listen_backlog = listen_backlog
+        self.max_workers = max_workers  # None = ThreadPoolExecutor default
+        self.event_loops = event_loops  # None = one, or one per CPU with reuse_port
+        # Gives each event loop its own listener on the port. Other processes
+        # can then bind the port too, so this is opt-in
+        self.reuse_port = reuse_port
 
         self._transactions = TransactionRegistry()
         self._subscriptions = SubscriptionRegistry()
         self._active_subscriptions = ActiveSubscriptionRegistry()
-        self._socket: Optional[socket.socket] = None
         self._running = False
-        self._accept_thread: Optional[threading.Thread] = None
+        self._loops: list[_EventLoop] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._subscription_pool: Optional[ThreadPoolExecutor] = None
+        self._subscription_slots: Optional[threading.BoundedSemaphore] = None
+        self._send_batch = threading.local()
+        self._handshake_packet: Optional[Packet] = None
         self._clients = ConnectionRegistry(max_connections)
 
+        # Packet handlers, most frequent first
+        self._dispatch = {
+            PacketType.TRANSACTION_CALL: self._handle_transaction,
+            PacketType.HANDSHAKE_REQUEST: self._handle_handshake,
+            PacketType.SUBSCRIBE_REQUEST: self._handle_subscribe,
+            PacketType.UNSUBSCRIBE_REQUEST: self._handle_unsubscribe,
+            PacketType.DISCONNECT: self._handle_disconnect,
+        }
+
     def transaction(self, code: str) -> Callable:
         """
         Decorator to register a transaction handler.
@@ -104,7 +188,7 @@ class Server:
         """
         def decorator(func: Callable) -> Callable:
             self._transactions.register(code, func)
-            self.logger.debug(f"Registered transaction '{code}'")
+            self.logger.debug("Registered transaction '%s'", code)
             return func
 
         return decorator
@@ -129,7 +213,7 @@ class Server:
         """
         def decorator(func: Callable) -> Callable:
             self._subscriptions.register(event_type, func)
-            self.logger.debug(f"Registered subscription '{event_type}'")
+            self.logger.debug("Registered subscription '%s'", event_type)
             return func
 
         return decorator
@@ -140,25 +224,85 @@ class Server:
             self.logger.warning("Server is already running")
             return
 
-        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self._socket.bind((self.host, self.port))
-        self._socket.listen(self.listen_backlog)
+        # Registrations are fixed once serving starts, so the handshake
+        # response is serialized once instead of per connection
+        transactions = self._transactions.list_codes() if self.expose_transactions else []
+        self._handshake_packet = HandshakeResponse(
+            server_name=self.name,
+            transactions=transactions
+        ).to_packet()
+
+        # Loops sharing one listener all wake for every connection and run
+        # under one GIL, so several are only started on request, or by
+        # default when each can have its own SO_REUSEPORT listener
+        if self.event_loops:
+            loop_count = self.event_loops
+        elif self.reuse_port and _HAS_REUSEPORT:
+            loop_count = os.cpu_count() or 1
+        else:
+            loop_count = 1
+        per_loop_listener = self.reuse_port and _HAS_REUSEPORT and loop_count > 1
+
+        port = self.port
+        listen_sock = None
+        try:
+            for _ in range(loop_count):
+                if per_loop_listener or listen_sock is None:
+                    listen_sock = self._create_listener(port, reuse_port=per_loop_listener)
+                    # Later listeners must join the port the first one got (port 0)
+                    port = listen_sock.getsockname()[1]
+                # Otherwise every loop watches the same non-blocking listener;
+                # loops that lose the accept race just get BlockingIOError
+                self._loops.append(_EventLoop(listen_sock))
+        except Exception:
+            if listen_sock is not None:
+                listen_sock.close()
+            for loop in self._loops:
+                loop.close_listener()
+                loop.close()
+            self._loops = []
+            raise
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=f"{self.name}-worker"
+        )
+
+        # Subscriptions are long-running, so they get their own bounded
+        # pool instead of a fresh thread each or a slot in the worker pool.
+        # Each one holds its thread for its whole life, so requests beyond
+        # the pool size are refused rather than left queued
+        subscription_capacity = max(self.max_connections, 32)
+        self._subscription_pool = ThreadPoolExecutor(
+            max_workers=subscription_capacity,
+            thread_name_prefix=f"{self.name}-subscription"
+        )
+        self._subscription_slots = threading.BoundedSemaphore(subscription_capacity)
 
         self._running = True
         if self.logger.isEnabledFor(logging.INFO):
             self.logger.info(
-                f"Registered {len(self._transactions)} transactions, "
-                f"{len(self._subscriptions)} subscriptions"
+                "Registered %d transactions, %d subscriptions",
+                len(self._transactions), len(self._subscriptions)
             )
-        self.logger.info(f"Server '{self.name}' started on {self.host}:{self.port}")
-
-        self._accept_thread = threading.Thread(target=self._accept_loop, daemon=True)
-        self._accept_thread.start()
+        self.logger.info(
+            "Server '%s' started on %s:%s with %d event loop(s)",
+            self.name, self.host, port, loop_count
+        )
+
+        for index, loop in enumerate(self._loops):
+            loop.thread = threading.Thread(
+                target=self._event_loop,
+                args=(loop,),
+                name=f"{self.name}-loop-{index}",
+                daemon=True
+            )
+            loop.thread.start()
 
         # Block main thread
         try:
-            self._accept_thread.join()
+            for loop in self._loops:
+                loop.thread.join()
         except KeyboardInterrupt:
             self.logger.info("Keyboard interrupt received")
             self.down()
@@ -169,25 +313,92 @@ class Server:
             return
 
         self._running = False
+        for loop in self._loops:
+            loop.wakeup()
 
         # Close all client connections (this will also cancel subscriptions)
         self._clients.close_all()
 
-        # Close server socket
-        if self._socket:
-            try:
-                self._socket.close()
-            except Exception:
-                pass
-            self._socket = None
+        # Close server sockets
+        for loop in self._loops:
+            loop.close_listener()
+        self._loops = []
 
-        self.logger.info(f"Server '{self.name}' stopped")
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        if self._subscription_pool:
+            self._subscription_pool.shutdown(wait=False, cancel_futures=True)
+            self._subscription_pool = None
+
+        self.logger.info("Server '%s' stopped", self.name)
+
+    def _create_listener(self, port: int, reuse_port: bool) -> socket.socket:
+        """Create a non-blocking listening socket bound to host and port."""
+        listen_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            listen_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if reuse_port:
+                # Kernel balances incoming connections across the listeners
+                listen_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            listen_sock.bind((self.host, port))
+            listen_sock.listen(self.listen_backlog)
+            listen_sock.setblocking(False)
+        except Exception:
+            listen_sock.close()
+            raise
+        return listen_sock
+
+    def _event_loop(self, loop: _EventLoop) -> None:
+        """Multiplex one listening socket and the clients it accepted."""
+        listen_sock = loop.socket
+        check_idle = bool(self.read_timeout)
+        next_idle_check = time.monotonic() + IDLE_CHECK_INTERVAL
+
+        try:
+            while self._running:
+                timeout = max(next_idle_check - time.monotonic(), 0) if check_idle else None
+
+                for key, _ in loop.selector.select(timeout):
+                    if key.data is not None:
+                        self._on_client_readable(loop, key.data)
+                    elif key.fileobj is listen_sock:
+                        if not self._accept_connections(loop):
+                            return
+                    else:
+                        loop.drain_wakeup()
+
+                # Scanned once per interval, not on every wakeup
+                if check_idle and time.monotonic() >= next_idle_check:
+                    self._close_idle_clients(loop)
+                    next_idle_check = time.monotonic() + IDLE_CHECK_INTERVAL
+
+        except Exception as e:
+            if self._running:
+                self.logger.error("Event loop error: %s", e)
+
+        finally:
+            loop.close()
+
+    def _accept_connections(self, loop: _EventLoop) -> bool:
+        """
+        Accept all pending connections. Returns False once the listener is closed.
+
+        Drains up to listen_backlog connections per readiness event so a
+        burst of connects costs one select() wakeup instead of one each.
+        """
+        for _ in range(max(self.listen_backlog, 1)):
+            try:
+                client_sock, address = loop.socket.accept()
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                # Socket was closed
+                return False
 
-    def _accept_loop(self) -> None:
-        """Accept incoming connections."""
-        while self._running:
             try:
-                client_sock, address = self._socket.accept()
+                configure_socket(client_sock)
 
                 # Atomic check-and-add to prevent race condition
                 client = self._clients.try_add(
@@ -199,86 +410,147 @@ class Server:
 
                 if client is None:
                     self.logger.warning(
-                        f"Connection from {address} rejected: max connections ({self.max_connections}) reached"
+                        "Connection from %s rejected: max connections (%d) reached",
+                        address, self.max_connections
                     )
                     client_sock.close()
                     continue
 
-                self.logger.info(f"New connection from {address[0]}:{address[1]}")
+                loop.selector.register(client_sock, selectors.EVENT_READ, client)
+                self.logger.info("New connection from %s:%s", address[0], address[1])
 
-                thread = threading.Thread(
-                    target=self._handle_client,
-                    args=(client,),
-                    daemon=True
-                )
-                thread.start()
-
-            except OSError:
-                # Socket was closed
-                break
             except Exception as e:
                 if self._running:
-                    self.logger.error(f"Error accepting connection: {e}")
+                    self.logger.error("Error accepting connection: %s", e)
 
-    def _handle_client(self, client: ServerClientConnection) -> None:
-        """Handle a single client connection."""
+        return True
+
+    def _on_client_readable(self, loop: _EventLoop, client: ServerClientConnection) -> None:
+        """Read available data from a client and queue complete packets."""
         try:
-            while self._running and client.connected:
+            received = client.recv_available()
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            received = 0
+
+        if not received or not self._running:
+            self._close_client(loop, client)
+            return
+
+        try:
+            for packet in parse_packets(client.recv_buffer):
+                if client.enqueue(packet):
+                    self._executor.submit(self._drain_client, client)
+        except Exception as e:
+            self.logger.error("Error processing packet from %s: %s", client.address, e)
+            self._send_error(client, ErrorCode.PROTOCOL_ERROR, str(e))
+            self._close_client(loop, client)
+
+    def _drain_client(self, client: ServerClientConnection) -> None:
+        """
+        Process a client's queued packets in order (runs on a worker thread).
+
+        Replies produced while more packets are queued are gathered and
+        written together, so a pipelining client costs one send per batch.
+        """
+        batch = self._send_batch
+        batch.client = client
+        batch.packets = []
+
+        try:
+            while True:
+                # Flush before the drain can end so replies stay ordered
+                if not client.has_pending():
+                    self._flush_send_batch()
+
+                packet = client.next_packet()
+                if packet is None:
+                    return
+
                 try:
-                    packet = recv_packet(client.socket)
                     self._process_packet(client, packet)
-                except HTCPConnectionError:
-                    break
-                except socket.timeout:
-                    self.logger.warning(f"Client {client.address} timed out")
-                    break
                 except Exception as e:
-                    self.logger.error(f"Error processing packet from {client.address}: {e}")
+                    self.logger.error("Error processing packet from %s: %s", client.address, e)
                     self._send_error(client, ErrorCode.PROTOCOL_ERROR, str(e))
-                    break
+                    client.connected = False
 
-        finally:
-            # Cancel all active subscriptions for this client
-            self._active_subscriptions.cancel_for_client(client.address)
-
-            self._clients.remove(client.address)
-            client.close()
-            self.logger.info(f"Client {client.address[0]}:{client.address[1]} disconnected")
+                if len(batch.packets) >= SEND_BATCH_SIZE:
+                    self._flush_send_batch()
 
-    def _process_packet(self, client: ServerClientConnection, packet: Packet) -> None:
-        """Process incoming packet from client."""
-        if packet.packet_type == PacketType.HANDSHAKE_REQUEST:
-            self._handle_handshake(client, packet)
+                if not client.connected or not self._running:
+                    self._flush_send_batch()
+                    # The event loop closes the connection once it sees EOF
+                    client.shutdown()
+                    return
 
-        elif packet.packet_type == PacketType.TRANSACTION_CALL:
-            self._handle_transaction(client, packet)
+        finally:
+            batch.client = None
+            batch.packets = None
+
+    def _flush_send_batch(self) -> None:
+        """Write the current worker's gathered replies."""
+        batch = self._send_batch
+        packets = batch.packets
+        if not packets:
+            return
 
-        elif packet.packet_type == PacketType.SUBSCRIBE_REQUEST:
-            self._handle_subscribe(client, packet)
+        batch.packets = []
+        try:
+            batch.client.send_many(packets)
+        except Exception as e:
+            self.logger.error("Error sending packet: %s", e)
+            batch.client.shutdown()
+
+    def _close_idle_clients(self, loop: _EventLoop) -> None:
+        """Disconnect clients idle longer than their read timeout."""
+        for key in list(loop.selector.get_map().values()):
+            client = key.data
+            if client is None or not client.read_timeout:
+                continue
+            if client.idle_time < client.read_timeout:
+                continue
+            # Subscribed clients don't send packets
+            if self._active_subscriptions.get_for_client(client.address):
+                continue
+
+            self.logger.warning("Client %s timed out", client.address)
+            self._close_client(loop, client)
+
+    def _close_client(self, loop: _EventLoop, client: ServerClientConnection) -> None:
+        """Unregister and close a client connection (owning loop thread only)."""
+        try:
+            loop.selector.unregister(client.socket)
+        except (KeyError, ValueError):
+            pass
 
-        elif packet.packet_type == PacketType.UNSUBSCRIBE_REQUEST:
-            self._handle_unsubscribe(client, packet)
+        # Cancel all active subscriptions for this client
+        self._active_subscriptions.cancel_for_client(client.address)
 
-        elif packet.packet_type == PacketType.DISCONNECT:
-            client.connected = False
+        self._clients.remove(client.address)
+        client.close()
+        self.logger.info("Client %s:%s disconnected", client.address[0], client.address[1])
 
+    def _process_packet(self, client: ServerClientConnection, packet: Packet) -> None:
+        """Process incoming packet from client."""
+        handler = self._dispatch.get(packet.packet_type)
+        if handler is not None:
+            handler(client, packet)
         else:
             self._send_error(client, ErrorCode.PROTOCOL_ERROR, f"Unknown packet type: {packet.packet_type}")
 
+    def _handle_disconnect(self, client: ServerClientConnection, packet: Packet) -> None:
+        """Handle disconnect request."""
+        client.connected = False
+
     def _handle_handshake(self, client: ServerClientConnection, packet: Packet) -> None:
         """Handle handshake request."""
         try:
             HandshakeRequest.from_packet(packet)
-
-            transactions = self._transactions.list_codes() if self.expose_transactions else []
-            response = HandshakeResponse(
-                server_name=self.name,
-                transactions=transactions
-            )
-            self._send_packet(client, response.to_packet())
+            self._send_packet(client, self._handshake_packet)
 
         except Exception as e:
-            self.logger.error(f"Handshake error: {e}")
+            self.logger.error("Handshake error: %s", e)
             self._send_error(client, ErrorCode.PROTOCOL_ERROR, str(e))
 
     def _handle_transaction(self, client: ServerClientConnection, packet: Packet) -> None:
@@ -287,12 +559,13 @@ class Server:
             call = TransactionCall.from_packet(packet)
             transaction_code = call.transaction_code
 
-            self.logger.info(f"Transaction call '{transaction_code}' from {client.address[0]}:{client.address[1]}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Transaction call '%s' from %s:%s", transaction_code, client.address[0], client.address[1])
 
             # Find transaction
             trans = self._transactions.get(transaction_code)
             if not trans:
-                self.logger.info(f"Unknown transaction: {transaction_code}")
+                self.logger.info("Unknown transaction: %s", transaction_code)
                 self._send_result(client, TransactionResult(
                     success=False,
                     error_code=ErrorCode.UNKNOWN_TRANSACTION,
@@ -302,9 +575,9 @@ class Server:
 
             # Prepare arguments with type conversion
             try:
-                prepared_args = prepare_arguments(trans.func, call.arguments)
+                prepared_args = trans.convert(call.arguments)
             except Exception as e:
-                self.logger.error(f"Argument preparation error: {e}")
+                self.logger.error("Argument preparation error: %s", e)
                 self._send_result(client, TransactionResult(
                     success=False,
                     error_code=ErrorCode.INVALID_ARGUMENTS,
@@ -316,7 +589,8 @@ class Server:
             try:
                 result = trans.func(**prepared_args)
 
-                self.logger.debug(f"Transaction '{transaction_code}' completed successfully")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Transaction '%s' completed successfully", transaction_code)
                 self._send_result(client, TransactionResult(
                     success=True,
                     result=result,
@@ -324,7 +598,7 @@ class Server:
                 ))
 
             except Exception as e:
-                self.logger.error(f"Transaction execution error: {e}")
+                self.logger.error("Transaction execution error: %s", e)
                 self._send_result(client, TransactionResult(
                     success=False,
                     error_code=ErrorCode.EXECUTION_ERROR,
@@ -332,8 +606,13 @@ class Server:
                 ))
 
         except Exception as e:
-            self.logger.error(f"Transaction handling error: {e}")
-            self._send_error(client, ErrorCode.INTERNAL_ERROR, str(e))
+            self.logger.error("Transaction handling error: %s", e)
+            # Answered as a result, so the client can match it to its call
+            self._send_result(client, TransactionResult(
+                success=False,
+                error_code=ErrorCode.INTERNAL_ERROR,
+                error_message=str(e)
+            ))
 
     def _handle_subscribe(self, client: ServerClientConnection, packet: Packet) -> None:
         """Handle subscription request."""
@@ -343,14 +622,14 @@ class Server:
             event_type = request.event_type
 
             self.logger.info(
-                f"Subscribe request '{event_type}' (id={subscription_id}) "
-                f"from {client.address[0]}:{client.address[1]}"
+                "Subscribe request '%s' (id=%s) from %s:%s",
+                event_type, subscription_id, client.address[0], client.address[1]
             )
 
             # Find subscription handler
             sub = self._subscriptions.get(event_type)
             if not sub:
-                self.logger.info(f"Unknown subscription: {event_type}")
+                self.logger.info("Unknown subscription: %s", event_type)
                 self._send_subscribe_error(
                     client, subscription_id,
                     ErrorCode.UNKNOWN_TRANSACTION,
@@ -360,9 +639,9 @@ class Server:
 
             # Prepare arguments
             try:
-                prepared_args = prepare_arguments(sub.func, request.arguments)
+                prepared_args = sub.convert(request.arguments)
             except Exception as e:
-                self.logger.error(f"Subscription argument preparation error: {e}")
+                self.logger.error("Subscription argument preparation error: %s", e)
                 self._send_subscribe_error(
                     client, subscription_id,
                     ErrorCode.INVALID_ARGUMENTS,
@@ -370,7 +649,16 @@ class Server:
                 )
                 return
 
-            # Start subscription in a separate thread
+            if not self._subscription_slots.acquire(blocking=False):
+                self.logger.warning("Subscription '%s' refused: no free subscription slots", subscription_id)
+                self._send_subscribe_error(
+                    client, subscription_id,
+                    ErrorCode.EXECUTION_ERROR,
+                    "Too many active subscriptions"
+                )
+                return
+
+            # Start subscription on the subscription pool
             try:
                 generator = sub.func(**prepared_args)
 
@@ -383,16 +671,13 @@ class Server:
                     is_async=sub.is_async
                 )
 
-                # Run generator in separate thread
-                thread = threading.Thread(
-                    target=self._run_subscription,
-                    args=(client, active_sub),
-                    daemon=True
-                )
-                thread.start()
+                # Run generator on a pooled thread
+                self._subscription_pool.submit(self._run_subscription, client, active_sub)
 
             except Exception as e:
-                self.logger.error(f"Subscription start error: {e}")
+                self._active_subscriptions.remove(subscription_id)
+                self._subscription_slots.release()
+                self.logger.error("Subscription start error: %s", e)
                 self._send_subscribe_error(
                     client, subscription_id,
                     ErrorCode.EXECUTION_ERROR,
@@ -400,7 +685,7 @@ class Server:
                 )
 
         except Exception as e:
-            self.logger.error(f"Subscribe handling error: {e}")
+            self.logger.error("Subscribe handling error: %s", e)
             self._send_error(client, ErrorCode.INTERNAL_ERROR, str(e))
 
     def _run_subscription(self, client: ServerClientConnection, active_sub) -> None:
@@ -412,9 +697,15 @@ class Server:
                 if not active_sub.is_active or not client.connected or not self._running:
                     break
 
-                # Send data to client
-                msg = SubscribeData(subscription_id=subscription_id, data=data)
-                self._send_packet(client, msg.to_packet())
+                # Send data to client, a batch as one gathered write
+                if isinstance(data, SubscriptionBatch):
+                    self._send_packets(client, [
+                        SubscribeData(subscription_id=subscription_id, data=item).to_packet()
+                        for item in data
+                    ])
+                else:
+                    msg = SubscribeData(subscription_id=subscription_id, data=data)
+                    self._send_packet(client, msg.to_packet())
 
             # Send end of subscription
             if client.connected and self._running:
@@ -425,7 +716,7 @@ class Server:
             # Subscription was cancelled
             pass
         except Exception as e:
-            self.logger.error(f"Subscription '{subscription_id}' error: {e}")
+            self.logger.error("Subscription '%s' error: %s", subscription_id, e)
             if client.connected:
                 self._send_subscribe_error(
                     client, subscription_id,
@@ -434,7 +725,8 @@ class Server:
                 )
         finally:
             self._active_subscriptions.remove(subscription_id)
-            self.logger.debug(f"Subscription '{subscription_id}' ended")
+            self._subscription_slots.release()
+            self.logger.debug("Subscription '%s' ended", subscription_id)
 
     def _handle_unsubscribe(self, client: ServerClientConnection, packet: Packet) -> None:
         """Handle unsubscribe request."""
@@ -443,25 +735,38 @@ class Server:
             subscription_id = request.subscription_id
 
             self.logger.info(
-                f"Unsubscribe request (id={subscription_id}) "
-                f"from {client.address[0]}:{client.address[1]}"
+                "Unsubscribe request (id=%s) from %s:%s",
+                subscription_id, client.address[0], client.address[1]
             )
 
             active_sub = self._active_subscriptions.remove(subscription_id)
             if active_sub:
                 active_sub.cancel()
-                self.logger.debug(f"Cancelled subscription '{subscription_id}'")
+                self.logger.debug("Cancelled subscription '%s'", subscription_id)
 
         except Exception as e:
-            self.logger.error(f"Unsubscribe handling error: {e}")
+            self.logger.error("Unsubscribe handling error: %s", e)
 
     def _send_packet(self, client: ServerClientConnection, packet: Packet) -> None:
         """Send packet to client."""
+        batch = self._send_batch
+        if getattr(batch, 'client', None) is client:
+            batch.packets.append(packet)
+            return
+
+        try:
+            client.send(packet)
+        except Exception as e:
+            self.logger.error("Error sending packet: %s", e)
+            client.shutdown()
+
+    def _send_packets(self, client: ServerClientConnection, packets: list[Packet]) -> None:
+        """Send several packets to client with a single gathered write."""
         try:
-            send_packet(client.socket, packet)
+            client.send_many(packets)
         except Exception as e:
-            self.logger.error(f"Error sending packet: {e}")
-            client.connected = False
+            self.logger.error("Error sending packets: %s", e)
+            client.shutdown()
 
     def _send_result(self, client: ServerClientConnection, result: TransactionResult) -> None:
         """Send transaction result to client."""
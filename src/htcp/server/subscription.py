@@ -6,9 +6,18 @@ Subscription registration and management.
 import threading
 import inspect
 
-from typing import Callable, Dict, Optional, Type, Any, Generator, AsyncGenerator
+from typing import Callable, Dict, Optional, Type, Any, Generator, AsyncGenerator, get_type_hints, get_origin, get_args
 
-from ..common.utils import get_function_signature
+from ..common.utils import get_function_signature, convert_arguments, build_arg_plan, has_var_keyword
+
+
+class SubscriptionBatch(list):
+    """
+    Several subscription items yielded at once.
+
+    Each item is still delivered as its own data packet, but the whole
+    batch is written to the client in one go.
+    """
 
 
 class Subscription:
@@ -25,14 +34,18 @@ class Subscription:
         self.event_type = event_type
         self.func = func
         self.param_types = param_types
+        self.arg_plan = build_arg_plan(param_types, has_var_keyword(func))
         self.yield_type = yield_type
         self.is_async = is_async
 
+    def convert(self, raw_args: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert raw subscribe arguments to the handler's parameter types."""
+        return convert_arguments(self.arg_plan, raw_args)
+
 
 def _get_yield_type(func: Callable) -> Type:
     """Extract yield type from generator function."""
     try:
-        from typing import get_type_hints, get_origin, get_args
         hints = get_type_hints(func)
         return_hint = hints.get("return", Any)
 
@@ -119,8 +132,9 @@ class SubscriptionRegistry:
         Returns:
             Subscription object or None if not found
         """
-        with self._lock:
-            return self._subscriptions.get(event_type)
+        # Called per subscribe request; a single dict read is atomic, and writes
+        # only happen in register() under the lock, so no locking is needed
+        return self._subscriptions.get(event_type)
 
     def list_event_types(self) -> list[str]:
         """
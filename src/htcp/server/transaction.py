@@ -4,10 +4,14 @@ Transaction registration and management.
 """
 
 import threading
+import inspect
 
-from typing import Callable, Dict, Optional, Type
+from typing import Any, Callable, Dict, Optional, Type
 
-from ..common.utils import get_function_signature, get_return_type
+from ..common.utils import (
+    get_function_signature, get_return_type, convert_arguments, build_arg_plan, has_var_keyword,
+    is_tuple_return, unpack_tuple_type
+)
 
 
 class Transaction:
@@ -23,7 +27,16 @@ class Transaction:
         self.code = code
         self.func = func
         self.param_types = param_types
+        self.arg_plan = build_arg_plan(param_types, has_var_keyword(func))
         self.return_type = return_type
+        # Resolved once here so response handling never re-inspects the annotation
+        self.return_is_tuple = is_tuple_return(return_type)
+        self.return_types = unpack_tuple_type(return_type) if self.return_is_tuple else (return_type,)
+        self.is_async = inspect.iscoroutinefunction(func)
+
+    def convert(self, raw_args: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert raw call arguments to the handler's parameter types."""
+        return convert_arguments(self.arg_plan, raw_args)
 
 
 class TransactionRegistry:
@@ -88,8 +101,9 @@ class TransactionRegistry:
         Returns:
             Transaction object or None if not found
         """
-        with self._lock:
-            return self._transactions.get(code)
+        # Called per call frame; a single dict read is atomic, and writes
+        # only happen in register() under the lock, so no locking is needed
+        return self._transactions.get(code)
 
     def list_codes(self) -> list[str]:
         """
@@ -6,6 +6,11 @@ import asyncio
 import sys
 import logging
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from src.app import Application
 from src.config import settings
 
@@ -34,7 +39,11 @@ if __name__ == "__main__":
     logger = logging.getLogger("app-starter")
 
     try:
-        asyncio.run(main())
+        # Faster libuv-based event loop, when installed
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
 
     except KeyboardInterrupt:
         pass
@@ -6,7 +6,6 @@ from typing import TYPE_CHECKING, Callable
 if TYPE_CHECKING:
     from src.app import Application
 
-from src.services.users.repos import TokensRepository
 from src.models.api_models import Result
 
 
@@ -17,7 +16,7 @@ class AuthMiddleware:
         """Initialize with application."""
 
         self.app = app
-        self.tokens_repo = TokensRepository(app)
+        self.tokens_repo = app.tokens_repo
 
     def require_auth(self, func: Callable) -> Callable:
         """Decorator requiring valid token. Extracts user_id from token."""
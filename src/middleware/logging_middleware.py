@@ -77,27 +77,27 @@ class LoggingMiddleware:
 
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            transaction_name = func.__name__
-            user_id = kwargs.get("user_id", "<no-login>")
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             try:
                 result = await func(*args, **kwargs)
-                duration = time.time() - start_time
 
-                self.logger.log(
-                    level,
-                    f"[u:{user_id}] Transaction '{transaction_name}' completed [{duration:.3f}s]"
-                )
+                # Skip formatting entirely when the level is filtered out
+                if self.logger.isEnabledFor(level):
+                    self.logger.log(
+                        level,
+                        "[u:%s] Transaction '%s' completed [%.3fs]",
+                        kwargs.get("user_id", "<no-login>"), func.__name__,
+                        time.perf_counter() - start_time
+                    )
 
                 return result
 
             except Exception as e:
-                duration = time.time() - start_time
-
                 self.logger.error(
-                    f"[u:{user_id}] Transaction '{transaction_name}' failed: "
-                    f"{type(e).__name__}: {e} [{duration:.3f}s]",
+                    "[u:%s] Transaction '%s' failed: %s: %s [%.3fs]",
+                    kwargs.get("user_id", "<no-login>"), func.__name__,
+                    type(e).__name__, e, time.perf_counter() - start_time,
                     exc_info=True
                 )
 
@@ -123,25 +123,19 @@ class LoggingMiddleware:
             subscription_name = func.__name__
             user_id = kwargs.get("user_id", "<no-login>")
 
-            self.logger.log(
-                level,
-                f"[u:{user_id}] Subscription '{subscription_name}' started"
-            )
+            self.logger.log(level, "[u:%s] Subscription '%s' started", user_id, subscription_name)
 
             try:
                 async for item in func(*args, **kwargs):
                     yield item
 
             except GeneratorExit:
-                self.logger.log(
-                    level,
-                    f"[u:{user_id}] Subscription '{subscription_name}' closed"
-                )
+                self.logger.log(level, "[u:%s] Subscription '%s' closed", user_id, subscription_name)
 
             except Exception as e:
                 self.logger.error(
-                    f"[u:{user_id}] Subscription '{subscription_name}' error: "
-                    f"{type(e).__name__}: {e}",
+                    "[u:%s] Subscription '%s' error: %s: %s",
+                    user_id, subscription_name, type(e).__name__, e,
                     exc_info=True
                 )
                 raise
@@ -19,6 +19,10 @@ class Result(Generic[T]):
     data: T | None = None
 
 
+# Shared rejection result; results are never mutated after being returned
+NOT_MEMBER_RESULT: Result = Result(success=False, errors=[("FORBIDDEN", "Not a member of this chat")])
+
+
 class Account(BaseModel):
     """User account information."""
 
@@ -20,6 +20,18 @@ class ChatsRepository(BaseDBRepository):
 
         return ChatDB(**row) if row else None
 
+    async def get_by_id_for_member(self, chat_id: int, user_id: int) -> ChatDB | None:
+        """Get chat by ID, only if user is its member."""
+
+        row = await self.fetchrow(
+            f"""SELECT c.* FROM {self._get_table_name()} c
+                JOIN {self.schema_name}.chat_members cm ON cm.chat_id = c.id AND cm.user_id = $2
+                WHERE c.id = $1""",
+            chat_id, user_id
+        )
+
+        return ChatDB(**row) if row else None
+
     async def create(self, owner_id: int, name: str, conn=None) -> int:
         """Create new chat and return ID."""
 
@@ -119,6 +131,16 @@ class ChatMembersRepository(BaseDBRepository):
 
         return exists
 
+    async def get_chat_ids_by_user(self, user_id: int) -> list[int]:
+        """Get IDs of all chats where user is member."""
+
+        rows = await self.fetch(
+            f"SELECT chat_id FROM {self._get_table_name()} WHERE user_id = $1",
+            user_id
+        )
+
+        return [row["chat_id"] for row in rows]
+
     async def get_members_by_chat(self, chat_id: int) -> list[ChatMemberDB]:
         """Get all members of chat."""
 
@@ -139,6 +161,36 @@ class ChatMembersRepository(BaseDBRepository):
 
         return [row["user_id"] for row in rows]
 
+    async def get_member_user_ids_for_chats(self, chat_ids: list[int]) -> set[int]:
+        """Get distinct member user IDs across several chats in one query."""
+
+        if not chat_ids:
+            return set()
+
+        rows = await self.fetch(
+            f"SELECT DISTINCT user_id FROM {self._get_table_name()} WHERE chat_id = ANY($1::bigint[])",
+            chat_ids
+        )
+
+        return {row["user_id"] for row in rows}
+
+    async def get_member_user_ids_by_chats(self, chat_ids: list[int]) -> dict[int, list[int]]:
+        """Get member user IDs of several chats in one query, keyed by chat ID."""
+
+        if not chat_ids:
+            return {}
+
+        rows = await self.fetch(
+            f"SELECT chat_id, user_id FROM {self._get_table_name()} WHERE chat_id = ANY($1::bigint[])",
+            chat_ids
+        )
+
+        members: dict[int, list[int]] = {}
+        for row in rows:
+            members.setdefault(row["chat_id"], []).append(row["user_id"])
+
+        return members
+
     async def count_members(self, chat_id: int) -> int:
         """Count members in chat."""
 
@@ -5,9 +5,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from src.app import Application
 
-from src.services.chats.repos import ChatsRepository, ChatMembersRepository
-from src.services.users.repos import AccountsRepository
-from src.models.api_models import Chat, Result
+from src.models.db_models import ChatDB
+from src.models.api_models import Chat, Result, NOT_MEMBER_RESULT
 
 
 class ChatService:
@@ -18,10 +17,10 @@ class ChatService:
 
         self.app = app
 
-        self.chats_repo = ChatsRepository(app)
-        self.members_repo = ChatMembersRepository(app)
+        self.chats_repo = app.chats_repo
+        self.members_repo = app.chat_members_repo
 
-        self.accounts_repo = AccountsRepository(app)
+        self.accounts_repo = app.accounts_repo
 
     async def create_chat(
         self,
@@ -47,6 +46,8 @@ class ChatService:
         for user_id in member_ids:
             await self.members_repo.add_member(chat_id, user_id)
 
+        self.app.membership.forget(member_ids)
+
         return await self.get_chat_by_id(chat_id)
 
     async def get_chat_by_id(self, chat_id: int) -> Result[Chat]:
@@ -56,6 +57,22 @@ class ChatService:
         if not chat_db:
             return Result(success=False, errors=[("NOT_FOUND", "Chat not found")])
 
+        return await self._build_chat(chat_db)
+
+    async def get_chat_for_member(self, chat_id: int, user_id: int) -> Result[Chat]:
+        """Get chat by ID with owner and members, checking membership in the same query."""
+
+        chat_db = await self.chats_repo.get_by_id_for_member(chat_id, user_id)
+        if not chat_db:
+            return NOT_MEMBER_RESULT
+
+        return await self._build_chat(chat_db)
+
+    async def _build_chat(self, chat_db: ChatDB) -> Result[Chat]:
+        """Build chat API model with owner and members."""
+
+        chat_id = chat_db.id
+
         # Get owner
         owner_db = await self.accounts_repo.get_by_id(chat_db.owner_user_id)
         owner = self.accounts_repo.to_api_model(owner_db, is_online=self.app.notify_man.is_online(owner_db.id))
@@ -110,6 +127,8 @@ class ChatService:
 
         await self.members_repo.add_member(chat_id, account.id)
 
+        self.app.membership.forget((account.id,))
+
         return Result(success=True, errors=[], data=None)
 
     async def remove_member(self, chat_id: int, user_id: int) -> Result[None]:
@@ -124,6 +143,8 @@ class ChatService:
 
         await self.members_repo.remove_member(chat_id, user_id)
 
+        self.app.membership.forget((user_id,))
+
         return Result(success=True, errors=[], data=None)
 
     async def leave_chat(self, chat_id: int, user_id: int) -> Result[None]:
@@ -149,11 +170,20 @@ class ChatService:
         if not chat_db:
             return Result(success=False, errors=[("NOT_FOUND", "Chat not found")])
 
+        member_ids = await self.members_repo.get_member_user_ids(chat_id)
+
         await self.chats_repo.delete(chat_id)
 
+        self.app.membership.forget(member_ids)
+
         return Result(success=True, errors=[], data=None)
 
     async def is_member(self, chat_id: int, user_id: int) -> bool:
         """Check if user is member of chat."""
 
         return await self.members_repo.is_member(chat_id, user_id)
+
+    async def is_member_cached(self, chat_id: int, user_id: int) -> bool:
+        """Check if user is member of chat using the app-wide membership cache."""
+
+        return await self.app.membership.is_member(chat_id, user_id)
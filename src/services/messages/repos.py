@@ -33,6 +33,18 @@ class MessagesRepository(BaseDBRepository):
 
         return MessageDB(**row) if row else None
 
+    async def get_by_id_for_member(self, message_id: int, user_id: int) -> MessageDB | None:
+        """Get message by ID, only if user is a member of its chat."""
+
+        row = await self.fetchrow(
+            f"""SELECT m.* FROM {self._get_table_name()} m
+                JOIN {self.schema_name}.chat_members cm ON cm.chat_id = m.chat_id AND cm.user_id = $2
+                WHERE m.id = $1""",
+            message_id, user_id
+        )
+
+        return MessageDB(**row) if row else None
+
     async def create(self, chat_id: int, sender_id: int, is_read: bool = False, conn=None) -> int:
         """Create new message and return ID."""
 
@@ -95,6 +107,40 @@ class MessagesRepository(BaseDBRepository):
 
         return [MessageDB(**row) for row in rows]
 
+    async def get_by_chat_for_member(
+        self,
+        chat_id: int,
+        user_id: int,
+        limit: int = 50,
+        before_id: int | None = None
+    ) -> list[MessageDB]:
+        """Get messages from chat with cursor pagination, only if user is its member."""
+
+        member_join = (
+            f"JOIN {self.schema_name}.chat_members cm ON cm.chat_id = m.chat_id AND cm.user_id = $2"
+        )
+
+        if before_id:
+            rows = await self.fetch(
+                f"""SELECT m.* FROM {self._get_table_name()} m
+                    {member_join}
+                    WHERE m.chat_id = $1 AND m.id < $3
+                    ORDER BY m.id DESC
+                    LIMIT $4""",
+                chat_id, user_id, before_id, limit
+            )
+        else:
+            rows = await self.fetch(
+                f"""SELECT m.* FROM {self._get_table_name()} m
+                    {member_join}
+                    WHERE m.chat_id = $1
+                    ORDER BY m.id DESC
+                    LIMIT $3""",
+                chat_id, user_id, limit
+            )
+
+        return [MessageDB(**row) for row in rows]
+
 
 class MessageContentsRepository(BaseDBRepository):
     """Repository for message content operations."""
@@ -132,6 +178,23 @@ class MessageContentsRepository(BaseDBRepository):
 
         return [MessageContentDB(**row) for row in rows]
 
+    async def get_by_messages(self, message_ids: list[int]) -> dict[int, list[MessageContentDB]]:
+        """Get contents of several messages in one query, keyed by message ID."""
+
+        if not message_ids:
+            return {}
+
+        rows = await self.fetch(
+            f"SELECT * FROM {self._get_table_name()} WHERE message_id = ANY($1::bigint[]) ORDER BY id",
+            message_ids
+        )
+
+        contents: dict[int, list[MessageContentDB]] = {}
+        for row in rows:
+            contents.setdefault(row["message_id"], []).append(MessageContentDB(**row))
+
+        return contents
+
     async def delete_by_message(self, message_id: int, conn=None) -> bool:
         """Delete all contents for message."""
 
@@ -180,6 +243,23 @@ class MessageTagsRepository(BaseDBRepository):
 
         return [MessageTagDB(**row) for row in rows]
 
+    async def get_by_messages(self, message_ids: list[int]) -> dict[int, list[MessageTagDB]]:
+        """Get tags of several messages in one query, keyed by message ID."""
+
+        if not message_ids:
+            return {}
+
+        rows = await self.fetch(
+            f"SELECT * FROM {self._get_table_name()} WHERE message_id = ANY($1::bigint[]) ORDER BY id",
+            message_ids
+        )
+
+        tags: dict[int, list[MessageTagDB]] = {}
+        for row in rows:
+            tags.setdefault(row["message_id"], []).append(MessageTagDB(**row))
+
+        return tags
+
     async def delete_by_message(self, message_id: int, conn=None) -> bool:
         """Delete all tags for message."""
 
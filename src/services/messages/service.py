@@ -1,5 +1,8 @@
 """Message service for message operations."""
 
+import hashlib
+import json
+
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -12,18 +15,19 @@ from src.services.messages.repos import (
     MessageTagsRepository,
     UsersFilesRepository
 )
-from src.services.users.repos import AccountsRepository
 
+from src.models.db_models import MessageDB
 from src.models.api_models import (
     Message,
     MessageTag,
     MsgContentTextChunk,
     MsgContentFile,
-    Result
+    Result,
+    NOT_MEMBER_RESULT
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageContentInput:
     """Input for message content."""
 
@@ -31,6 +35,19 @@ class MessageContentInput:
     resource_name: str  # "db" or "s3"
     content: str | bytes
 
+    @classmethod
+    def from_dicts(cls, contents: list["dict | MessageContentInput"]) -> list["MessageContentInput"]:
+        """Build inputs from raw transaction dicts, passing already built inputs through."""
+
+        return [
+            c if isinstance(c, cls) else cls(
+                c.get("type", "text"),
+                c.get("resource_name", "db"),
+                c.get("content", "")
+            )
+            for c in contents
+        ]
+
 
 class MessageService:
     """Service for message operations."""
@@ -46,7 +63,8 @@ class MessageService:
 
         self.files_repo = UsersFilesRepository(app)
 
-        self.accounts_repo = AccountsRepository(app)
+        self.accounts_repo = app.accounts_repo
+        self.members_repo = app.chat_members_repo
 
     async def send_message(
         self,
@@ -100,56 +118,9 @@ class MessageService:
         if not message_db:
             return Result(success=False, errors=[("NOT_FOUND", "Message not found")])
 
-        # Get sender
-        sender_db = await self.accounts_repo.get_by_id(message_db.sender_user_id)
-        sender = self.accounts_repo.to_api_model(sender_db, is_online=self.app.notify_man.is_online(sender_db.id))
+        messages = await self._build_messages([message_db])
 
-        # Get contents
-        contents_db = await self.contents_repo.get_by_message(message_id)
-        contents = []
-        for content_db in contents_db:
-            if content_db.type == "text":
-                contents.append(MsgContentTextChunk(text=content_db.content))
-            elif content_db.type == "file":
-                # Download file from S3
-                file_result = await self.files_repo.download(content_db.content)
-                if file_result:
-                    contents.append(MsgContentFile(filename=file_result.original_filename, payload=file_result.data))
-                else:
-                    contents.append(MsgContentFile(filename="unknown", payload=b""))
-
-        # Get tags
-        tags_db = await self.tags_repo.get_by_message(message_id)
-        tags = []
-        for tag_db in tags_db:
-            for_user = None
-            if tag_db.for_user_id:
-                for_user_db = await self.accounts_repo.get_by_id(tag_db.for_user_id)
-                if for_user_db:
-                    for_user = self.accounts_repo.to_api_model(
-                        for_user_db,
-                        is_online=self.app.notify_man.is_online(for_user_db.id)
-                    )
-
-            tags.append(MessageTag(
-                tag_id=tag_db.id,
-                message_id=tag_db.message_id,
-                for_user=for_user,
-                type=tag_db.type,
-                tag=tag_db.tag
-            ))
-
-        message = Message(
-            message_id=message_db.id,
-            chat_id=message_db.chat_id,
-            sender_user=sender,
-            is_read=message_db.is_read,
-            tags=tags,
-            contents=contents,
-            created_at=message_db.created_at.isoformat()
-        )
-
-        return Result(success=True, errors=[], data=message)
+        return Result(success=True, errors=[], data=messages[0])
 
     async def get_messages(
         self,
@@ -160,14 +131,89 @@ class MessageService:
         """Get messages from chat with pagination."""
 
         messages_db = await self.messages_repo.get_by_chat(chat_id, limit, before_id)
+        messages = await self._build_messages(messages_db)
+
+        return Result(success=True, errors=[], data=messages)
+
+    async def get_messages_for_member(
+        self,
+        chat_id: int,
+        user_id: int,
+        limit: int = 50,
+        before_id: int | None = None
+    ) -> Result[list[Message]]:
+        """Get messages from chat with pagination, checking membership in the same query."""
+
+        messages_db = await self.messages_repo.get_by_chat_for_member(chat_id, user_id, limit, before_id)
+
+        # No rows is either an empty page or no membership
+        if not messages_db and not await self.members_repo.is_member(chat_id, user_id):
+            return NOT_MEMBER_RESULT
+
+        messages = await self._build_messages(messages_db)
+
+        return Result(success=True, errors=[], data=messages)
+
+    async def _build_messages(self, messages_db: list[MessageDB]) -> list[Message]:
+        """Build message API models, loading contents, tags and accounts for all messages at once."""
+
+        message_ids = [message_db.id for message_db in messages_db]
+
+        contents_by_message = await self.contents_repo.get_by_messages(message_ids)
+        tags_by_message = await self.tags_repo.get_by_messages(message_ids)
+
+        # Senders and tagged users
+        account_ids = {message_db.sender_user_id for message_db in messages_db}
+        for tags_db in tags_by_message.values():
+            account_ids.update(tag_db.for_user_id for tag_db in tags_db if tag_db.for_user_id)
+
+        accounts_db = await self.accounts_repo.get_by_ids(list(account_ids))
+        accounts = {
+            account_id: self.accounts_repo.to_api_model(
+                account_db,
+                is_online=self.app.notify_man.is_online(account_id)
+            )
+            for account_id, account_db in accounts_db.items()
+        }
 
         messages = []
         for message_db in messages_db:
-            result = await self.get_message_by_id(message_db.id)
-            if result.success:
-                messages.append(result.data)
+            # Get contents
+            contents = []
+            for content_db in contents_by_message.get(message_db.id, []):
+                if content_db.type == "text":
+                    contents.append(MsgContentTextChunk(text=content_db.content))
+                elif content_db.type == "file":
+                    # Download file from S3
+                    file_result = await self.files_repo.download(content_db.content)
+                    if file_result:
+                        contents.append(MsgContentFile(filename=file_result.original_filename, payload=file_result.data))
+                    else:
+                        contents.append(MsgContentFile(filename="unknown", payload=b""))
+
+            # Get tags
+            tags = [
+                MessageTag(
+                    tag_id=tag_db.id,
+                    message_id=tag_db.message_id,
+                    for_user=accounts.get(tag_db.for_user_id) if tag_db.for_user_id else None,
+                    type=tag_db.type,
+                    tag=tag_db.tag
+                )
+                for tag_db in tags_by_message.get(message_db.id, [])
+            ]
+
+            messages.append(Message(
+                message_id=message_db.id,
+                chat_id=message_db.chat_id,
+                sender_user=accounts[message_db.sender_user_id],
+                is_read=message_db.is_read,
+                tags=tags,
+                contents=contents,
+                created_at=message_db.created_at.isoformat()
+            ))
 
-        return Result(success=True, errors=[], data=messages)
+        return messages
 
     async def delete_message(self, message_id: int, user_id: int) -> Result[None]:
         """Delete message (only by author)."""
@@ -254,6 +300,19 @@ class MessageService:
 
         return Result(success=True, errors=[], data=None)
 
+    async def mark_read_for_member(self, message_id: int, user_id: int) -> Result[int]:
+        """Mark message as read if user is a member of its chat. Returns the message's chat ID."""
+
+        message_db = await self.messages_repo.get_by_id_for_member(message_id, user_id)
+        if not message_db:
+            if await self.messages_repo.get_by_id(message_id):
+                return NOT_MEMBER_RESULT
+            return Result(success=False, errors=[("NOT_FOUND", "Message not found")])
+
+        await self.messages_repo.mark_as_read(message_id)
+
+        return Result(success=True, errors=[], data=message_db.chat_id)
+
     async def get_messages_hash(self, chat_id: int, last_count: int = 40) -> Result[str]:
         """
         Get MD5 hash of last N messages for sync check.
@@ -262,18 +321,14 @@ class MessageService:
         Messages are ordered from newest to oldest.
         """
 
-        import hashlib
-        import json
-
         messages_db = await self.messages_repo.get_by_chat(chat_id, limit=last_count)
+        contents_by_message = await self.contents_repo.get_by_messages([m.id for m in messages_db])
 
         # Build data for hashing: list of {message_id, contents}
         hash_data = []
         for message_db in messages_db:
-            contents_db = await self.contents_repo.get_by_message(message_db.id)
-
             # Collect all content strings (text or s3 path)
-            content_strings = [c.content for c in contents_db]
+            content_strings = [c.content for c in contents_by_message.get(message_db.id, [])]
 
             hash_data.append({
                 "message_id": message_db.id,
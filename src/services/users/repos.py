@@ -26,6 +26,19 @@ class AccountsRepository(BaseDBRepository):
 
         return AccountDB(**row) if row else None
 
+    async def get_by_ids(self, account_ids: list[int]) -> dict[int, AccountDB]:
+        """Get several accounts in one query, keyed by ID."""
+
+        if not account_ids:
+            return {}
+
+        rows = await self.fetch(
+            f"SELECT * FROM {self._get_table_name()} WHERE id = ANY($1::bigint[])",
+            account_ids
+        )
+
+        return {row["id"]: AccountDB(**row) for row in rows}
+
     async def get_by_username(self, username: str) -> AccountDB | None:
         """Get account by username."""
 
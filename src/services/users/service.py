@@ -10,7 +10,6 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from src.app import Application
 
-from src.services.users.repos import AccountsRepository, TokensRepository
 from src.models.api_models import Account, AuthToken, Result
 
 
@@ -30,8 +29,8 @@ class UserService:
 
         self.app = app
 
-        self.accounts_repo = AccountsRepository(app)
-        self.tokens_repo = TokensRepository(app)
+        self.accounts_repo = app.accounts_repo
+        self.tokens_repo = app.tokens_repo
 
     async def get_user_by_id(self, user_id: int) -> Result[Account]:
         """Get user by ID."""